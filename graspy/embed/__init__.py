@@ -1,6 +1,10 @@
 from .omni import OmnibusEmbed
 from .ase import AdjacencySpectralEmbed
+from .batch import BatchEmbed
+from .cache import EmbeddingCache
+from .incremental import IncrementalAdjacencySpectralEmbed
 from .lse import LaplacianSpectralEmbed
+from .mase import MultipleASE
 from .mds import ClassicalMDS
 from .svd import select_dimension, selectSVD
 
@@ -8,7 +12,11 @@ __all__ = [
     "ClassicalMDS",
     "OmnibusEmbed",
     "AdjacencySpectralEmbed",
+    "BatchEmbed",
+    "EmbeddingCache",
+    "IncrementalAdjacencySpectralEmbed",
     "LaplacianSpectralEmbed",
+    "MultipleASE",
     "select_dimension",
     "selectSVD",
 ]
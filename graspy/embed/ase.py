@@ -14,6 +14,12 @@
 
 import warnings
 
+import numpy as np
+from scipy.sparse import issparse
+from sklearn.utils import check_array, check_random_state, gen_batches
+from sklearn.utils import get_chunk_n_rows
+from sklearn.utils.validation import check_is_fitted
+
 from .base import BaseEmbed
 from .svd import selectSVD
 from ..utils import import_graph, get_lcc, is_fully_connected
@@ -30,16 +36,20 @@ class AdjacencySpectralEmbed(BaseEmbed):
 
     Parameters
     ----------
-    n_components : int or None, default = None
+    n_components : int, list of int or None, default = None
         Desired dimensionality of output data. If "full", 
         n_components must be <= min(X.shape). Otherwise, n_components must be
         < min(X.shape). If None, then optimal dimensions will be chosen by
-        ``select_dimension`` using ``n_elbows`` argument.
+        ``select_dimension`` using ``n_elbows`` argument. If a list, tuple or
+        range of dimensions, e.g. ``[2, 4, 8]`` or ``range(1, 33)``, the graph
+        is decomposed once at the largest dimension, and ``embeddings_`` holds
+        the nested embedding of every dimension.
     n_elbows : int, optional, default: 2
         If `n_components=None`, then compute the optimal embedding dimension using
         `select_dimension`. Otherwise, ignored.
-    algorithm : {'randomized' (default), 'full', 'truncated'}, optional
-        SVD solver to use:
+    algorithm : str, optional (default = 'randomized')
+        SVD solver to use, one of 'randomized', 'full', 'truncated', 'krylov'
+        or 'adaptive':
 
         - 'randomized'
             Computes randomized svd using 
@@ -48,15 +58,76 @@ class AdjacencySpectralEmbed(BaseEmbed):
             Computes full svd using ``scipy.linalg.svd``
         - 'truncated'
             Computes truncated svd using ``scipy.sparse.linalg.svd``
+        - 'krylov'
+            Computes randomized block Krylov svd, which converges faster than
+            'randomized' when the spectrum decays slowly
+        - 'adaptive'
+            Computes randomized svd with a range finder grown in blocks, until
+            the estimated relative error is at most ``tol``, or until the first
+            elbow of the singular values is stable. The embedding dimension is
+            chosen from the same criteria, with ``n_components`` as its
+            maximum, see ``graspy.embed.selectSVD``
     n_iter : int, optional (default = 5)
-        Number of iterations for randomized SVD solver. Not used by 'full' or 
-        'truncated'. The default is larger than the default in randomized_svd 
-        to handle sparse matrices that may have large slowly decaying spectrum.
+        Number of iterations for randomized SVD solver, the maximum number of
+        iterations for 'krylov', or the number of power iterations of each block
+        of 'adaptive'. Not used by 'full' or 'truncated'. The default is larger
+        than the default in randomized_svd to handle sparse matrices that may
+        have large slowly decaying spectrum.
     check_lcc : bool , optional (defult = True)
         Whether to check if input graph is connected. May result in non-optimal 
         results if the graph is unconnected. If True and input is unconnected,
         a UserWarning is thrown. Not checking for connectedness may result in 
-        faster computation.
+        faster computation. If ``sample_size`` is given, only the sampled
+        subgraph is checked.
+    warm_start : bool, optional (default = False)
+        If True, the singular vectors of the previous call to fit seed the range
+        finder of the randomized SVD solver, so that refitting on a similar graph
+        with the same number of vertices needs fewer power iterations. Only used
+        by 'randomized' and 'krylov'.
+    tol : float, optional (default = 1e-7)
+        Stopping tolerance of 'krylov' on the relative change of the singular
+        values between iterations, or of 'adaptive' on the estimated relative
+        error of the decomposition, which must be in (0, 1). Not used by the
+        other solvers.
+    dtype : {None (default), np.float64, np.float32}, optional
+        Precision of the embedding. Graphs are converted to ``dtype`` and
+        decomposed in that precision by every SVD solver. If None, float32
+        arrays are kept as float32 and other inputs are converted to float64.
+    n_jobs : int or None, optional (default = None)
+        Number of processes computing the matrix products of 'randomized' and
+        'krylov', see ``graspy.embed.selectSVD``. None means 1, and -1 means
+        using all processors.
+    cache : EmbeddingCache or None, optional (default = None)
+        Cache of decompositions. Refitting a graph that was already embedded
+        with the same parameters loads the stored decomposition instead of
+        recomputing it.
+    sample_size : int or None, optional (default = None)
+        If given, the graph is embedded in two phases. The subgraph induced by
+        ``sample_size`` sampled vertices is embedded first, and every vertex
+        is then projected onto it, as in ``transform``, from its edges to the
+        sampled vertices. Only the sampled subgraph is decomposed, and the
+        edges are read in batches of ``batch_size`` vertices, so that memory
+        is bounded by the sampled subgraph plus one batch. The singular values
+        of the graph are then estimated by the squared norms of the latent
+        positions. If None, the whole graph is decomposed.
+    sampling : {'uniform' (default), 'degree'}, optional
+        Sampling of the vertices if ``sample_size`` is given. 'uniform' samples
+        vertices with equal probabilities, and 'degree' with probabilities
+        proportional to their degrees, in and out degrees for a directed graph,
+        which favors the well connected vertices whose latent positions are
+        estimated best.
+    batch_size : int or None, optional (default = None)
+        Number of vertices projected at a time if ``sample_size`` is given. If
+        None, batches of rows take at most
+        ``sklearn.get_config()['working_memory']`` MiB.
+    random_state : int, RandomState instance or None, optional (default=None)
+        Random state of the sampling of the vertices.
+    max_components : int or None, optional (default = None)
+        Rank of the decomposition, whose leading components are kept. If None,
+        the largest of ``n_components``, or ``ceil(log2(n_vertices))`` if
+        ``n_components=None``. Fits with any ``n_components`` at a common
+        ``max_components`` share one decomposition through ``cache``, so that
+        a grid search over ``n_components`` decomposes each graph once.
 
     Attributes
     ----------
@@ -67,6 +138,16 @@ class AdjacencySpectralEmbed(BaseEmbed):
         Estimated right latent positions of the graph. Otherwise, None.
     singular_values_ : array, shape (n_components)
         Singular values associated with the latent position matrices. 
+    n_iter_ : int or None
+        Number of iterations used by the SVD solver, or None for 'full' and
+        'truncated'.
+    embeddings_ : dict or None
+        If ``n_components`` is a list, the embedding of every dimension d in
+        it, ``latent_left_[:, :d]``, or the tuple of ``latent_left_[:, :d]`` and
+        ``latent_right_[:, :d]`` for a directed graph. Otherwise, None.
+    sample_indices_ : array, shape (sample_size,) or None
+        Sorted indices of the sampled vertices if ``sample_size`` is given,
+        otherwise None.
 
     See Also
     --------
@@ -99,6 +180,16 @@ class AdjacencySpectralEmbed(BaseEmbed):
         algorithm="randomized",
         n_iter=5,
         check_lcc=True,
+        warm_start=False,
+        tol=1e-7,
+        dtype=None,
+        n_jobs=None,
+        cache=None,
+        sample_size=None,
+        sampling="uniform",
+        batch_size=None,
+        random_state=None,
+        max_components=None,
     ):
         super().__init__(
             n_components=n_components,
@@ -106,31 +197,204 @@ class AdjacencySpectralEmbed(BaseEmbed):
             algorithm=algorithm,
             n_iter=n_iter,
             check_lcc=check_lcc,
+            warm_start=warm_start,
+            tol=tol,
+            dtype=dtype,
+            n_jobs=n_jobs,
+            cache=cache,
+            max_components=max_components,
         )
 
+        for name, value in [("sample_size", sample_size), ("batch_size", batch_size)]:
+            if value is None:
+                continue
+            if not isinstance(value, int):
+                msg = "{} must be an integer, not {}.".format(name, type(value))
+                raise TypeError(msg)
+            elif value < 1:
+                msg = "{} must be >= 1 or None.".format(name)
+                raise ValueError(msg)
+        self.sample_size = sample_size
+        self.batch_size = batch_size
+
+        if sampling not in ["uniform", "degree"]:
+            msg = "sampling must be either 'uniform' or 'degree'."
+            raise ValueError(msg)
+        self.sampling = sampling
+        self.random_state = random_state
+
     def fit(self, graph, y=None):
         """
         Fit ASE model to input graph
 
         Parameters
         ----------
-        graph : array_like or networkx.Graph
-            Input graph to embed.
+        graph : array_like, scipy.sparse matrix or networkx.Graph
+            Input graph to embed. Sparse graphs are embedded without being
+            densified. ``np.memmap`` graphs are embedded out of core, without
+            being read into memory, if ``sample_size`` is given, or if
+            ``check_lcc=False`` and ``algorithm`` is not 'full'. If
+            ``sample_size`` is given, ``check_lcc`` only checks the sampled
+            subgraph.
 
         Returns
         -------
         self : returns an instance of self.
         """
-        A = import_graph(graph)
+        A, properties = import_graph(graph, dtype=self.dtype, return_properties=True)
+        return self._fit(A, properties)
+
+    def _fit(self, A, properties):
+        """
+        Fits an imported graph, given its ``GraphProperties``.
+        """
+        if self.sample_size is None:
+            if self.check_lcc:
+                if not properties.fully_connected:
+                    msg = (
+                        "Input graph is not fully connected. Results may not"
+                        + "be optimal. You can compute the largest connected "
+                        + "component by using ``graspy.utils.get_lcc``."
+                    )
+                    warnings.warn(msg, UserWarning)
+            self.sample_indices_ = None
+            self._reduce_dim(A, symmetric=properties.almost_symmetric)
+        else:
+            # connectivity is only checked on the sampled subgraph, which is
+            # all that is held in memory
+            self._sketch_and_extend(A, symmetric=properties.almost_symmetric)
+        self._set_embeddings()
+        return self
 
+    def _sketch_and_extend(self, A, symmetric):
+        """
+        Embeds the subgraph induced by sampled vertices, then projects every
+        vertex onto it from its edges to the sampled vertices, in batches.
+        """
+        n_vertices = A.shape[0]
+        if self.sample_size > n_vertices:
+            msg = "sample_size must be <= n_vertices."
+            raise ValueError(msg)
+        if issparse(A):
+            # cheap row slices
+            A = A.tocsr()
+
+        random_state = check_random_state(self.random_state)
+        if self.sampling == "uniform":
+            p = None
+        else:
+            degrees = np.asarray(A.sum(axis=1)).ravel()
+            if not symmetric:
+                degrees = degrees + np.asarray(A.sum(axis=0)).ravel()
+            if np.count_nonzero(degrees) < self.sample_size:
+                msg = "sample_size must be <= the number of vertices with edges."
+                raise ValueError(msg)
+            p = degrees / degrees.sum()
+        sample = np.sort(
+            random_state.choice(n_vertices, self.sample_size, replace=False, p=p)
+        )
+
+        # Phase 1: embed the sampled subgraph
+        if issparse(A):
+            core = A[sample][:, sample]
+        else:
+            core = A[np.ix_(sample, sample)]
         if self.check_lcc:
-            if not is_fully_connected(A):
+            if not is_fully_connected(core):
                 msg = (
-                    "Input graph is not fully connected. Results may not"
-                    + "be optimal. You can compute the largest connected component by"
-                    + "using ``graspy.utils.get_lcc``."
+                    "Sampled subgraph is not fully connected. Results may not"
+                    + "be optimal. You can increase ``sample_size``, or compute "
+                    + "the largest connected component by using "
+                    + "``graspy.utils.get_lcc``."
                 )
                 warnings.warn(msg, UserWarning)
+        self._reduce_dim(core, symmetric=symmetric)
+        self.sample_indices_ = sample
 
-        self._reduce_dim(A)
-        return self
+        # Phase 2: project all vertices, a = A[i, sample], onto the sampled
+        # latent positions, a @ Y / D, with signed eigenvalues if undirected
+        D = self.singular_values_
+        if symmetric:
+            D = D * self._eigenvalue_signs
+        left = self.latent_left_ / D
+        right = left if self.latent_right_ is None else self.latent_right_ / D
+
+        batch_size = self.batch_size
+        if batch_size is None:
+            batch_size = get_chunk_n_rows(
+                row_bytes=n_vertices * A.dtype.itemsize, max_n_rows=n_vertices
+            )
+
+        latent_left = np.empty((n_vertices, D.size), dtype=left.dtype)
+        latent_right = None if symmetric else np.empty_like(latent_left)
+        for batch in gen_batches(n_vertices, batch_size):
+            latent_left[batch] = A[batch][:, sample] @ right
+            if not symmetric:
+                latent_right[batch] = A[sample, batch].T @ left
+
+        self.latent_left_ = latent_left
+        self.latent_right_ = latent_right
+
+        # The singular values of the sampled subgraph are smaller than those of
+        # the graph, which are the squared norms of its latent positions
+        norms = np.einsum("ij,ij->j", latent_left, latent_left)
+        if not symmetric:
+            norms = np.sqrt(norms * np.einsum("ij,ij->j", latent_right, latent_right))
+        self.singular_values_ = norms
+
+    def transform(self, X):
+        r"""
+        Obtain latent positions for vertices that were not in the fitted graph.
+
+        Each new vertex is projected onto the fitted latent positions using its
+        edges to the fitted vertices, that is :math:`\hat{x} = a \hat{Y} S^{-1}`
+        where :math:`a` is the adjacency vector of the new vertex, :math:`S` the
+        singular values and :math:`\hat{Y}` the right (or, for undirected
+        graphs, left) latent positions. For undirected graphs, :math:`S` holds
+        the signed eigenvalues, so that negative eigenvalues are projected
+        with the right sign.
+
+        Parameters
+        ----------
+        X : array-like, sparse matrix or tuple, shape (n_new_vertices, n_vertices)
+            Edges between the new vertices and the fitted vertices, with one row
+            per new vertex. If the fitted graph was directed, a tuple
+            ``(out_edges, in_edges)`` of two such matrices, where
+            ``out_edges[i, j]`` is the edge from new vertex i to fitted vertex j
+            and ``in_edges[i, j]`` is the edge from fitted vertex j to new
+            vertex i.
+
+        Returns
+        -------
+        out : np.ndarray, shape (n_new_vertices, n_components), or tuple (len 2)
+            Latent positions of the new vertices. A tuple of left and right
+            latent positions if the fitted graph was directed.
+        """
+        check_is_fitted(self, ["latent_left_"], all_or_any=all)
+
+        directed = self.latent_right_ is not None
+        if directed != isinstance(X, tuple):
+            if directed:
+                msg = "X must be a tuple (out_edges, in_edges) for a directed graph."
+            else:
+                msg = "X must be a single matrix for an undirected graph."
+            raise ValueError(msg)
+
+        if directed:
+            out_edges, in_edges = [self._check_new_vertices(x) for x in X]
+            latent_left = out_edges @ self.latent_right_ / self.singular_values_
+            latent_right = in_edges @ self.latent_left_ / self.singular_values_
+            return latent_left, latent_right
+        else:
+            X = self._check_new_vertices(X)
+            eigenvalues = self.singular_values_ * self._eigenvalue_signs
+            return X @ self.latent_left_ / eigenvalues
+
+    def _check_new_vertices(self, X):
+        X = check_array(X, accept_sparse=["csr", "csc"], dtype=[np.float64, np.float32])
+        if X.shape[1] != self.latent_left_.shape[0]:
+            msg = "X must have {} columns, one per fitted vertex, not {}.".format(
+                self.latent_left_.shape[0], X.shape[1]
+            )
+            raise ValueError(msg)
+        return X
@@ -22,21 +22,43 @@ from .svd import selectSVD
 from ..utils import import_graph, is_almost_symmetric
 
 
+def _check_n_components(n_components):
+    """
+    Returns the sorted unique dimensions of a list, tuple or range
+    ``n_components``, or None if ``n_components`` is an int or None.
+    """
+    if not isinstance(n_components, (list, tuple, range)):
+        return None
+    if len(n_components) == 0:
+        msg = "n_components must not be empty."
+        raise ValueError(msg)
+    for d in n_components:
+        if not isinstance(d, (int, np.integer)):
+            msg = "n_components must contain integers, not {}.".format(type(d))
+            raise TypeError(msg)
+        elif d < 1:
+            msg = "n_components must contain integers >= 1."
+            raise ValueError(msg)
+    return sorted(set(int(d) for d in n_components))
+
+
 class BaseEmbed(BaseEstimator):
     """
     A base class for embedding a graph.
 
     Parameters
     ----------
-    n_components : int or None, default = None
+    n_components : int, list of int or None, default = None
         Desired dimensionality of output data. If "full", 
         n_components must be <= min(X.shape). Otherwise, n_components must be
         < min(X.shape). If None, then optimal dimensions will be chosen by
-        ``select_dimension`` using ``n_elbows`` argument.
+        ``select_dimension`` using ``n_elbows`` argument. If a list, tuple or
+        range, the graph is decomposed once at the largest dimension, whose
+        leading components are the embeddings of the other dimensions.
     n_elbows : int, optional, default: 2
         If `n_compoents=None`, then compute the optimal embedding dimension using
         `select_dimension`. Otherwise, ignored.
-    algorithm : {'full', 'truncated' (default), 'randomized'}, optional
+    algorithm : {'full', 'truncated' (default), 'randomized', 'krylov'}, optional
         SVD solver to use:
 
         - 'full'
@@ -46,19 +68,52 @@ class BaseEmbed(BaseEstimator):
         - 'randomized'
             Computes randomized svd using 
             ``sklearn.utils.extmath.randomized_svd``
+        - 'krylov'
+            Computes randomized block Krylov svd, which converges faster than
+            'randomized' when the spectrum decays slowly
     n_iter : int, optional (default = 5)
-        Number of iterations for randomized SVD solver. Not used by 'full' or 
-        'truncated'. The default is larger than the default in randomized_svd 
-        to handle sparse matrices that may have large slowly decaying spectrum.
+        Number of iterations for randomized SVD solver, or the maximum number of
+        iterations for 'krylov'. Not used by 'full' or 'truncated'. The default
+        is larger than the default in randomized_svd to handle sparse matrices
+        that may have large slowly decaying spectrum.
     check_lcc : bool , optional (defult =True)
         Whether to check if input graph is connected. May result in non-optimal 
         results if the graph is unconnected. Not checking for connectedness may 
         result in faster computation.
+    warm_start : bool, optional (default = False)
+        If True, the singular vectors of the previous call to fit seed the range
+        finder of the randomized SVD solver, so that refitting on a similar graph
+        with the same number of vertices needs fewer power iterations. Only used
+        by 'randomized' and 'krylov'.
+    tol : float, optional (default = 1e-7)
+        Stopping tolerance of 'krylov' on the relative change of the singular
+        values between iterations. Not used by the other solvers.
+    dtype : {None (default), np.float64, np.float32}, optional
+        Precision of the embedding. Graphs are converted to ``dtype`` and
+        decomposed in that precision by every SVD solver. If None, float32
+        arrays are kept as float32 and other inputs are converted to float64.
+    n_jobs : int or None, optional (default = None)
+        Number of processes computing the matrix products of 'randomized' and
+        'krylov', see ``graspy.embed.selectSVD``. None means 1, and -1 means
+        using all processors.
+    cache : EmbeddingCache or None, optional (default = None)
+        Cache of decompositions. Refitting a graph that was already embedded
+        with the same parameters loads the stored decomposition instead of
+        recomputing it.
+    max_components : int or None, optional (default = None)
+        Rank of the decomposition, whose leading components are kept. If None,
+        the largest of ``n_components``, or ``ceil(log2(n_vertices))`` if
+        ``n_components=None``. Fits with any ``n_components`` at a common
+        ``max_components`` share one decomposition through ``cache``, e.g. in
+        a grid search over ``n_components``.
 
     Attributes
     ----------
     n_components_ : int
         Dimensionality of the embedded space.
+    n_iter_ : int or None
+        Number of iterations used by the SVD solver, or None for 'full' and
+        'truncated'.
 
     See Also
     --------
@@ -72,39 +127,125 @@ class BaseEmbed(BaseEstimator):
         algorithm="randomized",
         n_iter=5,
         check_lcc=True,
+        warm_start=False,
+        tol=1e-7,
+        dtype=None,
+        n_jobs=None,
+        cache=None,
+        max_components=None,
     ):
         self.n_components = n_components
         self.n_elbows = n_elbows
         self.algorithm = algorithm
         self.n_iter = n_iter
         self.check_lcc = check_lcc
+        self.warm_start = warm_start
+        self.tol = tol
+        self.dtype = dtype
+        self.n_jobs = n_jobs
+        self.cache = cache
+        self.max_components = max_components
 
-    def _reduce_dim(self, A):
+    def _reduce_dim(self, A, symmetric=None, n_components=None, init=None, n_iter=None):
         """
         A function that reduces the dimensionality of an adjacency matrix
         using the desired embedding method.
 
         Parameters
         ----------
-        A: array-like, shape (n_vertices, n_vertices)
+        A: array-like, sparse matrix or LinearOperator, shape (n_vertices, n_vertices)
             Adjacency matrix to embed.
+        symmetric: bool or None, optional (default=None)
+            Whether A is known to be symmetric. If None, it is checked with
+            ``is_almost_symmetric``, which requires an array or sparse matrix.
+            Symmetric matrices are decomposed with a symmetric eigensolver.
+        n_components: int or None, optional (default=None)
+            Dimension of the embedding. If None, ``self.n_components`` is used.
+        init: array-like or None, optional (default=None)
+            Starting basis of the SVD solver. If None, the previous fit is used
+            if ``warm_start`` is True.
+        n_iter: int or None, optional (default=None)
+            Number of iterations of the SVD solver. If None, ``self.n_iter`` is
+            used.
         """
-        U, D, V = selectSVD(
+        if symmetric is None:
+            symmetric = is_almost_symmetric(A)
+
+        if n_components is None:
+            n_components = self.n_components
+            dimensions = _check_n_components(n_components)
+            if dimensions is not None:
+                n_components = dimensions[-1]
+        if init is None:
+            init = self._get_warm_start(A)
+        if n_iter is None:
+            n_iter = self.n_iter
+
+        U, D, V, n_iter_ = selectSVD(
             A,
-            n_components=self.n_components,
+            n_components=n_components,
             n_elbows=self.n_elbows,
             algorithm=self.algorithm,
-            n_iter=self.n_iter,
+            n_iter=n_iter,
+            max_components=self.max_components,
+            init=init,
+            symmetric=symmetric,
+            tol=self.tol,
+            return_n_iter=True,
+            n_jobs=self.n_jobs,
+            cache=self.cache,
         )
 
         self.n_components_ = D.size
+        self.n_iter_ = n_iter_
 
         self.singular_values_ = D
         self.latent_left_ = U @ np.diag(np.sqrt(D))
-        if not is_almost_symmetric(A):
+        if not symmetric:
             self.latent_right_ = V.T @ np.diag(np.sqrt(D))
+            self._eigenvalue_signs = None
         else:
             self.latent_right_ = None
+            # the symmetric solvers return V = U * sign(eigenvalues)
+            self._eigenvalue_signs = np.where(np.einsum("ij,ji->j", U, V) < 0, -1, 1)
+
+    def _set_embeddings(self):
+        """
+        Sets ``embeddings_``, the leading components of the latent positions for
+        every dimension of a list ``n_components``, or None.
+        """
+        dimensions = _check_n_components(self.n_components)
+        if dimensions is None:
+            self.embeddings_ = None
+            return
+
+        self.embeddings_ = {}
+        for d in dimensions:
+            if self.latent_right_ is None:
+                self.embeddings_[d] = self.latent_left_[..., :d]
+            else:
+                self.embeddings_[d] = (
+                    self.latent_left_[..., :d],
+                    self.latent_right_[..., :d],
+                )
+
+    def _get_warm_start(self, A):
+        """
+        Returns the right singular vectors of the previous fit, or None if there
+        is no previous fit of the same size or ``warm_start`` is False.
+        """
+        if not self.warm_start or not hasattr(self, "singular_values_"):
+            return None
+
+        if self.latent_right_ is not None:
+            previous = self.latent_right_
+        else:
+            previous = self.latent_left_
+        previous = previous.reshape(-1, self.singular_values_.size)
+
+        if previous.shape[0] != A.shape[1]:
+            return None
+        return previous / np.sqrt(self.singular_values_)
 
     @property
     def _pairwise(self):
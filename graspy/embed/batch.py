@@ -0,0 +1,233 @@
+# Copyright 2019 NeuroData (http://neurodata.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.base import BaseEstimator, clone
+
+from .ase import AdjacencySpectralEmbed
+from .base import BaseEmbed, _check_n_components
+from .mase import MultipleASE
+from .omni import OmnibusEmbed, _check_valid_graphs
+from ..utils import import_graph
+
+
+def _embed_one(estimator, graph, properties):
+    """
+    Fits a single imported graph and returns its latent positions and singular
+    values.
+    """
+    estimator._fit(graph, properties)
+    return (estimator.latent_left_, estimator.latent_right_, estimator.singular_values_)
+
+
+class BatchEmbed(BaseEstimator):
+    """
+    Embeds each graph of a collection independently.
+
+    A clone of ``estimator`` is fitted to every graph, optionally in parallel,
+    and the latent positions are collected into a single array. Unlike
+    ``OmnibusEmbed``, the embeddings are not aligned across graphs.
+
+    Parameters
+    ----------
+    estimator : AdjacencySpectralEmbed, LaplacianSpectralEmbed or None, default = None
+        Unfitted estimator used for every graph. If None,
+        ``AdjacencySpectralEmbed()`` is used.
+    n_components : int or None, default = None
+        If given, every graph is embedded in ``n_components`` dimensions,
+        overriding the ``n_components`` of ``estimator``. Otherwise, the
+        dimension of each graph is that of ``estimator``, which is chosen
+        separately for every graph if it is None.
+    n_jobs : int or None, default = None
+        Number of graphs embedded in parallel. None means 1, and -1 means using
+        all processors.
+    prefer : {'threads' (default), 'processes'}, optional
+        Type of the workers. Threads avoid copying the graphs, and the SVD
+        solvers release the GIL for most of their work. Processes may be faster
+        for many small graphs.
+
+    Attributes
+    ----------
+    n_graphs_ : int
+        Number of graphs
+    n_vertices_ : int
+        Number of vertices in each graph
+    n_components_ : array, shape (n_graphs,)
+        Dimension of the embedding of each graph.
+    latent_left_ : array, shape (n_graphs, n_vertices, max(n_components_))
+        Estimated left latent positions of each graph, padded with zeros past
+        the embedding dimension of the graph.
+    latent_right_ : array, shape (n_graphs, n_vertices, max(n_components_)), or None
+        Estimated right latent positions of each graph, padded with zeros past
+        the embedding dimension of the graph. None if every graph is undirected.
+        Otherwise, the right latent positions of undirected graphs are their
+        left latent positions.
+    singular_values_ : array, shape (n_graphs, max(n_components_))
+        Singular values of each graph, padded with zeros past the embedding
+        dimension of the graph.
+
+    See Also
+    --------
+    graspy.embed.AdjacencySpectralEmbed
+    graspy.embed.LaplacianSpectralEmbed
+    """
+
+    def __init__(
+        self, estimator=None, n_components=None, n_jobs=None, prefer="threads"
+    ):
+        if estimator is not None:
+            if not isinstance(estimator, BaseEmbed) or isinstance(
+                estimator, (OmnibusEmbed, MultipleASE)
+            ):
+                msg = "estimator must be a single graph embedding, not {}.".format(
+                    type(estimator)
+                )
+                raise TypeError(msg)
+        self.estimator = estimator
+
+        if n_components is not None:
+            if not isinstance(n_components, int):
+                msg = "n_components must be an integer, not {}.".format(
+                    type(n_components)
+                )
+                raise TypeError(msg)
+            elif n_components < 1:
+                msg = "n_components must be >= 1 or None."
+                raise ValueError(msg)
+        self.n_components = n_components
+        self.n_jobs = n_jobs
+
+        if prefer not in ["threads", "processes"]:
+            msg = "prefer must be either 'threads' or 'processes'."
+            raise ValueError(msg)
+        self.prefer = prefer
+
+    def fit(self, graphs, y=None):
+        """
+        Fit the model with graphs.
+
+        Parameters
+        ----------
+        graphs : list of nx.Graph or ndarray, or ndarray
+            If list of nx.Graph, each Graph must contain same number of nodes.
+            If list of ndarray, each array must have shape (n_vertices, n_vertices).
+            If ndarray, then array must have shape (n_graphs, n_vertices, n_vertices).
+
+        y : Ignored
+
+        Returns
+        -------
+        self : returns an instance of self.
+        """
+        if self.estimator is None:
+            estimator = AdjacencySpectralEmbed()
+        else:
+            estimator = clone(self.estimator)
+        if self.n_components is not None:
+            estimator.set_params(n_components=self.n_components)
+
+        # Graphs are validated once, and fitted without being imported again
+        imported = [
+            import_graph(g, dtype=estimator.dtype, return_properties=True)
+            for g in graphs
+        ]
+        if len(imported) == 0:
+            msg = "graphs must contain at least one graph."
+            raise ValueError(msg)
+        graphs = [g for g, _ in imported]
+        if len(graphs) > 1:
+            _check_valid_graphs(graphs)
+
+        self.n_graphs_ = len(graphs)
+        self.n_vertices_ = graphs[0].shape[0]
+        directed = not all(p.almost_symmetric for _, p in imported)
+        dtype = np.result_type(*graphs)
+
+        # If the dimension is known, the outputs are preallocated and written by
+        # the threads as the graphs are fitted
+        n_components = estimator.n_components
+        dimensions = _check_n_components(n_components)
+        if dimensions is not None:
+            n_components = dimensions[-1]
+        if (n_components is not None) and (self.prefer == "threads"):
+            self._allocate(n_components, directed, dtype)
+            Parallel(n_jobs=self.n_jobs, prefer=self.prefer)(
+                delayed(self._fit_one)(i, clone(estimator), g, p)
+                for i, (g, p) in enumerate(imported)
+            )
+            return self
+
+        results = Parallel(n_jobs=self.n_jobs, prefer=self.prefer)(
+            delayed(_embed_one)(clone(estimator), g, p) for g, p in imported
+        )
+        self._allocate(max(D.size for _, _, D in results), directed, dtype)
+        for i, (left, right, D) in enumerate(results):
+            self._set_embedding(i, left, right, D)
+
+        return self
+
+    def _allocate(self, n_components, directed, dtype):
+        """
+        Allocates the latent positions and singular values of the graphs.
+        """
+        shape = (self.n_graphs_, self.n_vertices_, n_components)
+        self.n_components_ = np.zeros(self.n_graphs_, dtype=int)
+        self.latent_left_ = np.zeros(shape, dtype=dtype)
+        self.latent_right_ = np.zeros(shape, dtype=dtype) if directed else None
+        self.singular_values_ = np.zeros(shape[::2], dtype=dtype)
+
+    def _fit_one(self, index, estimator, graph, properties):
+        """
+        Fits a single graph and writes its embedding to the outputs.
+        """
+        self._set_embedding(index, *_embed_one(estimator, graph, properties))
+
+    def _set_embedding(self, index, left, right, D):
+        """
+        Writes the embedding of a graph to the outputs, padded with zeros.
+        """
+        d = D.size
+        self.n_components_[index] = d
+        self.latent_left_[index, :, :d] = left
+        self.singular_values_[index, :d] = D
+        if self.latent_right_ is not None:
+            self.latent_right_[index, :, :d] = left if right is None else right
+
+    def fit_transform(self, graphs, y=None):
+        """
+        Fit the model with graphs and apply the embedding on graphs.
+
+        Parameters
+        ----------
+        graphs : list of nx.Graph or ndarray, or ndarray
+            If list of nx.Graph, each Graph must contain same number of nodes.
+            If list of ndarray, each array must have shape (n_vertices, n_vertices).
+            If ndarray, then array must have shape (n_graphs, n_vertices, n_vertices).
+
+        y : Ignored
+
+        Returns
+        -------
+        out : array-like, shape (n_graphs, n_vertices, n_components) if input
+            graphs were symmetric. If graphs were directed, returns tuple of
+            two arrays (same shape as above) where the first corresponds to the
+            left latent positions, and the right to the right latent positions
+        """
+        self.fit(graphs)
+
+        if self.latent_right_ is None:
+            return self.latent_left_
+        else:
+            return self.latent_left_, self.latent_right_
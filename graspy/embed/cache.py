@@ -0,0 +1,264 @@
+# Copyright 2019 NeuroData (http://neurodata.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+from scipy.sparse import issparse
+from sklearn.utils import gen_batches
+
+try:
+    from hashlib import blake2b
+
+    def _new_hash():
+        return blake2b(digest_size=16)
+
+
+except ImportError:  # Python < 3.6
+    from hashlib import md5 as _new_hash
+
+
+def _hash_array(X, block_size=2 ** 24):
+    """
+    Hashes the contents, shape and dtype of an array or sparse matrix.
+
+    Arrays are hashed ``block_size`` bytes at a time, so that a ``np.memmap``
+    is read sequentially without being loaded into memory.
+    """
+    h = _new_hash()
+    h.update(repr((issparse(X), X.shape, X.dtype.str)).encode())
+
+    if issparse(X):
+        X = X.tocsr()
+        X.sum_duplicates()
+        arrays = [X.indptr, X.indices, X.data]
+    else:
+        arrays = [X]
+
+    for arr in arrays:
+        if arr.ndim == 0:
+            h.update(arr.tobytes())
+            continue
+        n_rows = max(block_size // max(arr[:1].nbytes, 1), 1)
+        for batch in gen_batches(arr.shape[0], n_rows):
+            h.update(np.ascontiguousarray(arr[batch]).data)
+
+    return h.hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Cache of decompositions, keyed by the contents of the decomposed matrix.
+
+    Pass an instance as the ``cache`` argument of ``selectSVD`` or of an
+    embedding estimator, so that decomposing the same matrix again with the same
+    parameters loads the stored singular values and vectors instead of
+    recomputing them. Keys are a blake2b hash of the matrix buffer, shape and
+    dtype, together with the decomposition parameters.
+
+    Entries are kept in memory, or as npz files in ``path``. When the cache
+    grows past ``max_entries`` or ``max_bytes``, the least recently used
+    entries are evicted. A cache is shared, not copied, by cloned estimators.
+
+    Parameters
+    ----------
+    max_entries : int or None, default = 128
+        Maximum number of stored decompositions. If None, unlimited.
+    max_bytes : int or None, default = None
+        Maximum total size in bytes of the stored arrays, or of the npz files
+        if ``path`` is given. If None, unlimited.
+    path : str or None, default = None
+        Directory of an on-disk cache, created if needed. If None, entries are
+        kept in memory.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups that found an entry.
+    misses : int
+        Number of lookups that did not find an entry.
+
+    See Also
+    --------
+    graspy.embed.selectSVD
+    """
+
+    def __init__(self, max_entries=128, max_bytes=None, path=None):
+        for name, value in [("max_entries", max_entries), ("max_bytes", max_bytes)]:
+            if value is None:
+                continue
+            if not isinstance(value, int):
+                msg = "{} must be an integer or None, not {}.".format(name, type(value))
+                raise TypeError(msg)
+            elif value < 1:
+                msg = "{} must be >= 1 or None.".format(name)
+                raise ValueError(msg)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.path = path
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_use = 0
+
+    def __deepcopy__(self, memo):
+        # sklearn.base.clone deep copies parameters, but clones must share the
+        # cache
+        return self
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        if self.path is None:
+            return len(self._entries)
+        return len(self._files())
+
+    @property
+    def nbytes(self):
+        """Total size in bytes of the stored entries."""
+        if self.path is None:
+            return sum(self._entries_nbytes(e) for e in self._entries.values())
+        return sum(size for _, _, size in self._files())
+
+    def make_key(self, X, **params):
+        """
+        Returns the key of matrix X decomposed with keyword parameters params.
+        Parameters may be arrays, which are hashed by content.
+        """
+        h = _new_hash()
+        h.update(_hash_array(X).encode())
+        for name in sorted(params):
+            value = params[name]
+            if isinstance(value, np.ndarray):
+                value = _hash_array(value)
+            h.update(repr((name, value)).encode())
+        return h.hexdigest()
+
+    def get(self, key):
+        """
+        Returns the dict of arrays stored at key, or None. Counts as a hit or a
+        miss.
+        """
+        with self._lock:
+            if self.path is None:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    # callers may modify the returned arrays
+                    entry = {name: arr.copy() for name, arr in entry.items()}
+            else:
+                entry = self._load(key)
+
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return entry
+
+    def put(self, key, **arrays):
+        """
+        Stores the keyword arrays at key, and evicts the least recently used
+        entries if the cache is too large.
+        """
+        arrays = {name: np.array(arr) for name, arr in arrays.items()}
+        with self._lock:
+            if self.path is None:
+                self._entries[key] = arrays
+                self._entries.move_to_end(key)
+            else:
+                tmp = os.path.join(self.path, "{}.tmp.npz".format(key))
+                np.savez(tmp, **arrays)
+                os.replace(tmp, self._filename(key))
+                self._touch(self._filename(key))
+            self._evict()
+
+    def clear(self):
+        """Removes all entries and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            if self.path is not None:
+                for filename, _, _ in self._files():
+                    os.remove(filename)
+            self.hits = 0
+            self.misses = 0
+
+    @staticmethod
+    def _entries_nbytes(entry):
+        return sum(arr.nbytes for arr in entry.values())
+
+    def _filename(self, key):
+        return os.path.join(self.path, "{}.npz".format(key))
+
+    def _files(self):
+        """Returns (filename, last use, size) of the npz files, oldest first."""
+        files = []
+        for name in os.listdir(self.path):
+            if name.endswith(".npz") and not name.endswith(".tmp.npz"):
+                filename = os.path.join(self.path, name)
+                stat = os.stat(filename)
+                files.append((filename, stat.st_mtime_ns, stat.st_size))
+        return sorted(files, key=lambda f: f[1])
+
+    def _touch(self, filename):
+        """
+        Marks a file as the most recently used. The modification time is set
+        explicitly, since files written in quick succession may otherwise get
+        the same time.
+        """
+        self._last_use = max(int(time.time() * 1e9), self._last_use + 1)
+        os.utime(filename, ns=(self._last_use, self._last_use))
+
+    def _load(self, key):
+        filename = self._filename(key)
+        if not os.path.exists(filename):
+            return None
+        with np.load(filename) as f:
+            entry = {name: f[name] for name in f.files}
+        self._touch(filename)
+        return entry
+
+    def _evict(self):
+        if self.path is None:
+            nbytes = sum(self._entries_nbytes(e) for e in self._entries.values())
+            while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_bytes is not None and nbytes > self.max_bytes)
+            ):
+                _, entry = self._entries.popitem(last=False)
+                nbytes -= self._entries_nbytes(entry)
+        else:
+            files = self._files()
+            nbytes = sum(size for _, _, size in files)
+            while files and (
+                (self.max_entries is not None and len(files) > self.max_entries)
+                or (self.max_bytes is not None and nbytes > self.max_bytes)
+            ):
+                filename, _, size = files.pop(0)
+                os.remove(filename)
+                nbytes -= size
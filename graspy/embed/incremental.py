@@ -0,0 +1,305 @@
+# Copyright 2019 NeuroData (http://neurodata.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import scipy
+from scipy.sparse import csr_matrix, issparse
+from scipy.sparse.linalg import svds
+from sklearn.utils.extmath import svd_flip
+from sklearn.utils.validation import check_is_fitted
+
+from ..utils import GraphProperties, import_graph, is_almost_symmetric
+from .ase import AdjacencySpectralEmbed
+
+
+def _complement_basis(Y, Q):
+    """
+    Returns an orthonormal basis of the span of Y in the orthogonal complement
+    of the orthonormal basis Q, without the directions already in Q.
+    """
+    norm = np.linalg.norm(Y)
+    # orthogonalized twice for stability
+    for _ in range(2):
+        Y = Y - Q @ (Q.T @ Y)
+    Y, R, _ = scipy.linalg.qr(Y, mode="economic", pivoting=True)
+    rank = np.sum(np.abs(np.diag(R)) > max(Y.shape) * np.finfo(R.dtype).eps * norm)
+    return Y[:, :rank]
+
+
+class IncrementalAdjacencySpectralEmbed(AdjacencySpectralEmbed):
+    r"""
+    Adjacency spectral embedding that is updated as edges change.
+
+    After ``fit``, ``update`` adds a (typically sparse) matrix of edge weight
+    changes :math:`\Delta` to the graph, and updates the embedding without a new
+    decomposition. The rank-``n_components`` approximation
+    :math:`U \Sigma V^T` is replaced by the best rank-``n_components``
+    approximation of :math:`U \Sigma V^T + \Delta` within the span of
+    :math:`[U, \Delta V]` and :math:`[V, \Delta^T U]`, found by a Rayleigh-Ritz
+    step on a matrix of at most twice ``n_components`` rows [1]_. An update
+    costs :math:`O(nnz(\Delta) k + n k^2)` instead of a full decomposition.
+
+    The part of the graph outside of the embedding is ignored by updates, so
+    errors accumulate. Since the angle between the tracked and the true
+    singular subspaces grows with :math:`\|\Delta\|_2 / \sigma_k`, the sum of
+    this ratio over updates is tracked as ``drift_``. Once it exceeds
+    ``refit_threshold``, the updated graph is decomposed from scratch and the
+    drift is reset.
+
+    Parameters
+    ----------
+    n_components : int or None, default = None
+        Desired dimensionality of output data. If "full",
+        n_components must be <= min(X.shape). Otherwise, n_components must be
+        < min(X.shape). If None, then optimal dimensions will be chosen by
+        ``select_dimension`` using ``n_elbows`` argument, at every refit.
+        Updates keep the dimension of the last refit.
+    n_elbows : int, optional, default: 2
+        If `n_components=None`, then compute the optimal embedding dimension using
+        `select_dimension`. Otherwise, ignored.
+    algorithm : {'randomized' (default), 'full', 'truncated', 'krylov'}, optional
+        SVD solver used by ``fit`` and refits, see ``AdjacencySpectralEmbed``.
+    n_iter : int, optional (default = 5)
+        Number of iterations for randomized SVD solver, or the maximum number of
+        iterations for 'krylov'. Not used by 'full' or 'truncated'.
+    check_lcc : bool , optional (defult = True)
+        Whether to check if input graph is connected when fitted. May result in
+        non-optimal results if the graph is unconnected. If True and input is
+        unconnected, a UserWarning is thrown.
+    warm_start : bool, optional (default = False)
+        If True, the singular vectors of the previous fit or update seed the
+        range finder of the randomized SVD solver of refits. Only used by
+        'randomized' and 'krylov'.
+    tol : float, optional (default = 1e-7)
+        Stopping tolerance of 'krylov' on the relative change of the singular
+        values between iterations. Not used by the other solvers.
+    dtype : {None (default), np.float64, np.float32}, optional
+        Precision of the embedding. Graphs and updates are converted to
+        ``dtype``. If None, float32 arrays are kept as float32 and other inputs
+        are converted to float64.
+    n_jobs : int or None, optional (default = None)
+        Number of processes computing the matrix products of 'randomized' and
+        'krylov', see ``graspy.embed.selectSVD``. None means 1, and -1 means
+        using all processors.
+    cache : EmbeddingCache or None, optional (default = None)
+        Cache of the decompositions of ``fit`` and refits.
+    refit_threshold : float, optional (default = 0.25)
+        Value of ``drift_`` past which ``update`` decomposes the graph from
+        scratch. If 0, every update is a refit.
+
+    Attributes
+    ----------
+    graph_ : array-like or scipy.sparse matrix, shape (n_vertices, n_vertices)
+        The fitted graph, with all updates applied.
+    latent_left_ : array, shape (n_vertices, n_components)
+        Estimated left latent positions of the graph.
+    latent_right_ : array, shape (n_vertices, n_components), or None
+        Only computed when the graph is directed, or adjacency matrix is assymetric.
+        Estimated right latent positions of the graph. Otherwise, None.
+    singular_values_ : array, shape (n_components)
+        Singular values associated with the latent position matrices.
+    n_iter_ : int or None
+        Number of iterations used by the SVD solver of the last refit, or None
+        for 'full' and 'truncated'.
+    drift_ : float
+        Sum of :math:`\|\Delta\|_2 / \sigma_k` over the updates since the last
+        refit, where :math:`\sigma_k` is the smallest singular value before each
+        update.
+    n_updates_ : int
+        Number of updates since ``fit``, including those that were refits.
+    n_refits_ : int
+        Number of updates that were refits.
+
+    See Also
+    --------
+    graspy.embed.AdjacencySpectralEmbed
+
+    References
+    ----------
+    .. [1] Brand, M. (2006). Fast low-rank modifications of the thin singular
+       value decomposition. Linear Algebra and its Applications, 415(1),
+       pp. 20-30.
+    .. [2] Zhang, Z., Cui, P., Pei, J., Wang, X., and Zhu, W. (2018). TIMERS:
+       Error-bounded SVD restart on dynamic networks. In Thirty-Second AAAI
+       Conference on Artificial Intelligence.
+    """
+
+    def __init__(
+        self,
+        n_components=None,
+        n_elbows=2,
+        algorithm="randomized",
+        n_iter=5,
+        check_lcc=True,
+        warm_start=False,
+        tol=1e-7,
+        dtype=None,
+        n_jobs=None,
+        cache=None,
+        refit_threshold=0.25,
+    ):
+        super().__init__(
+            n_components=n_components,
+            n_elbows=n_elbows,
+            algorithm=algorithm,
+            n_iter=n_iter,
+            check_lcc=check_lcc,
+            warm_start=warm_start,
+            tol=tol,
+            dtype=dtype,
+            n_jobs=n_jobs,
+            cache=cache,
+        )
+        if not isinstance(refit_threshold, (int, float)):
+            msg = "refit_threshold must be a float, not {}.".format(
+                type(refit_threshold)
+            )
+            raise TypeError(msg)
+        elif refit_threshold < 0:
+            msg = "refit_threshold must be >= 0."
+            raise ValueError(msg)
+        self.refit_threshold = refit_threshold
+
+    def fit(self, graph, y=None):
+        """
+        Fit ASE model to input graph, and keep the graph for updates.
+
+        Parameters
+        ----------
+        graph : array_like, scipy.sparse matrix or networkx.Graph
+            Input graph to embed. Sparse graphs are kept sparse, so that
+            applying an update costs :math:`O(nnz)`.
+
+        Returns
+        -------
+        self : returns an instance of self.
+        """
+        A, properties = import_graph(graph, dtype=self.dtype, return_properties=True)
+        if isinstance(A, np.memmap):
+            # the graph is modified by updates
+            A = np.array(A)
+
+        self._fit(A, properties)
+        self.graph_ = A
+        self.n_updates_ = 0
+        self.n_refits_ = 0
+        self._set_basis()
+
+        return self
+
+    def _set_basis(self):
+        """
+        Recovers the singular vectors of the embedding.
+        """
+        D = self.singular_values_
+        U = self.latent_left_ / np.sqrt(D)
+        if self.latent_right_ is not None:
+            V = self.latent_right_ / np.sqrt(D)
+        else:
+            V = U * self._eigenvalue_signs
+
+        self._U = U
+        self._V = V
+        self.drift_ = 0.0
+
+    def update(self, delta):
+        """
+        Add edge weight changes to the graph, and update the embedding.
+
+        Parameters
+        ----------
+        delta : array_like or scipy.sparse matrix, shape (n_vertices, n_vertices)
+            Changes of the edge weights, added to the graph. Inserting an edge
+            is a positive entry, and deleting an edge a negative one. Must be
+            symmetric if the fitted graph is undirected.
+
+        Returns
+        -------
+        self : returns an instance of self.
+        """
+        check_is_fitted(self, ["graph_"], all_or_any=all)
+
+        if not issparse(delta):
+            delta = csr_matrix(delta)
+        delta = delta.tocsr().astype(self.graph_.dtype)
+        delta.eliminate_zeros()
+        if delta.shape != self.graph_.shape:
+            msg = "delta must have shape {}, not {}.".format(
+                self.graph_.shape, delta.shape
+            )
+            raise ValueError(msg)
+
+        symmetric = self.latent_right_ is None
+        if symmetric and not is_almost_symmetric(delta):
+            msg = "delta must be symmetric for an undirected graph."
+            raise ValueError(msg)
+
+        if issparse(self.graph_):
+            self.graph_ = (self.graph_ + delta).asformat(self.graph_.format)
+        else:
+            coo = delta.tocoo()
+            np.add.at(self.graph_, (coo.row, coo.col), coo.data)
+
+        self.n_updates_ += 1
+        if delta.nnz == 0:
+            return self
+
+        norm = svds(delta, k=1, return_singular_vectors=False)[0]
+        self.drift_ += norm / self.singular_values_[-1]
+        if self.drift_ > self.refit_threshold:
+            # updates of an undirected graph are symmetric
+            properties = GraphProperties(self.graph_, almost_symmetric=symmetric)
+            self._fit(self.graph_, properties)
+            self.n_refits_ += 1
+            self._set_basis()
+            return self
+
+        U, D, V = self._U, self.singular_values_, self._V
+        k = D.size
+
+        # Bases of the updated singular subspaces
+        delta_V = delta @ V
+        left = np.hstack([U, _complement_basis(delta_V, U)])
+        if symmetric:
+            right = left
+        else:
+            right = np.hstack([V, _complement_basis(delta.T @ U, V)])
+
+        # Rayleigh-Ritz, U D V^T + delta projected on the bases
+        T = left.T @ (delta @ right)
+        T[:k, :k] += np.diag(D) @ (V.T @ right[:, :k])
+        if symmetric:
+            w, Uhat = scipy.linalg.eigh((T + T.T) / 2)
+            idx = np.argsort(np.abs(w))[::-1][:k]
+            w, Uhat = w[idx], Uhat[:, idx]
+            D = np.abs(w)
+            U = left @ Uhat
+            self._eigenvalue_signs = np.where(w < 0, -1, 1)
+            Vt = U.T * self._eigenvalue_signs[:, None]
+        else:
+            Uhat, D, Vhat = scipy.linalg.svd(T)
+            D = D[:k]
+            U = left @ Uhat[:, :k]
+            Vt = Vhat[:k] @ right.T
+        U, Vt = svd_flip(U, Vt)
+
+        self._U = U
+        self._V = Vt.T
+        self.singular_values_ = D
+        self.latent_left_ = U * np.sqrt(D)
+        if not symmetric:
+            self.latent_right_ = Vt.T * np.sqrt(D)
+        self._set_embeddings()
+
+        return self
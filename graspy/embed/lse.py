@@ -16,7 +16,7 @@ import warnings
 
 from .base import BaseEmbed
 from .svd import selectSVD
-from ..utils import import_graph, to_laplace, get_lcc, is_fully_connected
+from ..utils import import_graph, to_laplace, get_lcc
 
 
 class LaplacianSpectralEmbed(BaseEmbed):
@@ -32,18 +32,22 @@ class LaplacianSpectralEmbed(BaseEmbed):
     form : {'DAD' (default), 'I-DAD', 'R-DAD'}, optional
         Specifies the type of Laplacian normalization to use.
 
-    n_components : int or None, default = None
+    n_components : int, list of int or None, default = None
         Desired dimensionality of output data. If "full", 
         n_components must be <= min(X.shape). Otherwise, n_components must be
         < min(X.shape). If None, then optimal dimensions will be chosen by
-        ``select_dimension`` using ``n_elbows`` argument.
+        ``select_dimension`` using ``n_elbows`` argument. If a list, tuple or
+        range of dimensions, e.g. ``[2, 4, 8]`` or ``range(1, 33)``, the graph
+        is decomposed once at the largest dimension, and ``embeddings_`` holds
+        the nested embedding of every dimension.
     
     n_elbows : int, optional, default: 2
         If `n_components=None`, then compute the optimal embedding dimension using
         `select_dimension`. Otherwise, ignored.
 
-    algorithm : {'randomized' (default), 'full', 'truncated'}, optional
-        SVD solver to use:
+    algorithm : str, optional (default = 'randomized')
+        SVD solver to use, one of 'randomized', 'full', 'truncated', 'krylov'
+        or 'adaptive':
 
         - 'randomized'
             Computes randomized svd using 
@@ -52,10 +56,21 @@ class LaplacianSpectralEmbed(BaseEmbed):
             Computes full svd using ``scipy.linalg.svd``
         - 'truncated'
             Computes truncated svd using ``scipy.sparse.linalg.svd``
+        - 'krylov'
+            Computes randomized block Krylov svd, which converges faster than
+            'randomized' when the spectrum decays slowly
+        - 'adaptive'
+            Computes randomized svd with a range finder grown in blocks, until
+            the estimated relative error is at most ``tol``, or until the first
+            elbow of the singular values is stable. The embedding dimension is
+            chosen from the same criteria, with ``n_components`` as its
+            maximum, see ``graspy.embed.selectSVD``
     n_iter : int, optional (default = 5)
-        Number of iterations for randomized SVD solver. Not used by 'full' or 
-        'truncated'. The default is larger than the default in randomized_svd 
-        to handle sparse matrices that may have large slowly decaying spectrum.
+        Number of iterations for randomized SVD solver, the maximum number of
+        iterations for 'krylov', or the number of power iterations of each block
+        of 'adaptive'. Not used by 'full' or 'truncated'. The default is larger
+        than the default in randomized_svd to handle sparse matrices that may
+        have large slowly decaying spectrum.
 
     check_lcc : bool , optional (defult = True)
         Whether to check if input graph is connected. May result in non-optimal 
@@ -64,10 +79,41 @@ class LaplacianSpectralEmbed(BaseEmbed):
         faster computation.
 
     regularizer: int, float or None, optional (default=None)
-        Constant to be added to the diagonal of degree matrix. If None, average 
-        node degree is added. If int or float, must be >= 0. Only used when 
+        Constant to be added to the diagonal of degree matrix. If None, average
+        node degree is added. If int or float, must be >= 0. Only used when
         ``form`` == 'R-DAD'.
 
+    warm_start : bool, optional (default = False)
+        If True, the singular vectors of the previous call to fit seed the range
+        finder of the randomized SVD solver, so that refitting on a similar graph
+        with the same number of vertices needs fewer power iterations. Only used
+        by 'randomized' and 'krylov'.
+
+    tol : float, optional (default = 1e-7)
+        Stopping tolerance of 'krylov' on the relative change of the singular
+        values between iterations, or of 'adaptive' on the estimated relative
+        error of the decomposition, which must be in (0, 1). Not used by the
+        other solvers.
+
+    dtype : {None (default), np.float64, np.float32}, optional
+        Precision of the embedding. Graphs are converted to ``dtype`` and
+        decomposed in that precision by every SVD solver. If None, float32
+        arrays are kept as float32 and other inputs are converted to float64.
+    n_jobs : int or None, optional (default = None)
+        Number of processes computing the matrix products of 'randomized' and
+        'krylov', see ``graspy.embed.selectSVD``. None means 1, and -1 means
+        using all processors.
+    cache : EmbeddingCache or None, optional (default = None)
+        Cache of decompositions. Refitting a graph that was already embedded
+        with the same parameters loads the stored decomposition instead of
+        recomputing it.
+    max_components : int or None, optional (default = None)
+        Rank of the decomposition, whose leading components are kept. If None,
+        the largest of ``n_components``, or ``ceil(log2(n_vertices))`` if
+        ``n_components=None``. Fits with any ``n_components`` at a common
+        ``max_components`` share one decomposition through ``cache``, so that
+        a grid search over ``n_components`` decomposes each graph once.
+
     Attributes
     ----------
     latent_left_ : array, shape (n_samples, n_components)
@@ -77,6 +123,13 @@ class LaplacianSpectralEmbed(BaseEmbed):
         Estimated right latent positions of the graph. Otherwise, None.
     singular_values_ : array, shape (n_components)
         Singular values associated with the latent position matrices.
+    n_iter_ : int or None
+        Number of iterations used by the SVD solver, or None for 'full' and
+        'truncated'.
+    embeddings_ : dict or None
+        If ``n_components`` is a list, the embedding of every dimension d in
+        it, ``latent_left_[:, :d]``, or the tuple of ``latent_left_[:, :d]`` and
+        ``latent_right_[:, :d]`` for a directed graph. Otherwise, None.
 
     See Also
     --------
@@ -112,6 +165,12 @@ class LaplacianSpectralEmbed(BaseEmbed):
         n_iter=5,
         check_lcc=True,
         regularizer=None,
+        warm_start=False,
+        tol=1e-7,
+        dtype=None,
+        n_jobs=None,
+        cache=None,
+        max_components=None,
     ):
         super().__init__(
             n_components=n_components,
@@ -119,6 +178,12 @@ class LaplacianSpectralEmbed(BaseEmbed):
             algorithm=algorithm,
             n_iter=n_iter,
             check_lcc=check_lcc,
+            warm_start=warm_start,
+            tol=tol,
+            dtype=dtype,
+            n_jobs=n_jobs,
+            cache=cache,
+            max_components=max_components,
         )
         self.form = form
         self.regularizer = regularizer
@@ -133,8 +198,9 @@ class LaplacianSpectralEmbed(BaseEmbed):
 
         Parameters
         ----------
-        graph : array_like or networkx.Graph
-            Input graph to embed. see graphstats.utils.import_graph
+        graph : array_like, scipy.sparse matrix or networkx.Graph
+            Input graph to embed. Sparse graphs are embedded without being
+            densified. see graphstats.utils.import_graph
 
         y : Ignored
 
@@ -142,10 +208,15 @@ class LaplacianSpectralEmbed(BaseEmbed):
         -------
         self : returns an instance of self.
         """
-        A = import_graph(graph)
+        A, properties = import_graph(graph, dtype=self.dtype, return_properties=True)
+        return self._fit(A, properties)
 
+    def _fit(self, A, properties):
+        """
+        Fits an imported graph, given its ``GraphProperties``.
+        """
         if self.check_lcc:
-            if not is_fully_connected(A):
+            if not properties.fully_connected:
                 msg = (
                     "Input graph is not fully connected. Results may not"
                     + "be optimal. You can compute the largest connected component by"
@@ -153,6 +224,13 @@ class LaplacianSpectralEmbed(BaseEmbed):
                 )
                 warnings.warn(msg, UserWarning)
 
-        L_norm = to_laplace(A, form=self.form, regularizer=self.regularizer)
-        self._reduce_dim(L_norm)
+        L_norm = to_laplace(
+            A,
+            form=self.form,
+            regularizer=self.regularizer,
+            dtype=self.dtype,
+            properties=properties,
+        )
+        self._reduce_dim(L_norm, symmetric=True)
+        self._set_embeddings()
         return self
@@ -0,0 +1,268 @@
+# Copyright 2019 NeuroData (http://neurodata.io)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import warnings
+
+import numpy as np
+from joblib import Parallel, delayed
+
+from ..utils import import_graph, is_fully_connected
+from .base import BaseEmbed
+from .omni import _check_valid_graphs
+from .svd import selectSVD
+
+
+def _score(graph, U, V):
+    """
+    Returns the score matrix ``U.T @ graph @ V`` of a graph.
+    """
+    return U.T @ (graph @ V)
+
+
+class MultipleASE(BaseEmbed):
+    r"""
+    Multiple Adjacency Spectral Embedding (MASE) of an arbitrary number of input
+    graphs with matched vertex sets.
+
+    Each graph :math:`A_i` is embedded separately by adjacency spectral
+    embedding into :math:`\hat{U}_i`. The :math:`\hat{U}_i` are concatenated
+    into an :math:`(n \times \sum_i d_i)` matrix, whose leading left singular
+    vectors :math:`\hat{V}` are a basis of the subspace shared by all graphs
+    [1]_. Each graph is then summarized by a score matrix
+    :math:`\hat{R}_i = \hat{V}^T A_i \hat{V}`. Unlike ``OmnibusEmbed``, whose
+    cost grows with the square of the number of graphs, the cost of MASE grows
+    linearly with it.
+
+    Parameters
+    ----------
+    n_components : int or None, default = None
+        Desired dimensionality of output data, in both the separate embeddings
+        and the shared subspace. If None, then optimal dimensions will be chosen
+        by ``select_dimension`` using ``n_elbows`` argument, separately for each
+        graph and for the shared subspace.
+    n_elbows : int, optional, default: 2
+        If `n_components=None`, then compute the optimal embedding dimension using
+        `select_dimension`. Otherwise, ignored.
+    algorithm : {'randomized' (default), 'full', 'truncated', 'krylov'}, optional
+        SVD solver to use:
+
+        - 'randomized'
+            Computes randomized svd using
+            ``sklearn.utils.extmath.randomized_svd``
+        - 'full'
+            Computes full svd using ``scipy.linalg.svd``
+        - 'truncated'
+            Computes truncated svd using ``scipy.sparse.linalg.svd``
+        - 'krylov'
+            Computes randomized block Krylov svd, which converges faster than
+            'randomized' when the spectrum decays slowly
+    n_iter : int, optional (default = 5)
+        Number of iterations for randomized SVD solver, or the maximum number of
+        iterations for 'krylov'. Not used by 'full' or 'truncated'.
+    scaled : bool, optional (default = True)
+        Whether the separate embeddings are scaled by the square root of their
+        singular values before being concatenated.
+    check_lcc : bool , optional (defult = True)
+        Whether to check if the average of all input graphs are connected. May result
+        in non-optimal results if the average graph is unconnected. If True and average
+        graph is unconnected, a UserWarning is thrown.
+    tol : float, optional (default = 1e-7)
+        Stopping tolerance of 'krylov' on the relative change of the singular
+        values between iterations. Not used by the other solvers.
+    dtype : {None (default), np.float64, np.float32}, optional
+        Precision of the embedding. Graphs are converted to ``dtype`` and
+        decomposed in that precision by every SVD solver. If None, float32
+        arrays are kept as float32 and other inputs are converted to float64.
+    n_jobs : int or None, optional (default = None)
+        Number of graphs embedded, and scored, in parallel threads. None means
+        1, and -1 means using all processors.
+    cache : EmbeddingCache or None, optional (default = None)
+        Cache of the separate decompositions of the graphs. Refitting graphs
+        that were already embedded with the same parameters loads the stored
+        decompositions instead of recomputing them.
+
+    Attributes
+    ----------
+    n_graphs_ : int
+        Number of graphs
+    n_vertices_ : int
+        Number of vertices in each graph
+    n_components_ : int
+        Dimensionality of the shared subspace.
+    latent_left_ : array, shape (n_vertices, n_components)
+        Estimated left basis of the shared subspace.
+    latent_right_ : array, shape (n_vertices, n_components), or None
+        Only computed when any graph is directed, or adjacency matrix is
+        asymmetric. Estimated right basis of the shared subspace. Otherwise,
+        None.
+    scores_ : array, shape (n_graphs, n_components, n_components)
+        Score matrix of each graph,
+        ``latent_left_.T @ graph @ latent_right_``, where ``latent_right_`` is
+        ``latent_left_`` if it is None.
+    singular_values_ : array, shape (n_components)
+        Singular values of the concatenated left embeddings.
+    n_iter_ : int or None
+        Number of iterations used by the SVD solver for the shared subspace, or
+        None for 'full' and 'truncated'.
+
+    See Also
+    --------
+    graspy.embed.AdjacencySpectralEmbed
+    graspy.embed.OmnibusEmbed
+    graspy.embed.selectSVD
+
+    References
+    ----------
+    .. [1] Arroyo, J., Athreya, A., Cape, J., Chen, G., Priebe, C. E., &
+       Vogelstein, J. T. (2019). Inference for multiple heterogeneous networks
+       with a common invariant subspace. arXiv preprint arXiv:1906.10026.
+    """
+
+    def __init__(
+        self,
+        n_components=None,
+        n_elbows=2,
+        algorithm="randomized",
+        n_iter=5,
+        scaled=True,
+        check_lcc=True,
+        tol=1e-7,
+        dtype=None,
+        n_jobs=None,
+        cache=None,
+    ):
+        super().__init__(
+            n_components=n_components,
+            n_elbows=n_elbows,
+            algorithm=algorithm,
+            n_iter=n_iter,
+            check_lcc=check_lcc,
+            tol=tol,
+            dtype=dtype,
+            n_jobs=n_jobs,
+            cache=cache,
+        )
+        self.scaled = scaled
+
+    def _embed_graph(self, graph, symmetric):
+        """
+        Returns the left and right embeddings of one graph, or None as the right
+        embedding of a symmetric graph.
+        """
+        U, D, V = selectSVD(
+            graph,
+            n_components=self.n_components,
+            n_elbows=self.n_elbows,
+            algorithm=self.algorithm,
+            n_iter=self.n_iter,
+            symmetric=symmetric,
+            tol=self.tol,
+            cache=self.cache,
+        )
+        V = None if symmetric else V.T
+        if self.scaled:
+            U = U * np.sqrt(D)
+            V = None if V is None else V * np.sqrt(D)
+        return U, V
+
+    def _reduce_concatenated(self, X, n_components=None, return_n_iter=False):
+        """
+        Returns the leading left singular vectors of concatenated embeddings.
+        """
+        if n_components is None:
+            n_components = self.n_components
+        return selectSVD(
+            X,
+            n_components=n_components,
+            n_elbows=self.n_elbows,
+            algorithm=self.algorithm,
+            n_iter=self.n_iter,
+            tol=self.tol,
+            return_n_iter=return_n_iter,
+        )
+
+    def fit(self, graphs, y=None):
+        """
+        Fit the model with graphs.
+
+        Parameters
+        ----------
+        graphs : list of nx.Graph or ndarray, or ndarray
+            If list of nx.Graph, each Graph must contain same number of nodes.
+            If list of ndarray, each array must have shape (n_vertices, n_vertices).
+            If ndarray, then array must have shape (n_graphs, n_vertices, n_vertices).
+            Can also be a list of scipy.sparse matrices.
+
+        y : Ignored
+
+        Returns
+        -------
+        self : returns an instance of self.
+        """
+        if isinstance(self.n_components, (list, tuple, range)):
+            msg = "n_components must be an int or None, not a list of dimensions."
+            raise ValueError(msg)
+
+        imported = [
+            import_graph(g, dtype=self.dtype, return_properties=True) for g in graphs
+        ]
+        graphs = [g for g, _ in imported]
+        symmetric = [p.almost_symmetric for _, p in imported]
+
+        # Check if the input is valid
+        _check_valid_graphs(graphs)
+
+        # Save attributes
+        self.n_graphs_ = len(graphs)
+        self.n_vertices_ = graphs[0].shape[0]
+
+        # Check if Abar is connected
+        if self.check_lcc:
+            if not is_fully_connected(sum(graphs) / self.n_graphs_):
+                msg = (
+                    "Input graphs are not fully connected. Results may not"
+                    + "be optimal. You can compute the largest connected component by"
+                    + "using ``graspy.utils.get_multigraph_union_lcc``."
+                )
+                warnings.warn(msg, UserWarning)
+
+        # Embed every graph separately
+        parallel = Parallel(n_jobs=self.n_jobs, prefer="threads")
+        embeddings = parallel(
+            delayed(self._embed_graph)(g, s) for g, s in zip(graphs, symmetric)
+        )
+        directed = not all(symmetric)
+
+        # Shared subspace of the separate embeddings
+        U, D, _, self.n_iter_ = self._reduce_concatenated(
+            np.hstack([U for U, _ in embeddings]), return_n_iter=True
+        )
+        self.n_components_ = D.size
+        self.singular_values_ = D
+        self.latent_left_ = U
+
+        if directed:
+            V, _, _ = self._reduce_concatenated(
+                np.hstack([U if V is None else V for U, V in embeddings]),
+                n_components=self.n_components_,
+            )
+            self.latent_right_ = V
+        else:
+            V = U
+            self.latent_right_ = None
+
+        # Score matrices
+        self.scores_ = np.stack(parallel(delayed(_score)(g, U, V) for g in graphs))
+
+        return self
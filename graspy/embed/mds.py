@@ -13,34 +13,201 @@
 # limitations under the License.
 
 import numpy as np
+from joblib import Parallel, delayed
 from sklearn.base import BaseEstimator
-from sklearn.utils import check_array
+from sklearn.utils import check_array, check_random_state, gen_batches, get_chunk_n_rows
+from sklearn.utils.validation import check_is_fitted
 
 from .svd import selectSVD
 from ..utils import is_symmetric
 
 
-def _get_centering_matrix(n):
+def _double_center(X):
     """
-    Compute the centering array
+    Double centers a square array in place, by subtracting its row and column
+    means and adding back its grand mean. Equivalent to ``J @ X @ J`` with the
+    centering matrix ``J = I - 1/n``, in O(n^2) time.
 
     Parameters
     ----------
-    n : int
-        Size of centering array.
+    X : 2d-array, shape (n, n)
+        Array to center. It is modified in place.
 
     Returns
     -------
-    out : 2d-array
-        Outputs a centering array of shape (n, n)
+    X : 2d-array, shape (n, n)
+        The centered input array.
     """
-    out = np.identity(n) - (1 / n) * np.ones((n, n))
+    row_means = X.mean(axis=1, keepdims=True)
+    col_means = X.mean(axis=0, keepdims=True)
+    grand_mean = row_means.mean()
+
+    X -= row_means
+    X -= col_means
+    X += grand_mean
+
+    return X
+
+
+def _distance_block(X, sq_norms, batch, out):
+    """
+    Fills the rows ``batch`` of the distance matrix ``out`` from their diagonal
+    block onwards, and the mirrored columns.
+    """
+    start = batch.start
+    block = X[batch] @ X[start:].T
+    block *= -2
+    block += sq_norms[batch, np.newaxis]
+    block += sq_norms[np.newaxis, start:]
+    # rounding errors can make the squared distances slightly negative
+    np.maximum(block, 0, out=block)
+    np.sqrt(block, out=block)
+    # the diagonal block is made exactly symmetric, with zeros on its diagonal
+    diagonal_block = block[:, : batch.stop - start]
+    lower = np.tril_indices_from(diagonal_block, k=-1)
+    diagonal_block[lower] = diagonal_block.T[lower]
+    np.fill_diagonal(diagonal_block, 0)
+
+    out[batch, start:] = block
+    out[start:, batch] = block.T
+
+
+def _cross_distance_block(X, Y, sq_norms_X, sq_norms_Y, batch, out):
+    """
+    Fills the rows ``batch`` of the distance matrix ``out`` between Y and X.
+    """
+    block = Y[batch] @ X.T
+    block *= -2
+    block += sq_norms_Y[batch, np.newaxis]
+    block += sq_norms_X[np.newaxis, :]
+    np.maximum(block, 0, out=block)
+    np.sqrt(block, out=block)
+    out[batch] = block
+
+
+def _euclidean_distances(X, Y=None, n_jobs=None, working_memory=None):
+    """
+    Computes the pairwise Euclidean distances between the samples of X, or from
+    the samples of Y to those of X.
+
+    Uses ``||x - y||^2 = ||x||^2 - 2 <x, y> + ||y||^2``, so that distances are
+    computed by matrix products in blocks of rows. If Y is None, only the
+    blocks on and above the diagonal are computed, and mirrored below it.
+
+    Parameters
+    ----------
+    X : nd-array, shape (n_samples, n_features_1, ..., n_features_d)
+        Samples, which are flattened to vectors. Distances between matrices are
+        Frobenius norms of their differences.
+
+    Y : nd-array, shape (n_samples_Y, n_features_1, ..., n_features_d), or None
+        Other samples, with the same features as X. If None, Y is X.
+
+    n_jobs : int or None, default = None
+        Number of threads computing blocks of rows. None means 1, and -1 means
+        using all processors.
+
+    working_memory : int or None, default = None
+        Maximum size in MiB of a block of distances. If None, the value of
+        ``sklearn.get_config()['working_memory']`` is used.
+
+    Returns
+    -------
+    out : 2d-array, shape (n_samples, n_samples) or (n_samples_Y, n_samples)
+        Pairwise distances, of the same dtype as X.
+    """
+    n_samples = X.shape[0]
+    X = X.reshape(n_samples, -1)
+    sq_norms = np.einsum("ij,ij->i", X, X)
+
+    if Y is None:
+        n_rows = n_samples
+    else:
+        n_rows = Y.shape[0]
+        Y = Y.reshape(n_rows, -1)
+        sq_norms_Y = np.einsum("ij,ij->i", Y, Y)
+
+    out = np.empty((n_rows, n_samples), dtype=X.dtype)
+    batch_size = get_chunk_n_rows(
+        row_bytes=n_samples * X.dtype.itemsize,
+        max_n_rows=n_rows,
+        working_memory=working_memory,
+    )
+    batches = gen_batches(n_rows, batch_size)
+    # blocks of out written by different batches do not overlap
+    if Y is None:
+        tasks = (delayed(_distance_block)(X, sq_norms, b, out) for b in batches)
+    else:
+        tasks = (
+            delayed(_cross_distance_block)(X, Y, sq_norms, sq_norms_Y, b, out)
+            for b in batches
+        )
+    Parallel(n_jobs=n_jobs, prefer="threads")(tasks)
 
     return out
 
 
-class ClassicalMDS(BaseEstimator):
+def _select_landmarks(
+    dissimilarities_to, n_samples, n_landmarks, method="random", random_state=None
+):
     """
+    Selects landmark samples, and returns their indices and the dissimilarities
+    of all samples to them.
+
+    Parameters
+    ----------
+    dissimilarities_to : callable
+        ``dissimilarities_to(indices)`` returns the dissimilarities of all
+        samples to the samples ``indices``, with shape (n_samples, len(indices)).
+
+    n_samples : int
+        Number of samples.
+
+    n_landmarks : int
+        Number of landmarks.
+
+    method : {'random' (default), 'maxmin'}, optional
+        If 'random', landmarks are sampled uniformly without replacement. If
+        'maxmin', the first landmark is sampled uniformly, and every next one is
+        the sample farthest from the landmarks already selected.
+
+    random_state : int, RandomState instance or None, optional (default=None)
+        Random state of the sampling.
+
+    Returns
+    -------
+    landmarks : array, shape (n_landmarks,)
+        Indices of the landmarks.
+
+    dissimilarities : 2d-array, shape (n_samples, n_landmarks)
+        Dissimilarities of all samples to the landmarks.
+    """
+    random_state = check_random_state(random_state)
+
+    if method == "random":
+        landmarks = np.sort(random_state.choice(n_samples, n_landmarks, replace=False))
+        return landmarks, dissimilarities_to(landmarks)
+
+    landmarks = np.empty(n_landmarks, dtype=int)
+    landmarks[0] = random_state.randint(n_samples)
+    first = dissimilarities_to(landmarks[:1])
+    dissimilarities = np.empty((n_samples, n_landmarks), dtype=first.dtype)
+    dissimilarities[:, :1] = first
+    min_dissimilarities = first[:, 0].copy()
+
+    for i in range(1, n_landmarks):
+        landmarks[i] = np.argmax(min_dissimilarities)
+        if min_dissimilarities[landmarks[i]] == 0:
+            msg = "X must have at least n_landmarks distinct samples."
+            raise ValueError(msg)
+        dissimilarities[:, i : i + 1] = dissimilarities_to(landmarks[i : i + 1])
+        np.minimum(min_dissimilarities, dissimilarities[:, i], out=min_dissimilarities)
+
+    return landmarks, dissimilarities
+
+
+class ClassicalMDS(BaseEstimator):
+    r"""
     Classical multidimensional scaling (cMDS).
 
     cMDS  seeks a low-dimensional representation of the data in
@@ -63,6 +230,56 @@ class ClassicalMDS(BaseEstimator):
             Pre-computed dissimilarities are passed directly to ``fit`` and
             ``fit_transform``.
 
+    algorithm : {'randomized' (default), 'full', 'truncated', 'krylov'}, optional
+        SVD solver to use, see ``graspy.embed.selectSVD``. 'randomized' falls
+        back to 'full' if ``n_components=1``.
+
+    n_iter : int, optional (default = 5)
+        Number of iterations for randomized SVD solver, or the maximum number of
+        iterations for 'krylov'. Not used by 'full' or 'truncated'.
+
+    tol : float, optional (default = 1e-7)
+        Stopping tolerance of 'krylov' on the relative change of the singular
+        values between iterations. Not used by the other solvers.
+
+    dtype : {None (default), np.float64, np.float32}, optional
+        Precision of the dissimilarities and of their decomposition. If None,
+        float32 input is kept as float32 and other input is converted to
+        float64.
+
+    n_jobs : int or None, optional (default = None)
+        Number of threads computing the euclidean dissimilarities. None means 1,
+        and -1 means using all processors.
+
+    n_landmarks : int or None, optional (default = None)
+        If given, landmark MDS is used: only the dissimilarities between
+        ``n_landmarks`` landmark samples are decomposed, and every sample is
+        then embedded by ``transform`` from its dissimilarities to the
+        landmarks. Euclidean dissimilarities are only computed to the
+        landmarks, in O(n_samples * n_landmarks) memory. If None, all samples
+        are decomposed.
+
+    landmark_method : {'random' (default), 'maxmin'}, optional
+        Selection of the landmarks if ``n_landmarks`` is given. 'random' samples
+        them uniformly. 'maxmin' samples the first one uniformly, then
+        repeatedly adds the sample farthest from the landmarks already
+        selected, which covers the data better.
+
+    random_state : int, RandomState instance or None, optional (default=None)
+        Random state of the landmark selection.
+
+    Notes
+    -----
+    New samples are embedded by ``transform`` with the out-of-sample formula
+    of Gower (1968). Given the squared dissimilarities :math:`d^2` of a new
+    sample to the fitted samples, its coordinates are
+    :math:`-\frac{1}{2} (d^2 - \bar{\delta}) U \Lambda^{-1/2}`, where
+    :math:`\bar{\delta}` are the column means of the squared fitted
+    dissimilarities, and :math:`U` and :math:`\Lambda` the fitted eigenvectors
+    and eigenvalues. The coordinates of a fitted sample are its fitted
+    coordinates. Landmark MDS embeds every sample with this formula, from a
+    decomposition of the landmarks only [de Silva and Tenenbaum (2004)].
+
     Attributes
     ----------
     n_components : int
@@ -76,15 +293,49 @@ class ClassicalMDS(BaseEstimator):
         The singular values corresponding to each of the selected components.
         
     dissimilarity_matrix_ : array, shape (n_features, n_features)
-        Dissimilarity matrix 
+        Dissimilarity matrix, between the landmarks if ``n_landmarks`` is given.
+
+    landmarks_ : array, shape (n_landmarks,) or None
+        Indices of the landmarks, or None if ``n_landmarks`` is None. The
+        fitted samples are then the landmarks.
+
+    squared_dissimilarity_means_ : array, shape (n_samples,)
+        Means of the squared dissimilarities of each fitted sample, used by
+        ``transform``.
+
+    X_fit_ : nd-array, shape (n_samples, n_features_1, ..., n_features_d), or None
+        Fitted samples if ``dissimilarity=='euclidean'``, used by ``transform``.
+        None if ``dissimilarity=='precomputed'``.
+
+    n_iter_ : int or None
+        Number of iterations used by the SVD solver, or None for 'full' and
+        'truncated'.
 
     References
     ----------
     Wickelmaier, Florian. "An introduction to MDS." Sound Quality Research Unit, 
     Aalborg University, Denmark 46.5 (2003).
+
+    Gower, John C. "Adding a point to vector diagrams in multivariate
+    analysis." Biometrika 55.3 (1968): 582-585.
+
+    de Silva, Vin, and Joshua B. Tenenbaum. "Sparse multidimensional scaling
+    using landmark points." Technical report, Stanford University (2004).
     """
 
-    def __init__(self, n_components=None, dissimilarity="euclidean"):
+    def __init__(
+        self,
+        n_components=None,
+        dissimilarity="euclidean",
+        algorithm="randomized",
+        n_iter=5,
+        tol=1e-7,
+        dtype=None,
+        n_jobs=None,
+        n_landmarks=None,
+        landmark_method="random",
+        random_state=None,
+    ):
         # Check inputs
         if n_components is not None:
             if not isinstance(n_components, int):
@@ -101,6 +352,28 @@ class ClassicalMDS(BaseEstimator):
             msg = "Dissimilarity measure must be either 'euclidean' or 'precomputed'."
             raise ValueError(msg)
         self.dissimilarity = dissimilarity
+        self.algorithm = algorithm
+        self.n_iter = n_iter
+        self.tol = tol
+        self.dtype = dtype
+        self.n_jobs = n_jobs
+
+        if n_landmarks is not None:
+            if not isinstance(n_landmarks, int):
+                msg = "n_landmarks must be an integer, not {}.".format(
+                    type(n_landmarks)
+                )
+                raise TypeError(msg)
+            elif n_landmarks < 2:
+                msg = "n_landmarks must be >= 2 or None."
+                raise ValueError(msg)
+        self.n_landmarks = n_landmarks
+
+        if landmark_method not in ["random", "maxmin"]:
+            msg = "landmark_method must be either 'random' or 'maxmin'."
+            raise ValueError(msg)
+        self.landmark_method = landmark_method
+        self.random_state = random_state
 
     def _compute_euclidean_distances(self, X):
         """
@@ -121,21 +394,7 @@ class ClassicalMDS(BaseEstimator):
             A dissimilarity matrix based on Frobenous norms between pairs of
             matrices or vectors.
         """
-        shape = X.shape
-        n_samples = shape[0]
-
-        if X.ndim == 2:
-            order = 2
-            axis = 1
-        else:
-            order = "fro"
-            axis = (1, 2)
-
-        out = np.zeros((n_samples, n_samples))
-        for i in range(n_samples):
-            out[i] = np.linalg.norm(X - X[i], axis=axis, ord=order)
-
-        return out
+        return _euclidean_distances(X, n_jobs=self.n_jobs)
 
     def fit(self, X, y=None):
         """
@@ -152,46 +411,163 @@ class ClassicalMDS(BaseEstimator):
         
         y : Ignored
         """
+        self._fit(X)
+
+        return self
+
+    def _fit(self, X):
+        """
+        Fits the model with X. If ``n_landmarks`` is given, returns the
+        dissimilarities of all samples to the landmarks, and otherwise None.
+        """
         # Check X type
         if not isinstance(X, np.ndarray):
             msg = "X must be a numpy array, not {}.".format(type(X))
             raise ValueError(msg)
 
+        n_samples = X.shape[0]
+        if self.n_landmarks is not None and self.n_landmarks > n_samples:
+            msg = "n_landmarks must be <= n_samples."
+            raise ValueError(msg)
+
         if self.n_components is not None:
-            n_samples = X.shape[0]
             if self.n_components > n_samples:
                 msg = "n_components must be <= n_samples."
                 raise ValueError(msg)
+            elif self.n_landmarks is not None and self.n_components > self.n_landmarks:
+                msg = "n_components must be <= n_landmarks."
+                raise ValueError(msg)
+
+        if self.dtype is None:
+            dtype = [np.float64, np.float32]
+        else:
+            dtype = self.dtype
 
         # Handle dissimilarity
         if self.dissimilarity == "precomputed":
-            dissimilarity_matrix = check_array(X, ensure_2d=True, allow_nd=False)
+            dissimilarity_matrix = check_array(
+                X, dtype=dtype, ensure_2d=True, allow_nd=False
+            )
 
             # Must be symmetric
             if not is_symmetric(dissimilarity_matrix):
                 msg = "X must be a symmetric array if precomputed dissimilarity matrix."
                 raise ValueError(msg)
+
+            def dissimilarities_to(indices):
+                return dissimilarity_matrix[:, indices]
+
         elif self.dissimilarity == "euclidean":
-            X = check_array(X, ensure_2d=True, allow_nd=True)
-            dissimilarity_matrix = self._compute_euclidean_distances(X=X)
+            X = check_array(X, dtype=dtype, ensure_2d=True, allow_nd=True)
+            if self.n_landmarks is None:
+                dissimilarity_matrix = self._compute_euclidean_distances(X=X)
+
+            def dissimilarities_to(indices):
+                return _euclidean_distances(X[indices], X, n_jobs=self.n_jobs)
 
-        J = _get_centering_matrix(dissimilarity_matrix.shape[0])
-        B = J @ (dissimilarity_matrix ** 2) @ J * -0.5
+        if self.n_landmarks is None:
+            landmarks = None
+            landmark_dissimilarities = None
+        else:
+            landmarks, landmark_dissimilarities = _select_landmarks(
+                dissimilarities_to,
+                n_samples,
+                self.n_landmarks,
+                method=self.landmark_method,
+                random_state=self.random_state,
+            )
+            dissimilarity_matrix = landmark_dissimilarities[landmarks]
+            # euclidean distances between landmarks may have rounding errors
+            dissimilarity_matrix += dissimilarity_matrix.T
+            dissimilarity_matrix /= 2
+            np.fill_diagonal(dissimilarity_matrix, 0)
+            if self.dissimilarity == "euclidean":
+                X = X[landmarks]
+
+        B = np.square(dissimilarity_matrix)
+        squared_dissimilarity_means = B.mean(axis=0)
+        _double_center(B)
+        B *= -0.5
 
         n_components = self.n_components
 
-        if n_components == 1:
+        if n_components == 1 and self.algorithm == "randomized":
             algorithm = "full"
         else:
-            algorithm = "randomized"
-        U, D, V = selectSVD(B, algorithm=algorithm, n_components=n_components)
+            algorithm = self.algorithm
+        U, D, V, n_iter_ = selectSVD(
+            B,
+            algorithm=algorithm,
+            n_components=n_components,
+            n_iter=self.n_iter,
+            symmetric=True,
+            tol=self.tol,
+            return_n_iter=True,
+        )
 
         self.n_components_ = len(D)
+        self.n_iter_ = n_iter_
         self.components_ = U
         self.singular_values_ = D ** 0.5
         self.dissimilarity_matrix_ = dissimilarity_matrix
+        self.squared_dissimilarity_means_ = squared_dissimilarity_means
+        self.landmarks_ = landmarks
+        self.X_fit_ = X if self.dissimilarity == "euclidean" else None
 
-        return self
+        return landmark_dissimilarities
+
+    def transform(self, X):
+        """
+        Embed new samples into the fitted space.
+
+        Parameters
+        ----------
+        X : nd-array
+            If ``dissimilarity=='precomputed'``, the dissimilarities of the new
+            samples to the fitted samples, with shape (n_new_samples,
+            n_samples), or (n_new_samples, n_landmarks) to the landmarks if
+            ``n_landmarks`` is given. If ``dissimilarity=='euclidean'``, the new
+            samples, with shape (n_new_samples, n_features_1, ..., n_features_d)
+            and the same features as the fitted samples.
+
+        Returns
+        -------
+        X_new : array-like, shape (n_new_samples, n_components)
+            Embedded new samples.
+        """
+        check_is_fitted(self, ["components_"], all_or_any=all)
+
+        if not isinstance(X, np.ndarray):
+            msg = "X must be a numpy array, not {}.".format(type(X))
+            raise ValueError(msg)
+
+        dtype = self.dissimilarity_matrix_.dtype
+        n_samples = self.dissimilarity_matrix_.shape[0]
+        if self.dissimilarity == "precomputed":
+            dissimilarities = check_array(X, dtype=dtype, ensure_2d=True)
+            if dissimilarities.shape[1] != n_samples:
+                msg = "X must have {} columns, one per fitted sample.".format(n_samples)
+                raise ValueError(msg)
+        else:
+            X = check_array(X, dtype=dtype, ensure_2d=True, allow_nd=True)
+            if X.shape[1:] != self.X_fit_.shape[1:]:
+                msg = "X must have samples of shape {}, not {}.".format(
+                    self.X_fit_.shape[1:], X.shape[1:]
+                )
+                raise ValueError(msg)
+            dissimilarities = _euclidean_distances(self.X_fit_, X, n_jobs=self.n_jobs)
+
+        return self._embed_dissimilarities(dissimilarities)
+
+    def _embed_dissimilarities(self, dissimilarities):
+        """
+        Embeds samples from their dissimilarities to the fitted samples.
+        """
+        B = np.square(dissimilarities)
+        B -= self.squared_dissimilarity_means_
+        B *= -0.5
+
+        return B @ self.components_ / self.singular_values_
 
     def fit_transform(self, X, y=None):
         """
@@ -214,8 +590,11 @@ class ClassicalMDS(BaseEstimator):
         X_new : array-like, shape (n_samples, n_components)
             Embedded input.
         """
-        self.fit(X)
+        landmark_dissimilarities = self._fit(X)
 
-        X_new = self.components_ @ np.diag(self.singular_values_)
+        if landmark_dissimilarities is None:
+            X_new = self.components_ @ np.diag(self.singular_values_)
+        else:
+            X_new = self._embed_dissimilarities(landmark_dissimilarities)
 
         return X_new
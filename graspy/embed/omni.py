@@ -15,6 +15,7 @@
 import warnings
 
 import numpy as np
+from scipy.sparse.linalg import LinearOperator
 from sklearn.utils.validation import check_is_fitted
 
 from ..utils import get_lcc, import_graph, is_fully_connected
@@ -82,6 +83,55 @@ def _get_omni_matrix(graphs):
     return out
 
 
+class _OmnibusOperator(LinearOperator):
+    r"""
+    Matrix-free omnibus matrix.
+
+    Products with the :math:`(mn \times mn)` omnibus matrix are computed from
+    the m input graphs directly, since block :math:`(i, j)` of the product is
+    :math:`\frac{1}{2}(A_i X_j + A_j X_j)`. A product with a block of k vectors
+    costs 2m graph products, that is :math:`O(mn^2k)` for dense graphs and
+    :math:`O(m \cdot nnz \cdot k)` for sparse graphs.
+
+    Parameters
+    ----------
+    graphs : list
+        List of array-like or scipy.sparse matrices with shapes
+        (n_vertices, n_vertices).
+    """
+
+    def __init__(self, graphs):
+        self.graphs = graphs
+        self.n_graphs = len(graphs)
+        self.n_vertices = graphs[0].shape[0]
+
+        n = self.n_graphs * self.n_vertices
+        dtype = np.result_type(*[g.dtype for g in graphs])
+        super().__init__(dtype=dtype, shape=(n, n))
+
+    def _matmat(self, X):
+        X = np.asarray(X).reshape(self.n_graphs, self.n_vertices, -1)
+
+        # sum_j A_j X_j is shared by every block row
+        X_sum = X.sum(axis=0)
+        AX_sum = sum(A @ x for A, x in zip(self.graphs, X))
+
+        out = np.stack([A @ X_sum for A in self.graphs])
+        out += AX_sum
+        out /= 2
+
+        return out.reshape(self.n_graphs * self.n_vertices, -1)
+
+    def _matvec(self, x):
+        return self._matmat(np.reshape(x, (-1, 1))).ravel()
+
+    def _transpose(self):
+        return _OmnibusOperator([g.T for g in self.graphs])
+
+    def _adjoint(self):
+        return self._transpose()
+
+
 class OmnibusEmbed(BaseEmbed):
     r"""
     Omnibus embedding of arbitrary number of input graphs with matched vertex 
@@ -95,16 +145,20 @@ class OmnibusEmbed(BaseEmbed):
 
     Parameters
     ----------
-    n_components : int or None, default = None
+    n_components : int, list of int or None, default = None
         Desired dimensionality of output data. If "full", 
         n_components must be <= min(X.shape). Otherwise, n_components must be
         < min(X.shape). If None, then optimal dimensions will be chosen by
-        ``select_dimension`` using ``n_elbows`` argument.
+        ``select_dimension`` using ``n_elbows`` argument. If a list, tuple or
+        range of dimensions, the omnibus matrix is decomposed once at the
+        largest dimension, and ``embeddings_`` holds the nested embedding of
+        every dimension.
     n_elbows : int, optional, default: 2
         If `n_components=None`, then compute the optimal embedding dimension using
         `select_dimension`. Otherwise, ignored.
-    algorithm : {'randomized' (default), 'full', 'truncated'}, optional
-        SVD solver to use:
+    algorithm : str, optional (default = 'randomized')
+        SVD solver to use, one of 'randomized', 'full', 'truncated', 'krylov'
+        or 'adaptive':
 
         - 'randomized'
             Computes randomized svd using 
@@ -113,14 +167,60 @@ class OmnibusEmbed(BaseEmbed):
             Computes full svd using ``scipy.linalg.svd``
         - 'truncated'
             Computes truncated svd using ``scipy.sparse.linalg.svd``
+        - 'krylov'
+            Computes randomized block Krylov svd, which converges faster than
+            'randomized' when the spectrum decays slowly
+        - 'adaptive'
+            Computes randomized svd with a range finder grown in blocks, until
+            the estimated relative error is at most ``tol``, or until the first
+            elbow of the singular values is stable. The embedding dimension is
+            chosen from the same criteria, with ``n_components`` as its
+            maximum, see ``graspy.embed.selectSVD``
     n_iter : int, optional (default = 5)
-        Number of iterations for randomized SVD solver. Not used by 'full' or 
-        'truncated'. The default is larger than the default in randomized_svd 
-        to handle sparse matrices that may have large slowly decaying spectrum.
+        Number of iterations for randomized SVD solver, the maximum number of
+        iterations for 'krylov', or the number of power iterations of each block
+        of 'adaptive'. Not used by 'full' or 'truncated'. The default is larger
+        than the default in randomized_svd to handle sparse matrices that may
+        have large slowly decaying spectrum.
     check_lcc : bool , optional (defult = True)
         Whether to check if the average of all input graphs are connected. May result
         in non-optimal results if the average graph is unconnected. If True and average
         graph is unconnected, a UserWarning is thrown. 
+    warm_start : bool, optional (default = False)
+        If True, the singular vectors of the previous call to fit seed the range
+        finder of the randomized SVD solver, so that refitting on a similar graph
+        with the same number of vertices needs fewer power iterations. Only used
+        by 'randomized' and 'krylov'.
+    matrix_free : bool, optional (default = False)
+        If True, the omnibus matrix is never built. The SVD solver works with a
+        ``scipy.sparse.linalg.LinearOperator`` whose products are computed from
+        the input graphs, which takes :math:`O(mn^2)` memory instead of
+        :math:`O(m^2n^2)`. Requires ``algorithm`` other than 'full'.
+    window_size : int or None, optional (default = None)
+        Maximum number of graphs kept by ``partial_fit``. When appending graphs
+        would exceed it, the oldest graphs are dropped. If None, all graphs are
+        kept.
+    tol : float, optional (default = 1e-7)
+        Stopping tolerance of 'krylov' on the relative change of the singular
+        values between iterations, or of 'adaptive' on the estimated relative
+        error of the decomposition, which must be in (0, 1). Not used by the
+        other solvers.
+    dtype : {None (default), np.float64, np.float32}, optional
+        Precision of the embedding. Graphs are converted to ``dtype`` and
+        decomposed in that precision by every SVD solver. If None, float32
+        arrays are kept as float32 and other inputs are converted to float64.
+    n_jobs : int or None, optional (default = None)
+        Number of processes computing the matrix products of 'randomized' and
+        'krylov', see ``graspy.embed.selectSVD``. None means 1, and -1 means
+        using all processors.
+    cache : EmbeddingCache or None, optional (default = None)
+        Cache of decompositions. Refitting a graph that was already embedded
+        with the same parameters loads the stored decomposition instead of
+        recomputing it.
+    n_iter_update : int, optional (default = 2)
+        Number of subspace iterations of 'randomized', or the maximum number of
+        iterations of 'krylov', used by ``partial_fit``. Starting from the
+        previous latent positions, fewer iterations than ``n_iter`` are needed.
 
     Attributes
     ----------
@@ -128,6 +228,8 @@ class OmnibusEmbed(BaseEmbed):
         Number of graphs
     n_vertices_ : int
         Number of vertices in each graph
+    graphs_ : list of array-like
+        The embedded graphs, kept so that ``partial_fit`` can append to them.
     latent_left_ : array, shape (n_graphs, n_vertices, n_components)
         Estimated left latent positions of the graph. 
     latent_right_ : array, shape (n_graphs, n_vertices, n_components), or None
@@ -136,6 +238,13 @@ class OmnibusEmbed(BaseEmbed):
         None.
     singular_values_ : array, shape (n_components)
         Singular values associated with the latent position matrices.
+    n_iter_ : int or None
+        Number of iterations used by the SVD solver, or None for 'full' and
+        'truncated'.
+    embeddings_ : dict or None
+        If ``n_components`` is a list, the embedding of every dimension d in
+        it, ``latent_left_[:, :, :d]``, or the tuple of ``latent_left_[:, :, :d]``
+        and ``latent_right_[:, :, :d]`` for directed graphs. Otherwise, None.
 
     See Also
     --------
@@ -157,6 +266,14 @@ class OmnibusEmbed(BaseEmbed):
         algorithm="randomized",
         n_iter=5,
         check_lcc=True,
+        warm_start=False,
+        matrix_free=False,
+        window_size=None,
+        tol=1e-7,
+        dtype=None,
+        n_jobs=None,
+        cache=None,
+        n_iter_update=2,
     ):
         super().__init__(
             n_components=n_components,
@@ -164,7 +281,15 @@ class OmnibusEmbed(BaseEmbed):
             algorithm=algorithm,
             n_iter=n_iter,
             check_lcc=check_lcc,
+            warm_start=warm_start,
+            tol=tol,
+            dtype=dtype,
+            n_jobs=n_jobs,
+            cache=cache,
         )
+        self.matrix_free = matrix_free
+        self.window_size = window_size
+        self.n_iter_update = n_iter_update
 
     def fit(self, graphs, y=None):
         """
@@ -176,6 +301,8 @@ class OmnibusEmbed(BaseEmbed):
             If list of nx.Graph, each Graph must contain same number of nodes.
             If list of ndarray, each array must have shape (n_vertices, n_vertices).
             If ndarray, then array must have shape (n_graphs, n_vertices, n_vertices).
+            If ``matrix_free=True``, graphs can also be a list of scipy.sparse
+            matrices.
         
         y : Ignored
 
@@ -183,21 +310,104 @@ class OmnibusEmbed(BaseEmbed):
         -------
         self : returns an instance of self.
         """
+        if self.matrix_free and self.algorithm == "full":
+            msg = "algorithm must not be 'full' if matrix_free=True."
+            raise ValueError(msg)
+
         # Convert input to np.arrays
-        graphs = [import_graph(g) for g in graphs]
+        graphs, properties = self._import_graphs(graphs)
+
+        self._embed(graphs, properties)
 
+        return self
+
+    def partial_fit(self, graphs, y=None):
+        """
+        Update the embedding with graphs appended to the ones already fitted.
+
+        The new omnibus matrix is decomposed by ``algorithm``. With 'randomized'
+        and 'krylov', instead of decomposing it from scratch, the previous
+        latent positions are used as the starting basis of ``n_iter_update``
+        subspace iterations. Rows of the appended graphs start from the average of the
+        previous latent positions. 'full' and 'truncated' decompose it exactly,
+        as ``fit`` does. The embedding dimension is kept at ``n_components_``.
+        If ``window_size`` is set, only the most recent ``window_size`` graphs
+        are kept. If the model is not fitted yet, this is the same as ``fit``.
+
+        Parameters
+        ----------
+        graphs : list of nx.Graph or ndarray, or ndarray
+            Graphs to append, with the same vertices as the fitted graphs.
+            If ndarray, then array must have shape (n_graphs, n_vertices, n_vertices).
+
+        y : Ignored
+
+        Returns
+        -------
+        self : returns an instance of self.
+        """
+        if not hasattr(self, "graphs_"):
+            if self.window_size is not None:
+                graphs = list(graphs)[-self.window_size :]
+            return self.fit(graphs)
+
+        # The properties of the fitted graphs are reused rather than recomputed
+        new_graphs, new_properties = self._import_graphs(graphs)
+        graphs = self.graphs_ + new_graphs
+        properties = self._graph_properties + new_properties
+
+        n_dropped = 0
+        if self.window_size is not None:
+            n_dropped = max(0, len(graphs) - self.window_size)
+            graphs = graphs[n_dropped:]
+            properties = properties[n_dropped:]
+
+        # Starting basis: the previous right singular vectors of the graphs that
+        # are kept, and their average for the appended graphs
+        if self.latent_right_ is not None:
+            previous = self.latent_right_
+        else:
+            previous = self.latent_left_
+        # Components with zero singular values are left unscaled
+        D = self.singular_values_
+        previous = previous / np.where(D > 0, np.sqrt(D), 1)
+        kept = previous[n_dropped:]
+        appended = np.repeat(
+            previous.mean(axis=0, keepdims=True), len(graphs) - len(kept), axis=0
+        )
+        init = np.concatenate([kept, appended]).reshape(-1, self.n_components_)
+
+        self._embed(graphs, properties, init=init)
+
+        return self
+
+    def _import_graphs(self, graphs):
+        """
+        Imports graphs, and returns them with their ``GraphProperties``.
+        """
+        imported = [
+            import_graph(g, dtype=self.dtype, return_properties=True) for g in graphs
+        ]
+        return [g for g, _ in imported], [p for _, p in imported]
+
+    def _embed(self, graphs, properties, init=None):
+        """
+        Embeds the omnibus matrix of the imported graphs, given their
+        properties. If ``init`` is given, it is refined by ``n_iter_update``
+        subspace iterations at rank ``n_components_``.
+        """
         # Check if the input is valid
         _check_valid_graphs(graphs)
 
         # Save attributes
+        self.graphs_ = graphs
+        self._graph_properties = properties
         self.n_graphs_ = len(graphs)
         self.n_vertices_ = graphs[0].shape[0]
 
-        graphs = np.stack(graphs)
-
         # Check if Abar is connected
         if self.check_lcc:
-            if not is_fully_connected(graphs.mean(axis=0)):
+            if not is_fully_connected(sum(graphs) / self.n_graphs_):
                 msg = (
                     "Input graphs are not fully connected. Results may not"
                     + "be optimal. You can compute the largest connected component by"
@@ -205,11 +415,26 @@ class OmnibusEmbed(BaseEmbed):
                 )
                 warnings.warn(msg, UserWarning)
 
-        # Create omni matrix
-        omni_matrix = _get_omni_matrix(graphs)
+        # The omnibus matrix is symmetric iff every graph is
+        symmetric = all(p.almost_symmetric for p in properties)
 
-        # Embed
-        self._reduce_dim(omni_matrix)
+        # Create omni matrix
+        if self.matrix_free:
+            omni_matrix = _OmnibusOperator(graphs)
+        else:
+            omni_matrix = _get_omni_matrix(graphs)
+
+        # Embed, at rank n_components_ from init if given
+        if init is None:
+            self._reduce_dim(omni_matrix, symmetric=symmetric)
+        else:
+            self._reduce_dim(
+                omni_matrix,
+                symmetric=symmetric,
+                n_components=self.n_components_,
+                init=init,
+                n_iter=self.n_iter_update,
+            )
 
         # Reshape to tensor
         self.latent_left_ = self.latent_left_.reshape(
@@ -219,8 +444,7 @@ class OmnibusEmbed(BaseEmbed):
             self.latent_right_ = self.latent_right_.reshape(
                 self.n_graphs_, self.n_vertices_, -1
             )
-
-        return self
+        self._set_embeddings()
 
     def fit_transform(self, graphs, y=None):
         """
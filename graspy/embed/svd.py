@@ -12,10 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import shutil
+import tempfile
+import weakref
+
 import numpy as np
 import scipy
 import sklearn
-from scipy.stats import norm
+from joblib import Parallel, delayed, dump, effective_n_jobs, load
+from scipy.sparse import issparse
+from scipy.sparse.linalg import LinearOperator
+from sklearn.utils import check_random_state, gen_batches, get_chunk_n_rows
+from sklearn.utils.extmath import svd_flip
 
 
 def _compute_likelihood(arr):
@@ -23,42 +32,484 @@ def _compute_likelihood(arr):
     Computes the log likelihoods based on normal distribution given 
     a 1d-array of sorted values. If the input has no variance,
     the likelihood will be nan.
+
+    All split points are evaluated at once. The within-group sums of squares
+    are computed from prefix sums of the values, shifted by the first element
+    for the prefixes and by the last element for the suffixes so that the
+    cumulative sums stay well conditioned.
     """
+    # float32 singular values are upcast, since the sums of squares lose
+    # too much precision in float32
+    arr = np.asarray(arr, dtype=np.float64)
     n_elements = len(arr)
-    likelihoods = np.zeros(n_elements)
-
-    for idx in range(1, n_elements + 1):
-        # split into two samples
-        s1 = arr[:idx]
-        s2 = arr[idx:]
-
-        # deal with when input only has 2 elements
-        if (s1.size == 1) & (s2.size == 1):
-            likelihoods[idx - 1] = -np.inf
-            continue
-
-        # compute means
-        mu1 = np.mean(s1)
-        if s2.size != 0:
-            mu2 = np.mean(s2)
-        else:
-            # Prevent numpy warning for taking mean of empty array
-            mu2 = -np.inf
+    idx = np.arange(1, n_elements + 1)
 
-        # compute pooled variance
-        variance = ((np.sum((s1 - mu1) ** 2) + np.sum((s2 - mu2) ** 2))) / (
-            n_elements - 1 - (idx < n_elements)
-        )
-        std = np.sqrt(variance)
+    # sums of squares of the first idx elements
+    s1 = arr - arr[0]
+    ss1 = np.cumsum(s1 ** 2) - np.cumsum(s1) ** 2 / idx
+
+    # sums of squares of the last (n_elements - idx) elements
+    s2 = (arr - arr[-1])[::-1]
+    ss2 = np.cumsum(s2 ** 2) - np.cumsum(s2) ** 2 / idx
+    ss2 = np.append(ss2[::-1][1:], 0)
+
+    ss = np.maximum(ss1, 0) + np.maximum(ss2, 0)
+
+    # compute pooled variance
+    dof = n_elements - 1 - (idx < n_elements)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = ss / dof
 
         # compute log likelihoods
-        likelihoods[idx - 1] = np.sum(norm.logpdf(s1, loc=mu1, scale=std)) + np.sum(
-            norm.logpdf(s2, loc=mu2, scale=std)
+        likelihoods = -0.5 * n_elements * np.log(2 * np.pi * variance) - ss / (
+            2 * variance
         )
+    likelihoods[variance == 0] = np.nan
+
+    # deal with when input only has 2 elements
+    if n_elements == 2:
+        likelihoods[0] = -np.inf
 
     return likelihoods
 
 
+def _row_block_product(X, start, stop, Q, batch_size, transpose=False):
+    """
+    Computes ``X[start:stop] @ Q``, or ``X[start:stop].T @ Q`` if transpose is
+    True, reading ``batch_size`` rows of X at a time.
+    """
+    batches = gen_batches(stop - start, batch_size)
+    if transpose:
+        out = np.zeros((X.shape[1], Q.shape[1]), dtype=np.result_type(X.dtype, Q.dtype))
+        for batch in batches:
+            out += X[start + batch.start : start + batch.stop].T @ Q[batch]
+        return out
+    return np.vstack(
+        [X[start + batch.start : start + batch.stop] @ Q for batch in batches]
+    )
+
+
+def _memmap(X):
+    """
+    Returns X memory-mapped from a temporary file, so that worker processes read
+    it without copies, or X itself if it is already memory-mapped. The file is
+    removed once the returned matrix is garbage collected.
+    """
+    arrays = [X.data, X.indices, X.indptr] if issparse(X) else [X]
+    if all(isinstance(arr, np.memmap) for arr in arrays):
+        return X
+
+    folder = tempfile.mkdtemp(prefix="graspy_")
+    filename = os.path.join(folder, "X.pkl")
+    dump(X, filename)
+    X = load(filename, mmap_mode="r")
+    weakref.finalize(X, shutil.rmtree, folder, ignore_errors=True)
+    return X
+
+
+class _RowBlockOperator(LinearOperator):
+    """
+    Row-blocked products with an array, typically a ``np.memmap``.
+
+    ``X @ Q`` and ``X.T @ Q`` are computed from row blocks of X, read one at a
+    time, so each product is a single sequential pass over X. The number of
+    rows per block is chosen so that a block takes at most ``working_memory``
+    MiB.
+
+    If ``n_jobs`` is not 1, the rows are split into one contiguous part per
+    worker of a ``joblib`` process pool, and the parts are multiplied in
+    parallel. Workers read X without copying it: a ``np.memmap`` through its
+    file, and other arrays and sparse matrices through a temporary memory map,
+    written once when the operator is created and shared by every product.
+    Every worker holds up to ``working_memory`` MiB of X.
+
+    Parameters
+    ----------
+    X : array-like or sparse matrix, shape (n_samples, n_features)
+        Array to multiply with.
+    working_memory : int or None, default = None
+        Memory budget of a row block in MiB. If None, the value of
+        ``sklearn.get_config()['working_memory']`` is used.
+    transpose : bool, default = False
+        Whether the operator represents ``X.T`` instead of X.
+    n_jobs : int or None, default = None
+        Number of worker processes. None means 1, and -1 means using all
+        processors.
+    """
+
+    def __init__(self, X, working_memory=None, transpose=False, n_jobs=None):
+        if issparse(X):
+            # cheap row slices
+            X = X.tocsr()
+        if effective_n_jobs(n_jobs) > 1:
+            X = _memmap(X)
+        self.X = X
+        self.working_memory = working_memory
+        self.transpose = transpose
+        self.n_jobs = n_jobs
+        self.batch_size = get_chunk_n_rows(
+            row_bytes=X.shape[1] * X.dtype.itemsize,
+            max_n_rows=X.shape[0],
+            working_memory=working_memory,
+        )
+
+        shape = X.shape[::-1] if transpose else X.shape
+        super().__init__(dtype=X.dtype, shape=shape)
+
+    def _matmat(self, Q):
+        n_rows = self.X.shape[0]
+        n_parts = min(effective_n_jobs(self.n_jobs), n_rows)
+        if n_parts == 1:
+            return _row_block_product(
+                self.X, 0, n_rows, Q, self.batch_size, self.transpose
+            )
+
+        bounds = np.linspace(0, n_rows, n_parts + 1).astype(int)
+        # X is memory-mapped, and passed to the workers by its file
+        parts = Parallel(n_jobs=n_parts, backend="loky")(
+            delayed(_row_block_product)(
+                self.X,
+                start,
+                stop,
+                Q[start:stop] if self.transpose else Q,
+                self.batch_size,
+                self.transpose,
+            )
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        )
+        if self.transpose:
+            return sum(parts)
+        return np.vstack(parts)
+
+    def _matvec(self, x):
+        return self._matmat(np.reshape(x, (-1, 1))).ravel()
+
+    def _transpose(self):
+        return _RowBlockOperator(
+            self.X, self.working_memory, not self.transpose, self.n_jobs
+        )
+
+    def _adjoint(self):
+        return self._transpose()
+
+
+def _randomized_range_finder(X, size, n_iter, random_state=None, init=None):
+    """
+    Computes an orthonormal basis for the range of X with a Gaussian sketch and
+    LU-normalized power iterations.
+
+    Only the products ``X @ Q`` and ``X.T @ Q`` are used, so X can be an
+    array, a sparse matrix or a ``scipy.sparse.linalg.LinearOperator``. If
+    ``init`` is given, its columns replace the first columns of the sketch, so
+    that a previous estimate of the right singular vectors is refined by
+    subspace iteration instead of starting from scratch.
+    """
+    random_state = check_random_state(random_state)
+
+    Q = random_state.normal(size=(X.shape[1], size))
+    if init is not None:
+        n_init = min(init.shape[1], size)
+        Q[:, :n_init] = init[:, :n_init]
+    if X.dtype.kind == "f":
+        Q = Q.astype(X.dtype, copy=False)
+
+    for _ in range(n_iter):
+        Q, _ = scipy.linalg.lu(X @ Q, permute_l=True)
+        Q, _ = scipy.linalg.lu(X.T @ Q, permute_l=True)
+
+    Q, _ = scipy.linalg.qr(X @ Q, mode="economic")
+    return Q
+
+
+def _randomized_svd(
+    X, n_components, n_oversamples=10, n_iter=5, random_state=0, init=None
+):
+    """
+    Randomized SVD that only needs the products ``X @ Q`` and ``X.T @ Q``.
+
+    Follows ``sklearn.utils.extmath.randomized_svd``, which needs an explicit
+    array or sparse matrix, so that matrix-free operators can be decomposed.
+    ``init`` is an optional starting basis for the range finder.
+    """
+    Q = _randomized_range_finder(
+        X,
+        n_components + n_oversamples,
+        n_iter=n_iter,
+        random_state=random_state,
+        init=init,
+    )
+
+    # project X onto the basis, B = Q.T @ X
+    B = (X.T @ Q).T
+    Uhat, D, V = scipy.linalg.svd(B, full_matrices=False)
+    U = Q @ Uhat
+    U, V = svd_flip(U, V)
+
+    return U[:, :n_components], D[:n_components], V[:n_components, :]
+
+
+def _symmetric_svd(X, n_components, algorithm, n_iter=5, init=None):
+    """
+    SVD of a symmetric matrix through a symmetric eigendecomposition.
+
+    The eigenpairs largest in magnitude are returned in SVD form, with the
+    absolute eigenvalues as singular values and the signs of the eigenvalues
+    moved to the right singular vectors.
+    """
+    if algorithm == "full":
+        if issparse(X):
+            X = X.toarray()
+        w, U = scipy.linalg.eigh(X)
+    elif algorithm == "truncated":
+        w, U = scipy.sparse.linalg.eigsh(X, k=n_components, which="LM")
+    elif algorithm == "randomized":
+        Q = _randomized_range_finder(
+            X, n_components + 10, n_iter=n_iter, random_state=0, init=init
+        )
+        # Rayleigh-Ritz on the range, B = Q.T @ X @ Q
+        B = Q.T @ (X @ Q)
+        w, U = scipy.linalg.eigh((B + B.T) / 2)
+        U = Q @ U
+
+    idx = np.argsort(np.abs(w))[::-1][:n_components]
+    w = w[idx]
+    U = U[:, idx]
+
+    D = np.abs(w)
+    V = U.T * np.where(w < 0, -1, 1)[:, None]
+    U, V = svd_flip(U, V)
+
+    return U, D, V
+
+
+def _block_krylov_svd(
+    X,
+    n_components,
+    n_iter=5,
+    tol=1e-7,
+    n_oversamples=10,
+    random_state=0,
+    init=None,
+    symmetric=False,
+):
+    """
+    Randomized block Krylov SVD [1]_.
+
+    The block Krylov subspace spanned by :math:`XG, (XX^T)XG, (XX^T)^2XG, ...`,
+    or :math:`XG, X^2G, ...` if X is symmetric, is grown one block at a time
+    with block products, and a Rayleigh-Ritz step after each block gives the
+    current estimate of the top singular triplets. Iteration stops once the top
+    ``n_components`` singular values change by at most ``tol`` (relative), or
+    after ``n_iter`` blocks were added.
+
+    Returns U, D, V and the number of iterations used.
+
+    References
+    ----------
+    .. [1] Musco, C. and Musco, C. (2015). Randomized block Krylov methods for
+        stronger and faster approximate singular value decomposition. Advances
+        in Neural Information Processing Systems, pp. 1396-1404.
+    """
+    random_state = check_random_state(random_state)
+
+    size = min(n_components + n_oversamples, min(X.shape))
+    G = random_state.normal(size=(X.shape[1], size))
+    if init is not None:
+        n_init = min(init.shape[1], G.shape[1])
+        G[:, :n_init] = init[:, :n_init]
+    if X.dtype.kind == "f":
+        G = G.astype(X.dtype, copy=False)
+
+    Q, _ = scipy.linalg.qr(X @ G, mode="economic")
+    # W holds X.T @ Q, which is X @ Q if X is symmetric
+    W = XTblock = X.T @ Q
+
+    D_prev = None
+    for n_iter_ in range(n_iter + 1):
+        # Rayleigh-Ritz on the current Krylov basis
+        if symmetric:
+            T = Q.T @ W
+            w, Uhat = scipy.linalg.eigh((T + T.T) / 2)
+            idx = np.argsort(np.abs(w))[::-1]
+            w, Uhat = w[idx], Uhat[:, idx]
+            D = np.abs(w)
+        else:
+            Uhat, D, V = scipy.linalg.svd(W.T, full_matrices=False)
+
+        D = D[:n_components]
+        if D_prev is not None:
+            change = np.max(np.abs(D - D_prev) / np.maximum(D, np.finfo(D.dtype).tiny))
+            if change <= tol:
+                break
+        D_prev = D
+
+        if n_iter_ == n_iter:
+            break
+
+        # Next block, orthogonalized against the basis twice for stability.
+        # The basis cannot grow past min(X.shape), and directions already in
+        # its span are dropped.
+        block = XTblock if symmetric else X @ XTblock
+        block = block[:, : min(X.shape) - Q.shape[1]]
+        if block.shape[1] == 0:
+            break
+        norm = np.linalg.norm(block)
+        for _ in range(2):
+            block = block - Q @ (Q.T @ block)
+        block, R, _ = scipy.linalg.qr(block, mode="economic", pivoting=True)
+        rank = np.sum(np.abs(np.diag(R)) > max(X.shape) * np.finfo(R.dtype).eps * norm)
+        if rank == 0:
+            # the basis spans an invariant subspace
+            break
+        block = block[:, :rank]
+        XTblock = X.T @ block
+
+        Q = np.hstack([Q, block])
+        W = np.hstack([W, XTblock])
+
+    U = Q @ Uhat[:, :n_components]
+    if symmetric:
+        V = U.T * np.where(w[:n_components] < 0, -1, 1)[:, None]
+    else:
+        V = V[:n_components]
+    U, V = svd_flip(U, V)
+
+    return U, D, V, n_iter_
+
+
+def _adaptive_svd(
+    X, max_rank=None, tol=1e-7, n_iter=5, block_size=10, random_state=0, symmetric=False
+):
+    """
+    Adaptive-rank randomized SVD.
+
+    The basis of the range of X is grown ``block_size`` columns at a time, as in
+    the adaptive range finder of [1]_. Before each block is added, a Gaussian
+    probe ``X @ G`` projected out of the basis estimates the relative residual
+    ``||X - QQ^T X||_F / ||X||_F``, and the probe, refined by ``n_iter`` power
+    iterations, becomes the next block. Growth stops once the estimated
+    residual is at most ``tol``, or once the spectrum has a gap: the first
+    elbow of ``select_dimension`` on the current singular values is the same for
+    two blocks in a row, and at least ``block_size`` singular values past it
+    were computed. Later elbows are not used, since they drift as more of the
+    spectrum is computed. The basis never exceeds ``max_rank + block_size`` columns.
+
+    The rank is the smallest one whose estimated relative error is at most
+    ``tol`` if the tolerance was reached, and the elbow otherwise, capped at
+    ``max_rank``. Returns U, D, V, the number of blocks added and the estimated
+    relative error ``||X - U D V||_F / ||X||_F``.
+
+    References
+    ----------
+    .. [1] Halko, N., Martinsson, P. G., and Tropp, J. A. (2011). Finding
+        structure with randomness: Probabilistic algorithms for constructing
+        approximate matrix decompositions. SIAM Review, 53(2), pp. 217-288.
+    """
+    random_state = check_random_state(random_state)
+    dtype = X.dtype if X.dtype.kind == "f" else np.dtype(np.float64)
+
+    if max_rank is None:
+        max_rank = min(X.shape) - 1
+    max_basis = min(min(X.shape), max_rank + block_size)
+
+    if isinstance(X, LinearOperator):
+        norm = None
+    elif issparse(X):
+        norm = scipy.sparse.linalg.norm(X)
+    else:
+        norm = np.linalg.norm(X)
+
+    Q = np.empty((X.shape[0], 0), dtype=dtype)
+    # W holds X.T @ Q, which is X @ Q if X is symmetric
+    W = np.empty((X.shape[1], 0), dtype=dtype)
+    D = np.empty(0, dtype=dtype)
+    w = Uhat = V = None
+    previous_elbow = None
+    n_blocks = 0
+    while True:
+        # Probe the residual of the current basis
+        G = random_state.normal(size=(X.shape[1], block_size)).astype(dtype)
+        Y = X @ G
+        if norm is None:
+            # E ||X g||^2 = ||X||_F^2 for a standard Gaussian vector g
+            norm = np.linalg.norm(Y) / np.sqrt(block_size)
+        for _ in range(2):
+            Y = Y - Q @ (Q.T @ Y)
+        error = np.linalg.norm(Y) / np.sqrt(block_size) / norm if norm > 0 else 0.0
+
+        if error <= tol:
+            break
+
+        elbow = None
+        if D.size > 1:
+            elbow = select_dimension(D, n_elbows=1)[0][0]
+            if (elbow == previous_elbow) & (elbow + block_size <= D.size):
+                break
+        previous_elbow = elbow
+
+        if Q.shape[1] >= max_basis:
+            break
+
+        # Next block: the probe, refined by power iterations in the complement
+        # of the basis
+        for _ in range(n_iter):
+            Y, _ = scipy.linalg.qr(Y, mode="economic")
+            Y = X @ Y if symmetric else X @ (X.T @ Y)
+            for _ in range(2):
+                Y = Y - Q @ (Q.T @ Y)
+        Y = Y[:, : max_basis - Q.shape[1]]
+        block, R, _ = scipy.linalg.qr(Y, mode="economic", pivoting=True)
+        threshold = max(X.shape) * np.finfo(R.dtype).eps * np.abs(R[0, 0])
+        rank = np.sum(np.abs(np.diag(R)) > threshold)
+        if rank == 0:
+            # the basis spans the range of X
+            break
+        block = block[:, :rank]
+
+        Q = np.hstack([Q, block])
+        W = np.hstack([W, X.T @ block])
+        n_blocks += 1
+
+        # Rayleigh-Ritz on the current basis
+        if symmetric:
+            T = Q.T @ W
+            w, Uhat = scipy.linalg.eigh((T + T.T) / 2)
+            idx = np.argsort(np.abs(w))[::-1]
+            w, Uhat = w[idx], Uhat[:, idx]
+            D = np.abs(w)
+        else:
+            Uhat, D, V = scipy.linalg.svd(W.T, full_matrices=False)
+
+    # Squared relative error of every rank, from the residual of the basis and
+    # the singular values left out
+    relative = D / norm if norm > 0 else np.zeros_like(D)
+    tail = np.append(np.cumsum((relative ** 2)[::-1])[::-1], 0)
+    errors = np.sqrt(error ** 2 + tail)
+
+    if Q.shape[1] == 0:
+        # X is zero
+        U = np.empty((X.shape[0], 0), dtype=dtype)
+        V = np.empty((0, X.shape[1]), dtype=dtype)
+        return U, D, V, n_blocks, float(error)
+    elif error <= tol:
+        rank = np.argmax(errors <= tol)
+    elif D.size > 1:
+        rank = select_dimension(D, n_elbows=1)[0][0]
+    else:
+        rank = D.size
+    rank = min(rank, max_rank)
+
+    U = Q @ Uhat[:, :rank]
+    D = D[:rank]
+    if symmetric:
+        V = U.T * np.where(w[:rank] < 0, -1, 1)[:, None]
+    else:
+        V = V[:rank]
+    U, V = svd_flip(U, V)
+
+    return U, D, V, n_blocks, float(errors[rank])
+
+
 def select_dimension(
     X, n_components=None, n_elbows=2, threshold=None, return_likelihoods=False
 ):
@@ -68,9 +519,9 @@ def select_dimension(
 
     Parameters
     ----------
-    X : 1d or 2d array-like
+    X : 1d or 2d array-like, or scipy.sparse matrix
         Input array generate profile likelihoods for. If 1d-array, it should be
-        sorted in decreasing order. If 2d-array, shape should be 
+        sorted in decreasing order. If 2d-array or sparse matrix, shape should be
         (n_samples, n_features). 
     n_components : int, optional, default: None.
         Number of components to embed. If None, ``n_components = 
@@ -103,8 +554,8 @@ def select_dimension(
         pp.918-930.
     """
     # Handle input data
-    if not isinstance(X, np.ndarray):
-        msg = "X must be a numpy array, not {}.".format(type(X))
+    if not isinstance(X, np.ndarray) and not issparse(X):
+        msg = "X must be a numpy array or sparse matrix, not {}.".format(type(X))
         raise ValueError(msg)
     if X.ndim > 2:
         msg = "X must be a 1d or 2d-array, not {}d array.".format(X.ndim)
@@ -178,7 +629,22 @@ def select_dimension(
         return elbows, values
 
 
-def selectSVD(X, n_components=None, n_elbows=2, algorithm="randomized", n_iter=5):
+def selectSVD(
+    X,
+    n_components=None,
+    n_elbows=2,
+    algorithm="randomized",
+    n_iter=5,
+    max_components=None,
+    init=None,
+    symmetric=False,
+    tol=1e-7,
+    return_n_iter=False,
+    working_memory=None,
+    n_jobs=None,
+    cache=None,
+    return_error=False,
+):
     r"""
     Dimensionality reduction using SVD.
 
@@ -188,12 +654,22 @@ def selectSVD(X, n_components=None, n_elbows=2, algorithm="randomized", n_iter=5
     SciPy's wrapper for LAPACK or Sklearn's implementation of randomized SVD.
 
     It also performs optimal dimensionality selectiong using Zhu & Godsie algorithm
-    [1]_ if number of target dimension is not specified.
+    [1]_ if number of target dimension is not specified. In that case the matrix
+    is decomposed only once, at rank ``max_components``, and the elbows are found
+    from the resulting singular values before the singular vectors are truncated.
 
     Parameters
     ----------
-    X : array-like, shape (n_samples, n_features)
-        The data to perform svd on.
+    X : array-like, sparse matrix or LinearOperator, shape (n_samples, n_features)
+        The data to perform svd on. Sparse inputs are only densified by the
+        'full' solver; the other solvers work with sparse products.
+        float32 inputs are decomposed in float32 by every solver. Only the
+        profile likelihoods of the dimension selection are computed in float64.
+        A ``np.memmap`` is decomposed out of core by every solver but 'full': it
+        is streamed from disk in row blocks of at most ``working_memory`` MiB,
+        so that 'randomized' reads it in ``2 * n_iter + 2`` sequential passes.
+        A ``scipy.sparse.linalg.LinearOperator`` cannot be decomposed by
+        'full'.
     n_components : int or None, default = None
         Desired dimensionality of output data. If "full", 
         n_components must be <= min(X.shape). Otherwise, n_components must be
@@ -202,8 +678,9 @@ def selectSVD(X, n_components=None, n_elbows=2, algorithm="randomized", n_iter=5
     n_elbows : int, optional, default: 2
         If `n_components=None`, then compute the optimal embedding dimension using
         `select_dimension`. Otherwise, ignored.
-    algorithm : {'randomized' (default), 'full', 'truncated'}, optional
-        SVD solver to use:
+    algorithm : str, optional (default = 'randomized')
+        SVD solver to use, one of 'randomized', 'full', 'truncated', 'krylov'
+        or 'adaptive':
 
         - 'randomized'
             Computes randomized svd using 
@@ -212,10 +689,70 @@ def selectSVD(X, n_components=None, n_elbows=2, algorithm="randomized", n_iter=5
             Computes full svd using ``scipy.linalg.svd``
         - 'truncated'
             Computes truncated svd using ``scipy.sparse.linalg.svd``
+        - 'krylov'
+            Computes randomized block Krylov svd, which is more accurate than
+            'randomized' for slowly decaying spectra, with block products
+            instead of the single vector products of 'truncated'
+        - 'adaptive'
+            Computes randomized svd with a range finder grown in blocks of 10
+            vectors, until the estimated relative error
+            ``||X - U D V||_F / ||X||_F`` is at most ``tol``, or until the
+            first elbow of the singular values found so far is stable. The rank
+            is chosen from the same criteria, ``n_components`` is only its
+            maximum, and ``n_elbows`` is not used. X is decomposed once,
+            without a fixed sketch size.
     n_iter : int, optional (default = 5)
-        Number of iterations for randomized SVD solver. Not used by 'full' or 
+        Number of iterations for randomized SVD solver, the maximum number of
+        blocks added to the Krylov subspace by 'krylov', or the number of power
+        iterations of each block of 'adaptive'. Not used by 'full' or
         'truncated'. The default is larger than the default in randomized_svd 
         to handle sparse matrices that may have large slowly decaying spectrum.
+    max_components : int or None, default = None
+        Rank of the decomposition. If ``n_components=None``, it is searched for
+        elbows, and if None, ``max_components = ceil(log2(min(X.shape)))``.
+        Otherwise, its leading ``n_components`` are returned, and if None,
+        ``max_components = n_components``. Decompositions at a common
+        ``max_components`` are shared through ``cache`` by every
+        ``n_components``. Not used by 'adaptive'.
+    init : array-like, shape (n_features, n_init), or None, default = None
+        Starting basis for the randomized range finder, typically the right
+        singular vectors ``V.T`` of a previous decomposition of a similar matrix.
+        Its columns replace the first columns of the random sketch, so that a
+        converged solution only needs one or two power iterations. Only used by
+        'randomized' and 'krylov'.
+    symmetric : bool, default = False
+        Whether X is symmetric. If True, a symmetric eigendecomposition is used
+        instead of an SVD: ``scipy.linalg.eigh`` for 'full',
+        ``scipy.sparse.linalg.eigsh`` for 'truncated', and a Rayleigh-Ritz step
+        on the randomized range for 'randomized'. The eigenvalues largest in
+        magnitude are kept, and the output is returned in SVD form with
+        ``D = |eigenvalues|`` and ``V = U * sign(eigenvalues)``. 'krylov' then
+        builds the Krylov subspace from products with X alone.
+    tol : float, default = 1e-7
+        Stopping tolerance of 'krylov' on the relative change of the singular
+        values between iterations, or of 'adaptive' on the estimated relative
+        error of the decomposition. Not used by the other solvers.
+    return_n_iter : bool, default = False
+        Whether to also return the number of iterations used.
+    working_memory : int or None, default = None
+        Memory budget in MiB of the row blocks read from a ``np.memmap`` X. If
+        None, the value of ``sklearn.get_config()['working_memory']`` is used.
+        Not used by other inputs, unless ``n_jobs`` is not 1.
+    n_jobs : int or None, default = None
+        Number of processes computing the products of 'randomized' and
+        'krylov'. If not 1, the rows of X are split among a ``joblib`` process
+        pool, which reads X without copying it. Useful for sparse and
+        ``np.memmap`` inputs, whose products are single-threaded. None means 1,
+        and -1 means using all processors. Not used by 'full' or 'truncated',
+        or if X is a LinearOperator.
+    cache : EmbeddingCache or None, default = None
+        Cache of decompositions. If the same X was already decomposed at the
+        same rank with the same parameters, the stored decomposition is
+        truncated or searched for elbows instead of being recomputed. Not used
+        if X is a LinearOperator.
+    return_error : bool, default = False
+        Whether to also return the relative error of the decomposition
+        estimated by 'adaptive'.
 
     Returns
     -------
@@ -225,6 +762,14 @@ def selectSVD(X, n_components=None, n_elbows=2, algorithm="randomized", n_iter=5
         Singular values in decreasing order, as a 1d array.
     V: array-like, shape (n_components, n_samples)
         Right singular vectors corresponding to singular values.
+    n_iter: int or None
+        Number of iterations used by 'randomized' or 'krylov', number of blocks
+        added by 'adaptive', or None for 'full' and 'truncated'. Only returned
+        if ``return_n_iter`` is True.
+    error: float or None
+        Estimated relative error ``||X - U D V||_F / ||X||_F`` for 'adaptive',
+        or None for the other solvers. Only returned if ``return_error`` is
+        True.
 
     References
     ----------
@@ -234,34 +779,157 @@ def selectSVD(X, n_components=None, n_elbows=2, algorithm="randomized", n_iter=5
         pp.918-930.
     """
     # Deal with algorithms
-    if algorithm not in ["full", "truncated", "randomized"]:
-        msg = "algorithm must be one of {full, truncated, randomized}."
+    if algorithm not in ["full", "truncated", "randomized", "krylov", "adaptive"]:
+        msg = (
+            "algorithm must be one of {full, truncated, randomized, krylov, adaptive}."
+        )
         raise ValueError(msg)
 
-    if n_components is None:
-        elbows, _ = select_dimension(X, n_elbows=n_elbows, threshold=None)
-        n_components = elbows[-1]
+    if max_components is None:
+        pass
+    elif not isinstance(max_components, int):
+        msg = "max_components must be an integer, not {}.".format(type(max_components))
+        raise ValueError(msg)
+    elif max_components < 1:
+        msg = "max_components must be >= 1, not {}.".format(max_components)
+        raise ValueError(msg)
+
+    if (algorithm == "adaptive") and not (0 < tol < 1):
+        msg = "tol must be in (0, 1) for algorithm 'adaptive', not {}.".format(tol)
+        raise ValueError(msg)
+
+    if algorithm == "adaptive":
+        k = n_components
+    elif n_components is None:
+        if max_components is None:
+            # per recommendation by Zhu & Godsie
+            max_components = int(np.ceil(np.log2(np.min(X.shape))))
+        k = max_components
+    elif max_components is None:
+        k = n_components
+    elif max_components < n_components:
+        msg = "max_components must be >= n_components."
+        raise ValueError(msg)
+    else:
+        k = max_components
+
+    # The decomposition at rank k is cached before the dimension is selected,
+    # so that it is shared by every n_components <= k.
+    key = None
+    entry = None
+    if (cache is not None) & (not isinstance(X, LinearOperator)):
+        key = cache.make_key(
+            X,
+            rank=k,
+            algorithm=algorithm,
+            n_iter=n_iter,
+            init=init,
+            symmetric=symmetric,
+            tol=tol,
+        )
+        entry = cache.get(key)
+
+    if entry is not None:
+        U, D, V = entry["U"], entry["D"], entry["V"]
+        n_iter_ = None if entry["n_iter"] < 0 else int(entry["n_iter"])
+        error = float(entry.get("error", np.nan))
+        error = None if np.isnan(error) else error
+        if algorithm != "adaptive":
+            U, D, V = _select_components(U, D, V, n_components, n_elbows)
+        return _svd_output(U, D, V, n_iter_, error, return_n_iter, return_error)
+
+    # Row-blocked products, out of core for memmaps and in parallel if n_jobs > 1
+    if algorithm not in ["randomized", "krylov", "adaptive"]:
+        n_jobs = None
+    parallel = (effective_n_jobs(n_jobs) > 1) & (not isinstance(X, LinearOperator))
+    if ((algorithm != "full") & isinstance(X, np.memmap)) or parallel:
+        X = _RowBlockOperator(X, working_memory=working_memory, n_jobs=n_jobs)
+
+    if (algorithm == "full") & isinstance(X, LinearOperator):
+        msg = "algorithm must not be 'full' for a LinearOperator."
+        raise ValueError(msg)
 
     # Check
-    if (algorithm == "full") & (n_components > min(X.shape)):
+    if k is None:
+        pass
+    elif (algorithm == "full") & (k > min(X.shape)):
         msg = "n_components must be <= min(X.shape)."
         raise ValueError(msg)
-    elif algorithm == "full":
-        U, D, V = scipy.linalg.svd(X)
-        U = U[:, :n_components]
-        D = D[:n_components]
-        V = V[:n_components, :]
-
-    if (algorithm in ["truncated", "randomized"]) & (n_components >= min(X.shape)):
+    elif (algorithm != "full") & (k >= min(X.shape)):
         msg = "n_components must be strictly < min(X.shape)."
         raise ValueError(msg)
+
+    n_iter_ = n_iter if algorithm == "randomized" else None
+    error = None
+
+    if algorithm == "adaptive":
+        U, D, V, n_iter_, error = _adaptive_svd(
+            X, max_rank=k, tol=tol, n_iter=n_iter, symmetric=symmetric
+        )
+    elif algorithm == "krylov":
+        U, D, V, n_iter_ = _block_krylov_svd(
+            X, k, n_iter=n_iter, tol=tol, init=init, symmetric=symmetric
+        )
+    elif symmetric:
+        U, D, V = _symmetric_svd(X, k, algorithm=algorithm, n_iter=n_iter, init=init)
+    elif algorithm == "full":
+        if issparse(X):
+            X = X.toarray()
+        U, D, V = scipy.linalg.svd(X)
+        U = U[:, :k]
+        D = D[:k]
+        V = V[:k, :]
     elif algorithm == "truncated":
-        U, D, V = scipy.sparse.linalg.svds(X, k=n_components)
+        U, D, V = scipy.sparse.linalg.svds(X, k=k)
         idx = np.argsort(D)[::-1]  # sort in decreasing order
         D = D[idx]
         U = U[:, idx]
         V = V[idx, :]
+    elif (algorithm == "randomized") & (
+        isinstance(X, LinearOperator) or init is not None
+    ):
+        U, D, V = _randomized_svd(X, k, n_iter=n_iter, init=init)
     elif algorithm == "randomized":
-        U, D, V = sklearn.utils.extmath.randomized_svd(X, n_components, n_iter=n_iter)
+        U, D, V = sklearn.utils.extmath.randomized_svd(X, k, n_iter=n_iter)
+
+    if key is not None:
+        cache.put(
+            key,
+            U=U,
+            D=D,
+            V=V,
+            n_iter=-1 if n_iter_ is None else n_iter_,
+            error=np.nan if error is None else error,
+        )
+
+    if algorithm != "adaptive":
+        U, D, V = _select_components(U, D, V, n_components, n_elbows)
+    return _svd_output(U, D, V, n_iter_, error, return_n_iter, return_error)
 
+
+def _select_components(U, D, V, n_components, n_elbows):
+    """
+    Truncates a decomposition to n_components, or to the dimension selected
+    from its singular values if n_components is None.
+    """
+    if (n_components is None) and (D.size > 1):
+        elbows, _ = select_dimension(D, n_elbows=n_elbows, threshold=None)
+        n_components = elbows[-1]
+    if n_components is not None:
+        U = U[:, :n_components]
+        D = D[:n_components]
+        V = V[:n_components, :]
     return U, D, V
+
+
+def _svd_output(U, D, V, n_iter, error, return_n_iter, return_error):
+    """
+    Returns the outputs of ``selectSVD`` requested by ``return_n_iter`` and
+    ``return_error``.
+    """
+    out = (U, D, V)
+    if return_n_iter:
+        out += (n_iter,)
+    if return_error:
+        out += (error,)
+    return out
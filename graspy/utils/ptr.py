@@ -13,11 +13,11 @@
 # limitations under the License.
 
 import numpy as np
-from .utils import import_graph, is_unweighted, is_symmetric, is_loopless, symmetrize
+from .utils import import_graph, symmetrize
 from scipy.stats import rankdata
 
 
-def pass_to_ranks(graph, method="simple-nonzero"):
+def pass_to_ranks(graph, method="simple-nonzero", properties=None):
     r"""
     Rescales edge weights of an adjacency matrix based on their relative rank in 
     the graph. 
@@ -44,6 +44,10 @@ def pass_to_ranks(graph, method="simple-nonzero"):
             of possible edges). Ties settled by the average of the weight that those
             edges would have received. Number of possible edges is determined 
             by the type of graph (loopless or looped, directed or undirected).
+
+    properties: GraphProperties or None, optional (default=None)
+        Already known properties of the graph. If None, they are computed once
+        from the graph.
         
         
         
@@ -57,9 +61,14 @@ def pass_to_ranks(graph, method="simple-nonzero"):
         Adjacency matrix of graph after being passed to ranks
     """
 
-    graph = import_graph(graph)  # just for typechecking
+    graph, graph_properties = import_graph(graph, return_properties=True)
+    if properties is None:
+        properties = graph_properties
+    if isinstance(graph, np.memmap):
+        # memmaps are not copied by import_graph, and graph is modified below
+        graph = np.array(graph)
 
-    if is_unweighted(graph):
+    if properties.unweighted:
         return graph
 
     if graph.min() < 0:
@@ -69,7 +78,7 @@ def pass_to_ranks(graph, method="simple-nonzero"):
         )
 
     if method == "zero-boost":
-        if is_symmetric(graph):
+        if properties.symmetric:
             # start by working with half of the graph, since symmetric
             triu = np.triu(graph)
             non_zeros = triu[triu != 0]
@@ -77,8 +86,8 @@ def pass_to_ranks(graph, method="simple-nonzero"):
             non_zeros = graph[graph != 0]
         rank = rankdata(non_zeros)
 
-        if is_symmetric(graph):
-            if is_loopless(graph):
+        if properties.symmetric:
+            if properties.loopless:
                 num_zeros = (len(graph[graph == 0]) - graph.shape[0]) / 2
                 possible_edges = graph.shape[0] * (graph.shape[0] - 1) / 2
             else:
@@ -87,7 +96,7 @@ def pass_to_ranks(graph, method="simple-nonzero"):
                 )
                 possible_edges = graph.shape[0] * (graph.shape[0] + 1) / 2
         else:
-            if is_loopless(graph):
+            if properties.loopless:
                 # n^2 - num_nonzero - num_diagonal
                 num_zeros = graph.size - len(non_zeros) - graph.shape[0]
                 # n^2 - num_diagonal
@@ -101,7 +110,7 @@ def pass_to_ranks(graph, method="simple-nonzero"):
         # normalize by the number of possible edges for this kind of graph
         rank = rank / possible_edges
         # put back into matrix form (and reflect over the diagonal if necessary)
-        if is_symmetric(graph):
+        if properties.symmetric:
             triu[triu != 0] = rank
             graph = symmetrize(triu, method="triu")
         else:
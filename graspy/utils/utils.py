@@ -19,10 +19,12 @@ from pathlib import Path
 
 import networkx as nx
 import numpy as np
+from scipy.sparse import csgraph, diags, issparse
+from sklearn import get_config
 from sklearn.utils import check_array
 
 
-def import_graph(graph):
+def import_graph(graph, dtype=None, return_properties=False):
     """
     A function for reading a graph and returning a shared data type. 
 
@@ -30,33 +32,82 @@ def import_graph(graph):
     ----------
     graph: object
         Either array-like, shape (n_vertices, n_vertices) numpy array,
-        or an object of type networkx.Graph.
+        a scipy.sparse matrix, or an object of type networkx.Graph.
+
+    dtype: {None (default), np.float64, np.float32}, optional
+        Data type of the output. If None, float32 arrays are kept as float32
+        and everything else is converted to float64.
+
+    return_properties: bool, optional (default=False)
+        Whether to also return a ``GraphProperties`` of the output, with the
+        properties that follow from the input type already set: an undirected
+        networkx graph is symmetric, and its self-loops are known.
 
     Returns
     -------
     out: array-like, shape (n_vertices, n_vertices)
-        A graph.
+        A graph. Sparse inputs are kept sparse, in CSR or CSC format.
+        2-dimensional ``np.memmap`` inputs that already have the requested
+        float dtype are returned as is, without being read into memory.
+
+    properties: GraphProperties
+        Structural properties of the output. Only returned if
+        ``return_properties`` is True.
         
     See Also
     --------
-    networkx.Graph, numpy.array
+    networkx.Graph, numpy.array, scipy.sparse.csr_matrix
 	"""
+    # allowed dtypes, the first one being used for conversions
+    if dtype is None:
+        dtypes = [np.float64, np.float32]
+    elif np.dtype(dtype) in [np.float64, np.float32]:
+        dtypes = [np.dtype(dtype)]
+    else:
+        msg = "dtype must be np.float64, np.float32 or None, not {}.".format(dtype)
+        raise ValueError(msg)
+
+    known = {}
     if isinstance(graph, (nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph)):
-        out = nx.to_numpy_array(graph, nodelist=sorted(graph.nodes), dtype=np.float)
+        out = nx.to_numpy_array(graph, nodelist=sorted(graph.nodes), dtype=dtypes[0])
+        if not graph.is_directed():
+            known["symmetric"] = True
+        known["loopless"] = nx.number_of_selfloops(graph) == 0
+    elif isinstance(graph, np.memmap) and graph.ndim == 2 and graph.dtype in dtypes:
+        # out-of-core graphs are validated without being loaded
+        if graph.shape[0] != graph.shape[1]:
+            msg = "Input must be a square matrix, not of shape {}.".format(graph.shape)
+            raise ValueError(msg)
+        out = graph
     elif isinstance(graph, (np.ndarray, np.memmap)):
         maximum = np.max(graph.shape)
         out = check_array(
             graph,
-            dtype=[np.float64, np.float32],
+            dtype=dtypes,
             ensure_2d=True,
             allow_nd=True,  # For omni tensor input
             ensure_min_features=maximum,
             ensure_min_samples=maximum,
             copy=True,
         )
+    elif issparse(graph):
+        maximum = np.max(graph.shape)
+        out = check_array(
+            graph,
+            accept_sparse=["csr", "csc"],
+            dtype=dtypes,
+            ensure_2d=True,
+            ensure_min_features=maximum,
+            ensure_min_samples=maximum,
+            copy=True,
+        )
     else:
-        msg = "Input must be networkx.Graph or np.array, not {}.".format(type(graph))
+        msg = "Input must be networkx.Graph, np.array or scipy.sparse matrix, not {}."
+        msg = msg.format(type(graph))
         raise TypeError(msg)
+
+    if return_properties:
+        return out, GraphProperties(out, **known)
     return out
 
 
@@ -145,21 +196,56 @@ def import_edgelist(
 
 
 def is_symmetric(X):
+    if issparse(X):
+        return X.shape[0] == X.shape[1] and (X != X.T).nnz == 0
     return np.array_equal(X, X.T)
 
 
 def is_loopless(X):
+    if issparse(X):
+        return not np.any(X.diagonal() != 0)
     return not np.any(np.diag(X) != 0)
 
 
 def is_unweighted(X):
+    if issparse(X):
+        return ((X.data == 0) | (X.data == 1)).all()
     return ((X == 0) | (X == 1)).all()
 
 
 def is_almost_symmetric(X, atol=1e-15):
+    if X.shape[0] != X.shape[1]:
+        return False
+    if issparse(X):
+        # same criterion as np.allclose, with its default rtol
+        diff = abs(X - X.T) - 1e-05 * abs(X.T)
+        return diff.nnz == 0 or diff.max() <= atol
+    if isinstance(X, np.memmap):
+        return _is_almost_symmetric_blocked(X, atol=atol)
     return np.allclose(X, X.T, atol=atol)
 
 
+def _is_almost_symmetric_blocked(X, atol=1e-15, working_memory=None):
+    """
+    Compares the square tiles (i, j) and (j, i) of X one pair at a time, so
+    that an out-of-core X is read about twice with at most ``working_memory``
+    MiB in memory.
+    """
+    if working_memory is None:
+        working_memory = get_config()["working_memory"]
+    n = X.shape[0]
+    block = int(np.sqrt(working_memory * 2 ** 20 / (2 * X.dtype.itemsize)))
+    block = min(max(block, 1), n)
+
+    for i in range(0, n, block):
+        for j in range(i, n, block):
+            upper = X[i : i + block, j : j + block]
+            lower = X[j : j + block, i : i + block]
+            if not np.allclose(upper, lower.T, atol=atol):
+                return False
+    return True
+
+
 def symmetrize(graph, method="triu"):
     """
     A function for forcing symmetry upon a graph.
@@ -223,7 +309,7 @@ def remove_loops(graph):
     return graph
 
 
-def to_laplace(graph, form="DAD", regularizer=None):
+def to_laplace(graph, form="DAD", regularizer=None, dtype=None, properties=None):
     r"""
     A function to convert graph adjacency matrix to graph laplacian. 
 
@@ -237,7 +323,7 @@ def to_laplace(graph, form="DAD", regularizer=None):
     ----------
     graph: object
         Either array-like, (n_vertices, n_vertices) numpy array,
-        or an object of type networkx.Graph.
+        a scipy.sparse matrix, or an object of type networkx.Graph.
 
     form: {'I-DAD' (default), 'DAD', 'R-DAD'}, string, optional
         
@@ -253,11 +339,19 @@ def to_laplace(graph, form="DAD", regularizer=None):
         node degree is added. If int or float, must be >= 0. Only used when 
         ``form`` == 'R-DAD'.
 
+    dtype: {None (default), np.float64, np.float32}, optional
+        Data type of the laplacian. If None, float32 graphs give a float32
+        laplacian and other graphs a float64 laplacian.
+
+    properties: GraphProperties or None, optional (default=None)
+        Already known properties of the graph, used to skip the symmetry
+        check. If None, the check is run.
+
     Returns
     -------
-    L: numpy.ndarray
+    L: numpy.ndarray or scipy.sparse matrix
         2D (n_vertices, n_vertices) array representing graph 
-        laplacian of specified form
+        laplacian of specified form. Sparse if the input graph is sparse.
 	
     References
     ----------
@@ -269,12 +363,14 @@ def to_laplace(graph, form="DAD", regularizer=None):
     if form not in valid_inputs:
         raise TypeError("Unsuported Laplacian normalization")
 
-    A = import_graph(graph)
+    A, graph_properties = import_graph(graph, dtype=dtype, return_properties=True)
+    if properties is None:
+        properties = graph_properties
 
-    if not is_almost_symmetric(A):
+    if not properties.almost_symmetric:
         raise ValueError("Laplacian not implemented/defined for directed graphs")
 
-    D_vec = np.sum(A, axis=0)
+    D_vec = np.asarray(A.sum(axis=0)).ravel()
     # regularize laplacian with parameter
     # set to average degree
     if form == "R-DAD":
@@ -291,14 +387,29 @@ def to_laplace(graph, form="DAD", regularizer=None):
     with np.errstate(divide="ignore"):
         D_root = 1 / np.sqrt(D_vec)  # this is 10x faster than ** -0.5
     D_root[np.isinf(D_root)] = 0
-    D_root = np.diag(D_root)  # just change to sparse diag for sparse support
 
+    if issparse(A):
+        D_root = diags(D_root, format=A.format)
+        if form == "I-DAD":
+            L = diags(D_vec, format=A.format) - A
+            L = D_root @ L @ D_root
+        elif form == "DAD" or form == "R-DAD":
+            L = D_root @ A @ D_root
+        L = (L + L.T) / 2  # sometimes machine prec. makes this necessary
+        return L.asformat(A.format)
+
+    # scale rows and columns by broadcasting, in place, rather than multiplying
+    # by dense diagonal matrices. import_graph copies A, except for memmaps
+    L = np.array(A) if isinstance(A, np.memmap) else A
     if form == "I-DAD":
-        L = np.diag(D_vec) - A
-        L = D_root @ L @ D_root
-    elif form == "DAD" or form == "R-DAD":
-        L = D_root @ A @ D_root
-    return symmetrize(L, method="avg")  # sometimes machine prec. makes this necessary
+        np.negative(L, out=L)
+        L[np.diag_indices_from(L)] += D_vec
+    L *= D_root[:, np.newaxis]
+    L *= D_root[np.newaxis, :]
+    # sometimes machine prec. makes this necessary
+    L += L.T
+    L /= 2
+    return L
 
 
 def is_fully_connected(graph):
@@ -313,9 +424,10 @@ def is_fully_connected(graph):
 
     Parameters
     ----------
-    graph: nx.Graph, nx.DiGraph, nx.MultiDiGraph, nx.MultiGraph, np.ndarray
-        Input graph in any of the above specified formats. If np.ndarray, 
-        interpreted as an :math:`n \times n` adjacency matrix
+    graph: nx.Graph, nx.DiGraph, nx.MultiDiGraph, nx.MultiGraph, np.ndarray,
+        scipy.sparse matrix
+        Input graph in any of the above specified formats. If np.ndarray or
+        sparse matrix, interpreted as an :math:`n \times n` adjacency matrix
 
     Returns
     -------
@@ -327,18 +439,91 @@ def is_fully_connected(graph):
         http://mathworld.wolfram.com/WeaklyConnectedDigraph.html
 
     """
-    if type(graph) is np.ndarray:
-        if is_symmetric(graph):
-            g_object = nx.Graph()
-        else:
-            g_object = nx.DiGraph()
-        graph = nx.from_numpy_array(graph, create_using=g_object)
+    if issparse(graph) or isinstance(graph, np.ndarray):
+        # arrays, including np.memmap, are checked without networkx
+        n_components = csgraph.connected_components(
+            graph, directed=True, connection="weak", return_labels=False
+        )
+        return n_components == 1
     if type(graph) in [nx.Graph, nx.MultiGraph]:
         return nx.is_connected(graph)
     elif type(graph) in [nx.DiGraph, nx.MultiDiGraph]:
         return nx.is_weakly_connected(graph)
 
 
+class GraphProperties:
+    """
+    Structural properties of a graph, each computed at most once.
+
+    ``is_symmetric``, ``is_almost_symmetric``, ``is_loopless``,
+    ``is_unweighted`` and ``is_fully_connected`` each scan the whole adjacency
+    matrix. A GraphProperties object runs a check the first time its property is
+    accessed and caches the result, so that the functions it is handed to share
+    the scans. Values known in advance, such as the symmetry of an undirected
+    networkx.Graph, can be given to the constructor and are never computed.
+    The graph must not be modified while the object is in use.
+
+    Parameters
+    ----------
+    graph: array-like or scipy.sparse matrix, shape (n_vertices, n_vertices)
+        Adjacency matrix, as returned by ``import_graph``.
+
+    symmetric, almost_symmetric, loopless, unweighted, fully_connected: bool or None
+        Known values of the properties. If None, computed when first accessed.
+
+    See Also
+    --------
+    graspy.utils.import_graph
+    """
+
+    def __init__(
+        self,
+        graph,
+        symmetric=None,
+        almost_symmetric=None,
+        loopless=None,
+        unweighted=None,
+        fully_connected=None,
+    ):
+        self.graph = graph
+        self._values = {
+            "symmetric": symmetric,
+            "almost_symmetric": almost_symmetric,
+            "loopless": loopless,
+            "unweighted": unweighted,
+            "fully_connected": fully_connected,
+        }
+
+    def _get(self, name, check):
+        if self._values[name] is None:
+            self._values[name] = bool(check(self.graph))
+        return self._values[name]
+
+    @property
+    def symmetric(self):
+        if self._values["almost_symmetric"] is False:
+            return False
+        return self._get("symmetric", is_symmetric)
+
+    @property
+    def almost_symmetric(self):
+        if self._values["symmetric"] is True:
+            return True
+        return self._get("almost_symmetric", is_almost_symmetric)
+
+    @property
+    def loopless(self):
+        return self._get("loopless", is_loopless)
+
+    @property
+    def unweighted(self):
+        return self._get("unweighted", is_unweighted)
+
+    @property
+    def fully_connected(self):
+        return self._get("fully_connected", is_fully_connected)
+
+
 def get_lcc(graph, return_inds=False):
     r"""
     Finds the largest connected component for the input graph. 
@@ -368,7 +553,7 @@ def get_lcc(graph, return_inds=False):
     """
 
     input_ndarray = False
-    if type(graph) is np.ndarray:
+    if isinstance(graph, np.ndarray):
         input_ndarray = True
         if is_symmetric(graph):
             g_object = nx.Graph()
@@ -480,7 +665,7 @@ def get_multigraph_intersect_lcc(graphs, return_inds=False):
     inds_intersection = reduce(np.intersect1d, inds_by_graph)
     new_graphs = []
     for graph in graphs:
-        if type(graph) is np.ndarray:
+        if isinstance(graph, np.ndarray):
             lcc = graph[inds_intersection, :][:, inds_intersection]
         else:
             lcc = graph.subgraph(inds_intersection).copy()
@@ -500,7 +685,7 @@ def get_multigraph_intersect_lcc(graphs, return_inds=False):
         )
         # new inds intersection are the indices of new_graph that were kept on recurse
         # need to do this because indices could have shifted during recursion
-        if type(graphs[0]) is np.ndarray:
+        if isinstance(graphs[0], np.ndarray):
             inds_intersection = inds_intersection[new_inds_intersection]
         else:
             inds_intersection = new_inds_intersection
@@ -534,5 +719,5 @@ def augment_diagonal(graph, weight=1):
     # ignore self loops in either case
     degrees = np.count_nonzero(graph, axis=1)
     diag = weight * degrees / divisor
-    graph += np.diag(diag)
+    graph = graph + np.diag(diag)
     return graph
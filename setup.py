@@ -12,6 +12,7 @@ AUTHOR_EMAIL = "j1c@jhu.edu"
 URL = "https://github.com/neurodata/graspy"
 MINIMUM_PYTHON_VERSION = 3, 5  # Minimum of Python 3.5
 REQUIRED_PACKAGES = [
+    "joblib>=0.11",
     "networkx>=2.1",
     "numpy>=1.8.1",
     "scikit-learn>=0.19.1",
@@ -57,3 +57,27 @@ class TestBaseEmbed(unittest.TestCase):
         embed = BaseEmbed(n_components=self.n, algorithm="randomized")
         with self.assertRaises(ValueError):
             embed._reduce_dim(self.A)
+
+    def test_warm_start(self):
+        np.random.seed(1)
+        X = np.random.dirichlet([1, 1, 1], size=200)
+        P = X @ X.T
+        A1 = np.random.binomial(1, P).astype(float)
+        A2 = A1.copy()
+        A2[:5] = np.random.binomial(1, P[:5])
+        expected = np.linalg.svd(A2, compute_uv=False)[:3]
+
+        warm = BaseEmbed(n_components=3, n_iter=1, warm_start=True)
+        warm._reduce_dim(A1)
+        warm._reduce_dim(A2)
+
+        cold = BaseEmbed(n_components=3, n_iter=1)
+        cold._reduce_dim(A2)
+
+        warm_error = np.abs(warm.singular_values_ - expected).max()
+        cold_error = np.abs(cold.singular_values_ - expected).max()
+        self.assertTrue(warm_error < cold_error / 10)
+
+        # cannot warm start from a graph of a different size
+        warm._reduce_dim(A2[:100, :100])
+        self.assertEqual(warm.latent_left_.shape, (100, 3))
@@ -0,0 +1,105 @@
+from unittest import mock
+
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+
+from graspy.embed.ase import AdjacencySpectralEmbed
+from graspy.embed.batch import BatchEmbed
+from graspy.embed.lse import LaplacianSpectralEmbed
+from graspy.embed.mase import MultipleASE
+from graspy.embed.omni import OmnibusEmbed
+from graspy.simulations.simulations import sbm
+
+
+def generate_data(n_graphs=4, seed=1):
+    np.random.seed(seed)
+    p = [[0.8, 0.1], [0.1, 0.8]]
+    return np.array([sbm([25, 25], p) for _ in range(n_graphs)])
+
+
+def test_bad_inputs():
+    with pytest.raises(TypeError):
+        BatchEmbed(estimator=OmnibusEmbed())
+
+    with pytest.raises(TypeError):
+        BatchEmbed(estimator=MultipleASE())
+
+    with pytest.raises(TypeError):
+        BatchEmbed(n_components=1.5)
+
+    with pytest.raises(ValueError):
+        BatchEmbed(n_components=0)
+
+    with pytest.raises(ValueError):
+        BatchEmbed(prefer="gpu")
+
+    with pytest.raises(ValueError):
+        BatchEmbed().fit([])
+
+    with pytest.raises(ValueError):
+        graphs = [np.ones((5, 5)), np.ones((6, 6))]
+        BatchEmbed().fit(graphs)
+
+
+def test_matches_single_embeddings():
+    graphs = generate_data()
+    ase = AdjacencySpectralEmbed(n_components=2, algorithm="full")
+
+    for n_jobs, prefer in [(None, "threads"), (2, "threads"), (2, "processes")]:
+        batch = BatchEmbed(ase, n_jobs=n_jobs, prefer=prefer)
+        Xhats = batch.fit_transform(graphs)
+        assert_equal(Xhats.shape, (4, 50, 2))
+        assert_equal(batch.singular_values_.shape, (4, 2))
+        assert_equal(batch.n_components_, [2, 2, 2, 2])
+        assert batch.latent_right_ is None
+
+        for graph, Xhat, D in zip(graphs, Xhats, batch.singular_values_):
+            assert_allclose(ase.fit_transform(graph), Xhat)
+            assert_allclose(ase.singular_values_, D)
+
+
+def test_n_components():
+    graphs = generate_data()
+    lse = LaplacianSpectralEmbed(n_components=1)
+
+    batch = BatchEmbed(lse, n_components=3).fit(list(graphs))
+    assert_equal(batch.latent_left_.shape, (4, 50, 3))
+    assert_equal(batch.estimator.n_components, 1)
+
+    # dimensions chosen per graph are padded with zeros
+    batch = BatchEmbed().fit(graphs)
+    d = batch.n_components_.max()
+    assert_equal(batch.latent_left_.shape, (4, 50, d))
+    for Xhat, D, n_components in zip(
+        batch.latent_left_, batch.singular_values_, batch.n_components_
+    ):
+        assert np.all(Xhat[:, n_components:] == 0)
+        assert np.all(D[n_components:] == 0)
+
+
+def test_directed():
+    np.random.seed(2)
+    graphs = generate_data(n_graphs=2)
+    graphs[0] = np.random.binomial(1, 0.3, size=(50, 50))
+
+    Xhat_left, Xhat_right = BatchEmbed(n_components=2).fit_transform(graphs)
+    assert_equal(Xhat_left.shape, (2, 50, 2))
+    assert_equal(Xhat_right.shape, (2, 50, 2))
+    assert_allclose(Xhat_left[1], Xhat_right[1])
+
+
+def test_graphs_imported_once():
+    graphs = generate_data()
+
+    for estimator in [AdjacencySpectralEmbed(), LaplacianSpectralEmbed()]:
+        for n_components in [None, 2]:
+            batch = BatchEmbed(estimator, n_components=n_components)
+            with mock.patch(
+                "graspy.embed.{}.import_graph".format(
+                    "ase" if isinstance(estimator, AdjacencySpectralEmbed) else "lse"
+                )
+            ) as import_graph:
+                batch.fit(graphs)
+            assert_equal(import_graph.call_count, 0)
+            assert_equal(batch.latent_left_.shape[:2], (4, 50))
@@ -0,0 +1,123 @@
+import pytest
+import numpy as np
+from numpy.testing import assert_equal
+from scipy.sparse import csr_matrix
+from sklearn.base import clone
+
+from graspy.embed.ase import AdjacencySpectralEmbed
+from graspy.embed.cache import EmbeddingCache
+from graspy.embed.svd import selectSVD
+from graspy.simulations.simulations import sbm
+
+
+def generate_data(seed=1):
+    np.random.seed(seed)
+    return sbm([25, 25], [[0.8, 0.1], [0.1, 0.8]])
+
+
+def test_bad_inputs():
+    with pytest.raises(TypeError):
+        EmbeddingCache(max_entries=1.5)
+
+    with pytest.raises(ValueError):
+        EmbeddingCache(max_bytes=0)
+
+
+@pytest.mark.parametrize("on_disk", [False, True])
+def test_hits_and_misses(tmp_path, on_disk):
+    cache = EmbeddingCache(path=str(tmp_path) if on_disk else None)
+    A = generate_data()
+
+    U, D, V = selectSVD(A, n_components=2, cache=cache)
+    assert_equal((cache.hits, cache.misses, len(cache)), (0, 1, 1))
+
+    # same contents in a different buffer and format
+    for X in [A.copy(), np.asfortranarray(A)]:
+        U_, D_, V_ = selectSVD(X, n_components=2, cache=cache)
+        assert_equal(U, U_)
+        assert_equal(D, D_)
+        assert_equal(V, V_)
+    assert_equal((cache.hits, cache.misses), (2, 1))
+
+    # different parameters, graphs or dtypes
+    selectSVD(A, n_components=3, cache=cache)
+    selectSVD(A, n_components=2, algorithm="full", cache=cache)
+    selectSVD(generate_data(seed=2), n_components=2, cache=cache)
+    selectSVD(A.astype(np.float32), n_components=2, cache=cache)
+    selectSVD(csr_matrix(A), n_components=2, cache=cache)
+    assert_equal((cache.hits, cache.misses, len(cache)), (2, 6, 6))
+
+    # modifying the output does not modify the cache
+    U, _, _ = selectSVD(A, n_components=2, cache=cache)
+    U[:] = 0
+    U, _, _ = selectSVD(A, n_components=2, cache=cache)
+    assert np.any(U != 0)
+
+    cache.clear()
+    assert_equal((cache.hits, cache.misses, len(cache)), (0, 0, 0))
+
+
+@pytest.mark.parametrize("on_disk", [False, True])
+def test_eviction(tmp_path, on_disk):
+    path = str(tmp_path) if on_disk else None
+    graphs = [generate_data(seed) for seed in range(3)]
+
+    cache = EmbeddingCache(max_entries=2, path=path)
+    for A in graphs:
+        selectSVD(A, n_components=2, cache=cache)
+    assert_equal(len(cache), 2)
+
+    # the least recently used entry was evicted
+    selectSVD(graphs[2], n_components=2, cache=cache)
+    selectSVD(graphs[0], n_components=2, cache=cache)
+    assert_equal((cache.hits, cache.misses), (1, 4))
+
+    path = str(tmp_path / "small") if on_disk else None
+    cache = EmbeddingCache(max_bytes=100, path=path)
+    selectSVD(graphs[0], n_components=2, cache=cache)
+    assert_equal(len(cache), 0)
+
+
+def test_estimator_cache():
+    cache = EmbeddingCache()
+    A = generate_data()
+
+    ase = AdjacencySpectralEmbed(n_components=2, cache=cache)
+    Xhat = ase.fit_transform(A)
+
+    # clones share the cache
+    ase_clone = clone(ase)
+    assert ase_clone.cache is cache
+    assert_equal(ase_clone.fit_transform(A), Xhat)
+    assert_equal(ase_clone.singular_values_, ase.singular_values_)
+    assert_equal(ase_clone.n_iter_, ase.n_iter_)
+    assert_equal(cache.hits, 1)
+
+
+def test_shared_rank():
+    cache = EmbeddingCache()
+    A = generate_data()
+
+    U, D, V = selectSVD(A, n_components=4, cache=cache)
+    for n_components in [None, 1, 2, 4]:
+        U_, D_, V_ = selectSVD(
+            A, n_components=n_components, max_components=4, cache=cache
+        )
+        assert_equal(D_, D[: D_.size])
+        assert_equal(U_, U[:, : D_.size])
+        assert_equal(V_, V[: D_.size])
+    assert_equal((cache.hits, cache.misses, len(cache)), (4, 1, 1))
+
+
+def test_estimator_shared_rank():
+    cache = EmbeddingCache()
+    A = generate_data()
+
+    # as in a grid search over n_components, cloned estimators share one
+    # decomposition of the graph
+    ase = AdjacencySpectralEmbed(max_components=8, cache=cache)
+    Xhat = clone(ase).set_params(n_components=8).fit_transform(A)
+    for n_components in [2, 4]:
+        X = clone(ase).set_params(n_components=n_components).fit_transform(A)
+        assert_equal(X, Xhat[:, :n_components])
+    assert_equal((cache.hits, cache.misses), (2, 1))
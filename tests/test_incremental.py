@@ -0,0 +1,124 @@
+from unittest import mock
+
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+from scipy.sparse import csr_matrix
+
+from graspy.embed.ase import AdjacencySpectralEmbed
+from graspy.embed.incremental import IncrementalAdjacencySpectralEmbed
+from graspy.simulations.simulations import sbm
+from graspy.utils import import_graph, symmetrize
+
+
+def generate_data(directed=False, seed=1):
+    np.random.seed(seed)
+    p = [[0.5, 0.1], [0.1, 0.5]]
+    return sbm([100, 100], p, directed=directed)
+
+
+def flip_edges(A, n_edges, directed=False):
+    """Returns the delta that toggles n_edges random edges of A."""
+    n = A.shape[0]
+    delta = np.zeros_like(A)
+    rows = np.random.randint(n, size=n_edges)
+    cols = np.random.randint(n, size=n_edges)
+    delta[rows, cols] = 1 - 2 * A[rows, cols]
+    np.fill_diagonal(delta, 0)
+    if not directed:
+        delta = symmetrize(delta, method="triu")
+    return csr_matrix(delta)
+
+
+def projection(X):
+    Q, _ = np.linalg.qr(X)
+    return Q @ Q.T
+
+
+def test_bad_inputs():
+    with pytest.raises(TypeError):
+        IncrementalAdjacencySpectralEmbed(refit_threshold="1")
+
+    with pytest.raises(ValueError):
+        IncrementalAdjacencySpectralEmbed(refit_threshold=-1)
+
+    A = generate_data()
+    iase = IncrementalAdjacencySpectralEmbed(n_components=2)
+    iase.fit(A)
+
+    with pytest.raises(ValueError):
+        iase.update(np.zeros((10, 10)))
+
+    with pytest.raises(ValueError):
+        delta = np.zeros_like(A)
+        delta[0, 1] = 1
+        iase.update(delta)
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_update(directed):
+    A = generate_data(directed=directed)
+    iase = IncrementalAdjacencySpectralEmbed(
+        n_components=2, algorithm="full", refit_threshold=np.inf
+    )
+    iase.fit(csr_matrix(A))
+
+    for _ in range(3):
+        delta = flip_edges(A, 50, directed=directed)
+        A = A + delta.toarray()
+        iase.update(delta)
+    assert_equal(iase.graph_.toarray(), A)
+    assert_equal((iase.n_updates_, iase.n_refits_), (3, 0))
+    assert iase.drift_ > 0
+
+    ase = AdjacencySpectralEmbed(n_components=2, algorithm="full").fit(A)
+    assert_allclose(iase.singular_values_, ase.singular_values_, rtol=1e-2)
+    assert_allclose(
+        projection(iase.latent_left_), projection(ase.latent_left_), atol=0.05
+    )
+    if directed:
+        assert_allclose(
+            projection(iase.latent_right_), projection(ase.latent_right_), atol=0.05
+        )
+    else:
+        assert iase.latent_right_ is None
+
+
+def test_refit():
+    A = generate_data()
+    iase = IncrementalAdjacencySpectralEmbed(
+        n_components=2, algorithm="full", refit_threshold=0.1
+    )
+    iase.fit(A)
+
+    delta = flip_edges(A, 20)
+    iase.update(delta)
+    assert_equal((iase.n_updates_, iase.n_refits_), (1, 0))
+    assert 0 < iase.drift_ < 0.1
+
+    # a large update passes the threshold
+    A = A + delta.toarray()
+    delta = flip_edges(A, 2000)
+    iase.update(delta)
+    assert_equal((iase.n_updates_, iase.n_refits_), (2, 1))
+    assert_equal(iase.drift_, 0)
+
+    ase = AdjacencySpectralEmbed(n_components=2, algorithm="full")
+    ase.fit(A + delta.toarray())
+    assert_allclose(iase.singular_values_, ase.singular_values_)
+    assert_allclose(np.abs(iase.latent_left_), np.abs(ase.latent_left_))
+
+
+def test_graph_imported_once():
+    A = generate_data()
+    iase = IncrementalAdjacencySpectralEmbed(
+        n_components=2, algorithm="full", refit_threshold=0.1
+    )
+    with mock.patch(
+        "graspy.embed.incremental.import_graph", wraps=import_graph
+    ) as incremental_import, mock.patch("graspy.embed.ase.import_graph") as ase_import:
+        iase.fit(A)
+        iase.update(flip_edges(A, 2000))
+    assert_equal(incremental_import.call_count, 1)
+    assert_equal(ase_import.call_count, 0)
+    assert_equal(iase.n_refits_, 1)
@@ -0,0 +1,80 @@
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+from scipy.sparse import csr_matrix
+
+from graspy.embed.mase import MultipleASE
+from graspy.simulations.simulations import er_nm, sbm
+
+
+def generate_data(n_graphs=4, seed=1, directed=False):
+    np.random.seed(seed)
+    p = [[0.8, 0.1], [0.1, 0.8]]
+    return [sbm([50, 50], p, directed=directed) for _ in range(n_graphs)]
+
+
+def test_bad_inputs():
+    with pytest.raises(ValueError):
+        MultipleASE().fit(generate_data(n_graphs=1))
+
+    with pytest.raises(ValueError):
+        graphs = [np.ones((5, 5)), np.ones((6, 6))]
+        MultipleASE().fit(graphs)
+
+    with pytest.raises(ValueError):
+        MultipleASE(n_components=[1, 2]).fit(generate_data())
+
+
+def test_unconnected():
+    np.random.seed(4)
+    graphs = [er_nm(100, 50) for _ in range(2)]
+
+    with pytest.warns(UserWarning):
+        MultipleASE(n_components=2).fit(graphs)
+
+
+def test_shared_subspace():
+    graphs = generate_data()
+    mase = MultipleASE(n_components=2)
+    V = mase.fit_transform(graphs)
+
+    assert_equal(V.shape, (100, 2))
+    assert_allclose(V.T @ V, np.eye(2), atol=1e-10)
+    assert_equal(mase.scores_.shape, (4, 2, 2))
+    assert mase.latent_right_ is None
+    for A, R in zip(graphs, mase.scores_):
+        assert_allclose(R, V.T @ A @ V)
+        assert_allclose(R, R.T, atol=1e-10)
+
+    # the subspace separates the two blocks
+    means = [V[:50].mean(axis=0), V[50:].mean(axis=0)]
+    assert np.linalg.norm(means[0] - means[1]) > 10 * V[:50].std(axis=0).max()
+
+
+def test_n_jobs_and_sparse():
+    graphs = generate_data()
+    expected = MultipleASE(n_components=2, algorithm="full").fit(graphs)
+
+    for mase in [
+        MultipleASE(n_components=2, algorithm="full", n_jobs=2).fit(graphs),
+        MultipleASE(n_components=2, algorithm="truncated").fit(
+            [csr_matrix(g) for g in graphs]
+        ),
+    ]:
+        assert_allclose(
+            mase.latent_left_ @ mase.latent_left_.T,
+            expected.latent_left_ @ expected.latent_left_.T,
+            atol=1e-8,
+        )
+        assert_allclose(mase.singular_values_, expected.singular_values_)
+
+
+def test_directed():
+    graphs = generate_data(directed=True)
+    mase = MultipleASE(n_components=2, scaled=False)
+    left, right = mase.fit_transform(graphs)
+
+    assert_equal(left.shape, (100, 2))
+    assert_equal(right.shape, (100, 2))
+    for A, R in zip(graphs, mase.scores_):
+        assert_allclose(R, left.T @ A @ right)
@@ -1,8 +1,8 @@
 import pytest
 import numpy as np
-from numpy.testing import assert_almost_equal, assert_equal
+from numpy.testing import assert_allclose, assert_almost_equal, assert_equal
 
-from graspy.embed.mds import ClassicalMDS
+from graspy.embed.mds import ClassicalMDS, _double_center, _euclidean_distances
 
 
 def test_input():
@@ -113,3 +113,140 @@ def test_output():
     use_fit_transform()
     use_fit()
     use_euclidean()
+
+
+def test_algorithms():
+    np.random.seed(4)
+    X = np.random.normal(size=(50, 5))
+
+    mds = ClassicalMDS(n_components=3, algorithm="full")
+    expected = mds.fit(X).singular_values_
+    assert mds.n_iter_ is None
+
+    mds = ClassicalMDS(n_components=3, algorithm="krylov", n_iter=20)
+    mds.fit(X)
+    assert_allclose(mds.singular_values_, expected, rtol=1e-6)
+    assert mds.n_iter_ <= 20
+
+
+def test_float32():
+    np.random.seed(5)
+    X = np.random.normal(size=(50, 5))
+
+    expected = ClassicalMDS(n_components=3).fit_transform(X)
+    mds = ClassicalMDS(n_components=3, dtype=np.float32)
+    X_new = mds.fit_transform(X)
+    assert_equal(X_new.dtype, np.float32)
+    assert_equal(mds.dissimilarity_matrix_.dtype, np.float32)
+    assert_allclose(np.abs(X_new), np.abs(expected), atol=1e-4)
+
+
+def test_double_center():
+    np.random.seed(6)
+    X = np.random.normal(size=(20, 20))
+    J = np.identity(20) - np.full((20, 20), 1 / 20)
+    expected = J @ X @ J
+
+    out = _double_center(X)
+    assert out is X
+    assert_allclose(out, expected, atol=1e-12)
+
+
+def test_euclidean_distances():
+    np.random.seed(7)
+    X = np.random.normal(size=(53, 4, 5))
+    expected = np.array([np.linalg.norm(X - x, axis=(1, 2)) for x in X])
+
+    # blocks of 2 to 3 rows
+    for working_memory, n_jobs in [(None, None), (1e-3, None), (1e-3, 3)]:
+        D = _euclidean_distances(X, n_jobs=n_jobs, working_memory=working_memory)
+        assert_allclose(D, expected, atol=1e-12)
+        assert_equal(D, D.T)
+        assert_equal(np.diag(D), 0)
+
+    D = _euclidean_distances(X.astype(np.float32), working_memory=1e-3)
+    assert_equal(D.dtype, np.float32)
+    assert_allclose(D, expected, atol=1e-5)
+
+    mds = ClassicalMDS(n_components=2, n_jobs=2).fit(X)
+    assert_allclose(mds.dissimilarity_matrix_, expected, atol=1e-12)
+
+
+def test_transform():
+    np.random.seed(8)
+    X = np.random.normal(size=(40, 3))
+    Y = np.random.normal(size=(10, 3))
+
+    mds = ClassicalMDS(n_components=3, algorithm="full")
+    X_new = mds.fit_transform(X)
+    assert_allclose(mds.transform(X), X_new, atol=1e-10)
+
+    # distances between new and fitted samples are preserved
+    Y_new = mds.transform(Y)
+    expected = _euclidean_distances(X, Y)
+    assert_allclose(_euclidean_distances(X_new, Y_new), expected, atol=1e-6)
+
+    mds_precomputed = ClassicalMDS(
+        n_components=3, algorithm="full", dissimilarity="precomputed"
+    )
+    mds_precomputed.fit(mds.dissimilarity_matrix_)
+    assert mds_precomputed.X_fit_ is None
+    assert_allclose(np.abs(mds_precomputed.transform(expected)), np.abs(Y_new))
+
+    with pytest.raises(ValueError):
+        mds.transform(np.random.normal(size=(10, 4)))
+
+    with pytest.raises(ValueError):
+        mds_precomputed.transform(expected[:, :5])
+
+
+def test_landmarks():
+    np.random.seed(9)
+    X = np.random.normal(size=(200, 3))
+    expected = _euclidean_distances(X)
+
+    with pytest.raises(TypeError):
+        ClassicalMDS(n_landmarks=10.0)
+
+    with pytest.raises(ValueError):
+        ClassicalMDS(n_landmarks=1)
+
+    with pytest.raises(ValueError):
+        ClassicalMDS(landmark_method="kmeans")
+
+    with pytest.raises(ValueError):
+        ClassicalMDS(n_landmarks=300).fit(X)
+
+    with pytest.raises(ValueError):
+        ClassicalMDS(n_components=4, n_landmarks=3).fit(X)
+
+    for method in ["random", "maxmin"]:
+        mds = ClassicalMDS(
+            n_components=3, n_landmarks=20, landmark_method=method, random_state=0
+        )
+        X_new = mds.fit_transform(X)
+        assert_equal(X_new.shape, (200, 3))
+        assert_equal(mds.landmarks_.shape, (20,))
+        assert_equal(len(np.unique(mds.landmarks_)), 20)
+        assert_equal(mds.dissimilarity_matrix_.shape, (20, 20))
+        assert_allclose(mds.transform(X), X_new, atol=1e-10)
+
+        # exact for data of dimension n_components
+        assert_allclose(_euclidean_distances(X_new), expected, atol=1e-6)
+
+        mds_precomputed = ClassicalMDS(
+            n_components=3,
+            dissimilarity="precomputed",
+            n_landmarks=20,
+            landmark_method=method,
+            random_state=0,
+        )
+        X_precomputed = mds_precomputed.fit_transform(expected)
+        assert_equal(mds_precomputed.landmarks_, mds.landmarks_)
+        assert_allclose(np.abs(X_precomputed), np.abs(X_new), atol=1e-6)
+
+    # the second maxmin landmark is the sample farthest from the first
+    mds = ClassicalMDS(n_landmarks=2, landmark_method="maxmin", random_state=0)
+    mds.fit(X)
+    first, second = mds.landmarks_
+    assert_equal(second, np.argmax(expected[first]))
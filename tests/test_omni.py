@@ -4,8 +4,9 @@ import networkx as nx
 from numpy import array_equal, allclose
 from numpy.testing import assert_allclose
 from numpy.linalg import norm
+from scipy.sparse import csr_matrix
 
-from graspy.embed.omni import OmnibusEmbed, _get_omni_matrix
+from graspy.embed.omni import OmnibusEmbed, _get_omni_matrix, _OmnibusOperator
 from graspy.simulations.simulations import er_np, er_nm
 from graspy.utils.utils import symmetrize, is_symmetric
 
@@ -131,3 +132,115 @@ def test_omni_embed():
 
     tol = 1.0e-2
     assert allclose(norm(OmniBar, axis=1), norm(ABar, axis=1), rtol=tol, atol=tol)
+
+
+def test_omni_operator():
+    np.random.seed(5)
+    n = 10
+    for directed in [False, True]:
+        graphs = [er_np(n, 0.5, directed=directed).astype(float) for _ in range(3)]
+        expected = _get_omni_matrix(graphs)
+        operator = _OmnibusOperator(graphs)
+
+        X = np.random.normal(size=(3 * n, 4))
+        assert_allclose(operator @ X, expected @ X)
+        assert_allclose(operator.T @ X, expected.T @ X)
+        assert_allclose(operator.matvec(X[:, 0]), expected @ X[:, 0])
+
+        sparse_operator = _OmnibusOperator([csr_matrix(g) for g in graphs])
+        assert_allclose(sparse_operator @ X, expected @ X)
+
+
+def test_omni_matrix_free():
+    X, A1, A2 = generate_data(200)
+
+    omni = OmnibusEmbed(n_components=3, algorithm="full").fit([A1, A2])
+    for algorithm in ["randomized", "truncated"]:
+        omni_free = OmnibusEmbed(
+            n_components=3, algorithm=algorithm, matrix_free=True
+        ).fit([A1, A2])
+        assert omni_free.latent_right_ is None
+        assert_allclose(omni.singular_values_, omni_free.singular_values_, rtol=1e-5)
+        assert_allclose(
+            np.abs(omni.latent_left_), np.abs(omni_free.latent_left_), atol=1e-3
+        )
+
+    with pytest.raises(ValueError):
+        OmnibusEmbed(n_components=3, algorithm="full", matrix_free=True).fit([A1, A2])
+
+
+def test_omni_partial_fit():
+    np.random.seed(7)
+    X = np.random.dirichlet([1, 1, 1], size=200)
+    P = X @ X.T
+    graphs = [symmetrize(np.random.binomial(1, P)).astype(float) for _ in range(5)]
+
+    for matrix_free in [False, True]:
+        omni = OmnibusEmbed(n_components=3, window_size=3, matrix_free=matrix_free)
+        omni.partial_fit(graphs[:3])
+        omni.partial_fit(graphs[3:])
+
+        expected = OmnibusEmbed(n_components=3, matrix_free=matrix_free)
+        expected.fit(graphs[-3:])
+
+        assert omni.n_graphs_ == 3
+        assert omni.latent_left_.shape == (3, 200, 3)
+        assert omni.latent_right_ is None
+        assert_allclose(omni.singular_values_, expected.singular_values_, rtol=1e-3)
+
+    omni = OmnibusEmbed(n_components=3, n_iter=2).fit(graphs[:2])
+    omni.partial_fit(graphs[2:])
+    assert omni.latent_left_.shape == (5, 200, 3)
+
+    # exact solvers give the same embedding as fit
+    for algorithm in ["full", "truncated"]:
+        omni = OmnibusEmbed(n_components=3, algorithm=algorithm).fit(graphs[:2])
+        omni.partial_fit(graphs[2:])
+        expected = OmnibusEmbed(n_components=3, algorithm=algorithm).fit(graphs)
+        assert_allclose(omni.singular_values_, expected.singular_values_)
+        assert_allclose(
+            np.abs(omni.latent_left_), np.abs(expected.latent_left_), atol=1e-8
+        )
+
+    with pytest.raises(ValueError):
+        omni.partial_fit([np.ones((10, 10))])
+
+
+def test_omni_partial_fit_update_iterations():
+    np.random.seed(7)
+    X = np.random.dirichlet([1, 1, 1], size=200)
+    P = X @ X.T
+    graphs = [symmetrize(np.random.binomial(1, P)).astype(float) for _ in range(5)]
+
+    # a warm update with a single iteration matches a cold fit with the full budget
+    omni = OmnibusEmbed(n_components=3, n_iter=5, n_iter_update=1).fit(graphs[:4])
+    omni.partial_fit(graphs[4:])
+    expected = OmnibusEmbed(n_components=3, n_iter=5).fit(graphs)
+    assert omni.n_iter_ == 1
+    assert_allclose(omni.singular_values_, expected.singular_values_, rtol=1e-3)
+    assert_allclose(np.abs(omni.latent_left_), np.abs(expected.latent_left_), atol=1e-2)
+
+    # zero singular values do not produce a nan starting basis
+    omni = OmnibusEmbed(n_components=3).fit(graphs[:2])
+    omni.singular_values_[-1] = 0
+    omni.partial_fit(graphs[2:])
+    assert np.all(np.isfinite(omni.latent_left_))
+
+
+def test_omni_float32():
+    _, A, B = generate_data(100)
+    for matrix_free in [False, True]:
+        omni = OmnibusEmbed(n_components=2, matrix_free=matrix_free, dtype=np.float32)
+        Xhat = omni.fit_transform([A, B])
+        assert Xhat.dtype == np.float32
+
+
+def test_omni_nested_embeddings():
+    _, A, B = generate_data(100)
+    omni = OmnibusEmbed(n_components=[1, 3, 2], algorithm="full").fit([A, B])
+    assert sorted(omni.embeddings_) == [1, 2, 3]
+    assert omni.latent_left_.shape == (2, 100, 3)
+    for d, Xhat in omni.embeddings_.items():
+        expected = OmnibusEmbed(n_components=d, algorithm="full").fit_transform([A, B])
+        assert_allclose(np.abs(Xhat), np.abs(expected), atol=1e-10)
+    assert OmnibusEmbed(n_components=2).fit([A, B]).embeddings_ is None
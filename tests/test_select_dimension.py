@@ -1,9 +1,10 @@
 import numpy as np
 import pytest
-from numpy.testing import assert_equal
+from numpy.testing import assert_allclose, assert_equal
 from scipy.linalg import orth
+from scipy.stats import norm
 
-from graspy.embed.svd import select_dimension
+from graspy.embed.svd import select_dimension, _compute_likelihood
 from graspy.simulations.simulations import sbm
 
 
@@ -106,3 +107,34 @@ def test_output_two_block_sbm():
 
     elbows, _ = select_dimension(A, n_elbows=2)
     assert_equal(elbows[0], 2)
+
+
+def test_likelihood_matches_pointwise():
+    """
+    The vectorized likelihoods must match evaluating each split directly.
+    """
+
+    def pointwise(arr):
+        n = len(arr)
+        out = np.zeros(n)
+        for idx in range(1, n + 1):
+            s1, s2 = arr[:idx], arr[idx:]
+            if (s1.size == 1) & (s2.size == 1):
+                out[idx - 1] = -np.inf
+                continue
+            mu1 = np.mean(s1)
+            mu2 = np.mean(s2) if s2.size != 0 else 0
+            ss = np.sum((s1 - mu1) ** 2) + np.sum((s2 - mu2) ** 2)
+            std = np.sqrt(ss / (n - 1 - (idx < n)))
+            out[idx - 1] = np.sum(norm.logpdf(s1, mu1, std)) + np.sum(
+                norm.logpdf(s2, mu2, std)
+            )
+        return out
+
+    np.random.seed(1)
+    for n in [2, 3, 10, 200]:
+        arr = np.sort(np.random.exponential(scale=100, size=n))[::-1]
+        assert_allclose(_compute_likelihood(arr), pointwise(arr), rtol=1e-8)
+
+    # no variance
+    assert np.all(np.isnan(_compute_likelihood(np.ones(5))))
@@ -1,9 +1,15 @@
+import os
+import tempfile
+import tracemalloc
 import unittest
 import graspy as gs
 import numpy as np
+from scipy import sparse
+from scipy.linalg import orthogonal_procrustes
 from graspy.embed.ase import AdjacencySpectralEmbed
 from graspy.embed.lse import LaplacianSpectralEmbed
 from graspy.simulations.simulations import er_np, er_nm, sbm
+from sklearn import config_context
 from sklearn.cluster import KMeans
 from sklearn.metrics import adjusted_rand_score
 
@@ -123,6 +129,11 @@ class TestLaplacianSpectralEmbed(unittest.TestCase):
         f = np.array([[1, 2], [2, 1]])
         lse = LaplacianSpectralEmbed(form="I-DAD")
 
+    def test_positional_regularizer(self):
+        lse = LaplacianSpectralEmbed("R-DAD", 2, 2, "randomized", 5, True, 1.0)
+        self.assertEqual(lse.regularizer, 1.0)
+        self.assertFalse(lse.warm_start)
+
     def test_unconnected_warning(self):
         n = [50, 50]
         p = [[1, 0], [0, 1]]
@@ -132,5 +143,271 @@ class TestLaplacianSpectralEmbed(unittest.TestCase):
             lse.fit(A)
 
 
+def _test_sparse_input(self, method, *args, **kwargs):
+    np.random.seed(8888)
+    P = np.array([[0.8, 0.2], [0.2, 0.8]])
+    A = sbm([50, 50], P)
+    for algorithm in ["truncated", "randomized"]:
+        embed_dense = method(n_components=2, algorithm=algorithm).fit(A)
+        embed_sparse = method(n_components=2, algorithm=algorithm).fit(
+            sparse.csr_matrix(A)
+        )
+        np.testing.assert_allclose(
+            embed_dense.singular_values_, embed_sparse.singular_values_
+        )
+        np.testing.assert_allclose(
+            np.abs(embed_dense.latent_left_),
+            np.abs(embed_sparse.latent_left_),
+            atol=1e-5,
+        )
+        self.assertTrue(embed_sparse.latent_right_ is None)
+
+
+class TestSparseInput(unittest.TestCase):
+    def test_ase_sparse(self):
+        _test_sparse_input(self, AdjacencySpectralEmbed)
+
+    def test_lse_sparse(self):
+        _test_sparse_input(self, LaplacianSpectralEmbed)
+
+
+def _test_float32(self, method, *args, **kwargs):
+    np.random.seed(8888)
+    P = np.array([[0.8, 0.2], [0.2, 0.8]])
+    A = sbm([50, 50], P)
+    for algorithm in ["full", "truncated", "randomized", "krylov"]:
+        embed_64 = method(n_components=2, algorithm=algorithm).fit(A)
+        embed_32 = method(n_components=2, algorithm=algorithm, dtype=np.float32)
+        embed_32.fit(A)
+        self.assertEqual(embed_32.latent_left_.dtype, np.float32)
+        self.assertEqual(embed_32.singular_values_.dtype, np.float32)
+        np.testing.assert_allclose(
+            embed_64.singular_values_, embed_32.singular_values_, rtol=1e-4
+        )
+
+
+class TestFloat32(unittest.TestCase):
+    def test_ase_float32(self):
+        _test_float32(self, AdjacencySpectralEmbed)
+
+    def test_lse_float32(self):
+        _test_float32(self, LaplacianSpectralEmbed)
+
+
+class TestNJobs(unittest.TestCase):
+    def test_ase_n_jobs(self):
+        np.random.seed(8888)
+        A = sparse.csr_matrix(sbm([50, 50], [[0.8, 0.2], [0.2, 0.8]]))
+        ase = AdjacencySpectralEmbed(n_components=2, algorithm="krylov")
+        ase_parallel = AdjacencySpectralEmbed(
+            n_components=2, algorithm="krylov", n_jobs=2
+        )
+        np.testing.assert_allclose(
+            ase.fit_transform(A), ase_parallel.fit_transform(A), atol=1e-10
+        )
+
+
+class TestAdjacencySpectralEmbedTransform(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        np.random.seed(8888)
+        P = np.array([[0.8, 0.2], [0.2, 0.8]])
+        cls.A = sbm([50, 50], P)
+        cls.A_directed = sbm([50, 50], P, directed=True)
+
+    def test_in_sample_undirected(self):
+        ase = AdjacencySpectralEmbed(n_components=2, algorithm="full").fit(self.A)
+        np.testing.assert_allclose(ase.transform(self.A), ase.latent_left_)
+        np.testing.assert_allclose(
+            ase.transform(sparse.csr_matrix(self.A)), ase.latent_left_
+        )
+
+    def test_in_sample_indefinite(self):
+        # disassortative blocks have a negative eigenvalue
+        np.random.seed(2)
+        A = sbm([50, 50], [[0.1, 0.8], [0.8, 0.1]])
+        for algorithm in ["full", "truncated", "randomized", "krylov"]:
+            ase = AdjacencySpectralEmbed(n_components=2, algorithm=algorithm).fit(A)
+            np.testing.assert_allclose(ase.transform(A), ase.latent_left_, atol=1e-3)
+
+    def test_in_sample_directed(self):
+        ase = AdjacencySpectralEmbed(n_components=2, algorithm="full")
+        ase.fit(self.A_directed)
+        left, right = ase.transform((self.A_directed, self.A_directed.T))
+        np.testing.assert_allclose(left, ase.latent_left_)
+        np.testing.assert_allclose(right, ase.latent_right_)
+
+    def test_out_of_sample(self):
+        ase = AdjacencySpectralEmbed(n_components=2).fit(self.A[:90, :90])
+        X_new = ase.transform(self.A[90:, :90])
+        self.assertEqual(X_new.shape, (10, 2))
+
+        # new vertices are closer to their own block in the fitted embedding
+        centers = [ase.latent_left_[:50].mean(axis=0), ase.latent_left_[50:].mean(0)]
+        dists = np.linalg.norm(X_new[:, None] - np.array(centers)[None], axis=2)
+        self.assertTrue(np.all(np.argmin(dists, axis=1) == 1))
+
+    def test_bad_transform_input(self):
+        ase = AdjacencySpectralEmbed(n_components=2).fit(self.A)
+        with self.assertRaises(ValueError):
+            ase.transform(self.A[:, :10])
+        with self.assertRaises(ValueError):
+            ase.transform((self.A, self.A))
+
+        ase = AdjacencySpectralEmbed(n_components=2).fit(self.A_directed)
+        with self.assertRaises(ValueError):
+            ase.transform(self.A_directed)
+
+
+class TestAdjacencySpectralEmbedSketch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        np.random.seed(3)
+        P = np.array([[0.8, 0.2], [0.2, 0.8]])
+        cls.labels = np.repeat([0, 1], 100)
+        cls.A = sbm([100, 100], P)
+        cls.A_directed = sbm([100, 100], P, directed=True)
+
+    def _assert_close_to_full(self, X, X_full):
+        # equal up to an orthogonal transformation
+        R, _ = orthogonal_procrustes(X, X_full)
+        error = np.linalg.norm(X @ R - X_full) / np.linalg.norm(X_full)
+        self.assertLess(error, 0.2)
+
+    def test_sketch_undirected(self):
+        full = AdjacencySpectralEmbed(n_components=2, algorithm="full").fit(self.A)
+        for sampling in ["uniform", "degree"]:
+            ase = AdjacencySpectralEmbed(
+                n_components=2,
+                sample_size=80,
+                sampling=sampling,
+                batch_size=30,
+                random_state=0,
+            )
+            X = ase.fit_transform(self.A)
+            self.assertEqual(X.shape, (200, 2))
+            self.assertEqual(ase.sample_indices_.shape, (80,))
+            self.assertIsNone(ase.latent_right_)
+            self._assert_close_to_full(X, full.latent_left_)
+            self.assertEqual(
+                adjusted_rand_score(self.labels, KMeans(2).fit_predict(X)), 1
+            )
+
+            # singular values and out-of-sample positions agree with a full fit
+            np.testing.assert_allclose(
+                ase.singular_values_, full.singular_values_, rtol=0.1
+            )
+            self._assert_close_to_full(ase.transform(self.A), full.transform(self.A))
+
+        self.assertIsNone(full.sample_indices_)
+
+    def test_sketch_directed(self):
+        full = AdjacencySpectralEmbed(n_components=2, algorithm="full")
+        full.fit(self.A_directed)
+        ase = AdjacencySpectralEmbed(n_components=2, sample_size=80, random_state=0)
+        left, right = ase.fit_transform(self.A_directed)
+        self.assertEqual(right.shape, (200, 2))
+        self._assert_close_to_full(left, full.latent_left_)
+        self._assert_close_to_full(right, full.latent_right_)
+        np.testing.assert_allclose(
+            ase.singular_values_, full.singular_values_, rtol=0.1
+        )
+
+    def test_sketch_indefinite(self):
+        # disassortative blocks have a negative eigenvalue
+        np.random.seed(4)
+        A = sbm([100, 100], [[0.1, 0.8], [0.8, 0.1]])
+        full = AdjacencySpectralEmbed(n_components=2, algorithm="full").fit(A)
+        ase = AdjacencySpectralEmbed(n_components=2, sample_size=80, random_state=0)
+        X = ase.fit_transform(A)
+        self._assert_close_to_full(X, full.latent_left_)
+        self._assert_close_to_full(ase.transform(A), full.transform(A))
+
+    def test_sketch_sparse_and_batches(self):
+        kwargs = dict(n_components=2, sample_size=50, random_state=1)
+        expected = AdjacencySpectralEmbed(**kwargs).fit_transform(self.A)
+        for A, batch_size in [(self.A, 7), (sparse.csr_matrix(self.A), None)]:
+            X = AdjacencySpectralEmbed(batch_size=batch_size, **kwargs).fit_transform(A)
+            np.testing.assert_allclose(X, expected)
+
+    def test_sketch_memmap_memory(self):
+        # with the default check_lcc, the graph is never read into memory
+        np.random.seed(6)
+        A = sbm([500, 500], [[0.5, 0.1], [0.1, 0.5]])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            M = np.memmap(os.path.join(tmpdir, "A.dat"), "float64", "w+", shape=A.shape)
+            M[:] = A
+            for sampling in ["uniform", "degree"]:
+                ase = AdjacencySpectralEmbed(
+                    n_components=2, sample_size=100, sampling=sampling, random_state=0
+                )
+                with config_context(working_memory=1):
+                    tracemalloc.start()
+                    ase.fit(M)
+                    _, peak = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+                self.assertLess(peak, M.nbytes / 4)
+            del M
+
+    def test_sketch_bad_inputs(self):
+        with self.assertRaises(TypeError):
+            AdjacencySpectralEmbed(sample_size=10.5)
+        with self.assertRaises(ValueError):
+            AdjacencySpectralEmbed(batch_size=0)
+        with self.assertRaises(ValueError):
+            AdjacencySpectralEmbed(sampling="edge")
+        with self.assertRaises(ValueError):
+            AdjacencySpectralEmbed(sample_size=201).fit(self.A)
+
+        A = np.zeros((200, 200))
+        A[:10, :10] = 1
+        with self.assertRaises(ValueError):
+            ase = AdjacencySpectralEmbed(
+                n_components=2, sample_size=20, sampling="degree", check_lcc=False
+            )
+            ase.fit(A)
+
+
+class TestNestedEmbeddings(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        np.random.seed(5)
+        P = np.array([[0.8, 0.2, 0.1], [0.2, 0.7, 0.3], [0.1, 0.3, 0.6]])
+        cls.A = sbm([40, 40, 40], P)
+        cls.A_directed = sbm([40, 40, 40], P, directed=True)
+
+    def test_nested_ase_lse(self):
+        for method in [AdjacencySpectralEmbed, LaplacianSpectralEmbed]:
+            embed = method(n_components=[4, 1, 2], algorithm="full").fit(self.A)
+            self.assertEqual(sorted(embed.embeddings_), [1, 2, 4])
+            self.assertEqual(embed.n_components_, 4)
+            self.assertEqual(embed.latent_left_.shape, (120, 4))
+
+            for d, X in embed.embeddings_.items():
+                expected = method(n_components=d, algorithm="full").fit(self.A)
+                self.assertIsNone(expected.embeddings_)
+                np.testing.assert_allclose(
+                    np.abs(X), np.abs(expected.latent_left_), atol=1e-10
+                )
+
+    def test_nested_directed(self):
+        ase = AdjacencySpectralEmbed(n_components=range(1, 4))
+        left, right = ase.fit_transform(self.A_directed)
+        self.assertEqual(sorted(ase.embeddings_), [1, 2, 3])
+        for d, (X, Y) in ase.embeddings_.items():
+            np.testing.assert_array_equal(X, left[:, :d])
+            np.testing.assert_array_equal(Y, right[:, :d])
+
+    def test_nested_bad_inputs(self):
+        with self.assertRaises(ValueError):
+            AdjacencySpectralEmbed(n_components=[]).fit(self.A)
+        with self.assertRaises(ValueError):
+            AdjacencySpectralEmbed(n_components=[0, 2]).fit(self.A)
+        with self.assertRaises(TypeError):
+            AdjacencySpectralEmbed(n_components=[2, 2.5]).fit(self.A)
+        with self.assertRaises(ValueError):
+            AdjacencySpectralEmbed(n_components=[2, 4], max_components=3).fit(self.A)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,14 @@
+from unittest import mock
+
 import pytest
 import numpy as np
 from numpy.testing import assert_equal, assert_allclose
 from scipy.spatial import procrustes
+from scipy.sparse import csr_matrix
+from sklearn import config_context
 
-from graspy.embed.svd import selectSVD
-from graspy.simulations.simulations import er_np
+from graspy.embed.svd import _RowBlockOperator, selectSVD
+from graspy.simulations.simulations import er_np, sbm
 
 
 def test_bad_inputs():
@@ -57,3 +61,188 @@ def test_outputs():
     atol = 1e-4
     assert_allclose(norm_full, norm_trunc, rtol, atol)
     assert_allclose(norm_full, norm_rand, rtol, atol)
+
+
+def test_single_pass_dimension_selection():
+    np.random.seed(1)
+    X = np.vstack(
+        [np.repeat([[0.9, 0.1]], 50, axis=0), np.repeat([[0.1, 0.9]], 50, axis=0)]
+    )
+    A = np.random.binomial(1, X @ X.T).astype(float)
+
+    for algorithm in ["full", "truncated", "randomized", "krylov"]:
+        U, D, V = selectSVD(A, n_components=None, n_elbows=1, algorithm=algorithm)
+        assert_equal(U.shape, (100, D.size))
+        assert_equal(V.shape, (D.size, 100))
+        assert_equal(D.size, 2)
+
+        U, D, V = selectSVD(
+            A, n_components=None, n_elbows=2, algorithm=algorithm, max_components=10
+        )
+        assert D.size <= 10
+
+    with pytest.raises(ValueError):
+        selectSVD(A, n_components=None, max_components=0)
+
+
+def test_max_components():
+    np.random.seed(1)
+    A = np.random.normal(size=(50, 40))
+
+    U, D, V = selectSVD(A, n_components=10, algorithm="full")
+    for algorithm in ["full", "truncated", "randomized", "krylov"]:
+        U_, D_, V_ = selectSVD(
+            A, n_components=3, max_components=10, algorithm=algorithm, n_iter=20
+        )
+        assert_equal(D_.shape, (3,))
+        assert_allclose(D_, D[:3], rtol=1e-3)
+
+    with pytest.raises(ValueError):
+        selectSVD(A, n_components=5, max_components=4)
+
+
+def test_symmetric():
+    np.random.seed(2)
+    # symmetric matrix with both positive and negative eigenvalues
+    Q, _ = np.linalg.qr(np.random.normal(size=(50, 50)))
+    w = np.concatenate([[20, -15, 10, -5], np.random.uniform(-1, 1, 46)])
+    A = Q @ np.diag(w) @ Q.T
+    A = (A + A.T) / 2
+
+    for algorithm in ["full", "truncated", "randomized", "krylov"]:
+        U, D, V = selectSVD(A, n_components=4, algorithm=algorithm)
+        U_sym, D_sym, V_sym = selectSVD(
+            A, n_components=4, algorithm=algorithm, symmetric=True
+        )
+        assert_allclose(D_sym, [20, 15, 10, 5], rtol=1e-4)
+        assert_allclose(D, D_sym, rtol=1e-4)
+        assert_allclose(U @ np.diag(D) @ V, U_sym @ np.diag(D_sym) @ V_sym, atol=1e-3)
+        assert_allclose(U_sym.T @ U_sym, np.eye(4), atol=1e-8)
+
+
+def test_krylov():
+    np.random.seed(3)
+    # slowly decaying spectrum
+    U, _ = np.linalg.qr(np.random.normal(size=(200, 100)))
+    V, _ = np.linalg.qr(np.random.normal(size=(100, 100)))
+    w = 1 / np.sqrt(np.arange(1, 101))
+    A = U @ np.diag(w) @ V.T
+
+    _, D_rand, _ = selectSVD(A, n_components=5, algorithm="randomized", n_iter=3)
+    _, D_kry, _, n_iter = selectSVD(
+        A, n_components=5, algorithm="krylov", n_iter=30, return_n_iter=True
+    )
+    assert_allclose(D_kry, w[:5], rtol=1e-6)
+    assert np.abs(D_kry - w[:5]).max() < np.abs(D_rand - w[:5]).max()
+    assert n_iter < 30
+
+    # a loose tolerance stops earlier
+    _, _, _, n_iter_loose = selectSVD(
+        A, n_components=5, algorithm="krylov", n_iter=30, tol=1e-2, return_n_iter=True
+    )
+    assert n_iter_loose < n_iter
+
+    _, _, _, n_iter = selectSVD(
+        A, n_components=5, algorithm="randomized", n_iter=4, return_n_iter=True
+    )
+    assert_equal(n_iter, 4)
+    _, _, _, n_iter = selectSVD(A, n_components=5, algorithm="full", return_n_iter=True)
+    assert n_iter is None
+
+
+def test_adaptive():
+    np.random.seed(5)
+    # rank 7 plus small noise
+    U, _ = np.linalg.qr(np.random.normal(size=(300, 200)))
+    V, _ = np.linalg.qr(np.random.normal(size=(200, 200)))
+    w = np.concatenate([np.linspace(10, 5, 7), np.full(193, 1e-6)])
+    A = U @ np.diag(w) @ V.T
+
+    U_, D, V_, n_blocks, error = selectSVD(
+        A, algorithm="adaptive", tol=1e-3, return_n_iter=True, return_error=True
+    )
+    assert_equal(D.size, 7)
+    assert_allclose(D, w[:7])
+    true_error = np.linalg.norm(A - U_ @ np.diag(D) @ V_) / np.linalg.norm(A)
+    assert error <= 1e-3
+    assert_allclose(error, true_error, rtol=0.5)
+    assert_equal(n_blocks, 1)
+
+    # n_components caps the rank
+    _, D, _ = selectSVD(A, n_components=3, algorithm="adaptive")
+    assert_allclose(D, w[:3])
+
+    # spectral gap of a noisy graph, without a log2 rule on the rank
+    A = sbm([100, 100, 100], [[0.5, 0.1, 0.1], [0.1, 0.5, 0.1], [0.1, 0.1, 0.5]])
+    for symmetric in [False, True]:
+        _, D, _, error = selectSVD(
+            A, algorithm="adaptive", symmetric=symmetric, return_error=True
+        )
+        assert_equal(D.size, 3)
+        _, expected, _ = selectSVD(A, n_components=3, algorithm="full")
+        assert_allclose(D, expected, rtol=1e-3)
+        assert 0 < error < 1
+
+    # the error is None for other solvers
+    *_, error = selectSVD(A, n_components=3, return_error=True)
+    assert error is None
+
+    # a tolerance outside (0, 1) would give an empty decomposition
+    for tol in [0, 1, 2]:
+        with pytest.raises(ValueError):
+            selectSVD(A, algorithm="adaptive", tol=tol)
+
+
+def test_memmap(tmp_path):
+    np.random.seed(4)
+    Q, _ = np.linalg.qr(np.random.normal(size=(100, 100)))
+    w = np.concatenate([[30, -20, 10], np.random.uniform(-1, 1, 97)])
+    X = np.memmap(str(tmp_path / "X.dat"), dtype=np.float64, mode="w+", shape=Q.shape)
+
+    # row blocks of 10 rows
+    with config_context(working_memory=10 * 100 * 8 / 2 ** 20):
+        for symmetric in [False, True]:
+            A = Q @ np.diag(w) @ Q.T
+            if not symmetric:
+                A[:, 0] += 0.1
+            X[:] = A
+            U_, D_, V_ = selectSVD(A, n_components=3, algorithm="full")
+            for algorithm in ["randomized", "truncated", "krylov"]:
+                U, D, V = selectSVD(
+                    X, n_components=3, algorithm=algorithm, symmetric=symmetric
+                )
+                assert_allclose(D, D_, rtol=1e-6)
+                assert_allclose(U @ np.diag(D) @ V, U_ @ np.diag(D_) @ V_, atol=1e-4)
+
+
+def test_n_jobs():
+    np.random.seed(5)
+    Q, _ = np.linalg.qr(np.random.normal(size=(100, 100)))
+    w = np.concatenate([[30, -20, 10], np.random.uniform(-1, 1, 97)])
+    A = Q @ np.diag(w) @ Q.T
+    _, D_, _ = selectSVD(A, n_components=3, algorithm="full")
+
+    for X in [A, csr_matrix(A)]:
+        for algorithm in ["randomized", "krylov"]:
+            U, D, V = selectSVD(X, n_components=3, algorithm=algorithm, n_jobs=2)
+            assert_allclose(D, D_, rtol=1e-6)
+            U, D, V = selectSVD(
+                X, n_components=3, algorithm=algorithm, n_jobs=2, symmetric=True
+            )
+            assert_allclose(D, D_, rtol=1e-6)
+
+
+def test_n_jobs_no_copies():
+    np.random.seed(6)
+    # large enough to be memory-mapped by joblib
+    A = np.random.normal(size=(1000, 200))
+    Q = np.random.normal(size=(200, 3))
+
+    for X in [A, csr_matrix(A)]:
+        op = _RowBlockOperator(X, n_jobs=2)
+        # memory-mapped once, then passed to the workers by file in every product
+        with mock.patch("joblib._memmapping_reducer.dump") as dump:
+            for _ in range(3):
+                assert_allclose(op @ Q, A @ Q)
+                assert_allclose(op.T @ (A @ Q), A.T @ (A @ Q))
+        assert_equal(dump.call_count, 0)
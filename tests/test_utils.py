@@ -1,9 +1,15 @@
+import os
+import tempfile
 import unittest
+import warnings
+from unittest import mock
 import graspy as gs
 import numpy as np
 import networkx as nx
+from scipy import sparse
 from graspy.utils import utils as gus
 from math import sqrt
+from sklearn import config_context
 
 
 class TestInput(unittest.TestCase):
@@ -27,6 +33,43 @@ class TestInput(unittest.TestCase):
     def test_npin(self):
         np.testing.assert_array_equal(self.A, gus.import_graph(self.A))
 
+    def test_sparsein(self):
+        csr = sparse.csr_matrix(self.A)
+        out = gus.import_graph(csr)
+        self.assertTrue(sparse.isspmatrix_csr(out))
+        np.testing.assert_array_equal(self.A, out.toarray())
+
+        out = gus.import_graph(sparse.csc_matrix(self.A))
+        self.assertTrue(sparse.isspmatrix_csc(out))
+
+    def test_dtype(self):
+        G = nx.from_numpy_array(self.A)
+        for graph in [G, self.A, sparse.csr_matrix(self.A)]:
+            out = gus.import_graph(graph, dtype=np.float32)
+            self.assertEqual(out.dtype, np.float32)
+            out = gus.import_graph(out)
+            self.assertEqual(out.dtype, np.float32)
+        self.assertEqual(gus.import_graph(G).dtype, np.float64)
+        with self.assertRaises(ValueError):
+            gus.import_graph(self.A, dtype=np.int64)
+
+    def test_memmapin(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "A.dat")
+            A = np.memmap(path, dtype=np.float64, mode="w+", shape=self.A.shape)
+            A[:] = self.A
+            out = gus.import_graph(A)
+            self.assertTrue(out is A)
+
+            out = gus.import_graph(A, dtype=np.float32)
+            self.assertFalse(isinstance(out, np.memmap))
+            np.testing.assert_allclose(self.A, out, rtol=1e-6)
+
+            B = np.memmap(path, dtype=np.float64, mode="r", shape=(15, 5))
+            with self.assertRaises(ValueError):
+                gus.import_graph(B)
+            del A, B
+
     def test_wrongtypein(self):
         a = 5
         with self.assertRaises(TypeError):
@@ -88,6 +131,33 @@ class TestToLaplace(unittest.TestCase):
 
         self.assertTrue(gus.is_symmetric(L_normed))
 
+    def test_to_laplace_sparse(self):
+        A = sparse.csr_matrix(self.A)
+        for form in ["I-DAD", "DAD", "R-DAD"]:
+            L_sparse = gus.to_laplace(A, form=form)
+            self.assertTrue(sparse.issparse(L_sparse))
+            L_dense = gus.to_laplace(self.A, form=form)
+            self.assertTrue(np.allclose(L_sparse.toarray(), L_dense))
+
+    def test_to_laplace_dtype(self):
+        for form in ["I-DAD", "DAD", "R-DAD"]:
+            L = gus.to_laplace(self.A, form=form, dtype=np.float32)
+            self.assertEqual(L.dtype, np.float32)
+            L_64 = gus.to_laplace(self.A, form=form)
+            self.assertTrue(np.allclose(L, L_64, atol=1e-6))
+
+    def test_to_laplace_input_unchanged(self):
+        A = self.A.astype(float)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            M = np.memmap(os.path.join(tmpdir, "A.dat"), "float64", "w+", shape=(3, 3))
+            M[:] = A
+            for form in ["I-DAD", "DAD", "R-DAD"]:
+                L = gus.to_laplace(A, form=form)
+                self.assertTrue(np.allclose(gus.to_laplace(M, form=form), L))
+            np.testing.assert_array_equal(A, self.A)
+            np.testing.assert_array_equal(M, self.A)
+            del M
+
     def test_to_laplace_unsuported(self):
         with self.assertRaises(TypeError):
             gus.to_laplace(self.A, form="MOM")
@@ -127,6 +197,25 @@ class TestChecks(unittest.TestCase):
         B = np.array([[1, 0, 1, 0], [0, 1, 1, 0], [1, 1, 0, 1], [0, 0, 0, 1]])
         self.assertFalse(gus.is_fully_connected(A))
         self.assertTrue(gus.is_fully_connected(B))
+        self.assertFalse(gus.is_fully_connected(sparse.csr_matrix(A)))
+        self.assertTrue(gus.is_fully_connected(sparse.csr_matrix(B)))
+
+    def test_is_fully_connected_memmap(self):
+        np.random.seed(3)
+        A = gus.symmetrize(np.random.binomial(1, 0.5, size=(20, 20)))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "A.dat")
+            M = np.memmap(path, dtype=np.float64, mode="w+", shape=A.shape)
+            M[:] = A
+            self.assertTrue(gus.is_fully_connected(M))
+            lcc, inds = gus.get_lcc(M, return_inds=True)
+            self.assertEqual(lcc.shape, A.shape)
+
+            # no spurious connectivity warning when embedding a memmap
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                gs.embed.AdjacencySpectralEmbed(n_components=2).fit(M)
+            del M
 
     def test_is_almost_symmetric(self):
         np.random.seed(8888)
@@ -136,6 +225,69 @@ class TestChecks(unittest.TestCase):
         self.assertTrue(gus.is_almost_symmetric(corr, atol=1e-15))
         self.assertFalse(gus.is_symmetric(corr))
 
+    def test_is_almost_symmetric_memmap(self):
+        np.random.seed(8888)
+        A = gus.symmetrize(np.random.normal(size=(100, 100)))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "A.dat")
+            M = np.memmap(path, dtype=np.float64, mode="w+", shape=A.shape)
+            M[:] = A
+            # tiles of 16 x 16
+            with config_context(working_memory=2 * 16 ** 2 * 8 / 2 ** 20):
+                self.assertTrue(gus.is_almost_symmetric(M))
+                M[90, 5] += 1
+                self.assertFalse(gus.is_almost_symmetric(M))
+            del M
+
+    def test_sparse_checks(self):
+        A = sparse.csr_matrix(self.A)
+        self.assertEqual(gus.is_symmetric(A), gus.is_symmetric(self.A))
+        self.assertEqual(gus.is_loopless(A), gus.is_loopless(self.A))
+        self.assertEqual(gus.is_unweighted(A), gus.is_unweighted(self.A))
+        S = sparse.csr_matrix(gus.symmetrize(self.A))
+        self.assertTrue(gus.is_symmetric(S))
+        self.assertTrue(gus.is_almost_symmetric(S))
+        self.assertFalse(gus.is_almost_symmetric(A))
+
+
+class TestGraphProperties(unittest.TestCase):
+    def test_checks_run_once(self):
+        np.random.seed(1)
+        A = gus.symmetrize(np.random.binomial(1, 0.5, size=(20, 20)))
+        A, properties = gus.import_graph(A, return_properties=True)
+        with mock.patch.object(
+            gus, "is_almost_symmetric", wraps=gus.is_almost_symmetric
+        ) as check:
+            for _ in range(3):
+                self.assertTrue(properties.almost_symmetric)
+            self.assertEqual(check.call_count, 1)
+        self.assertEqual(properties.unweighted, gus.is_unweighted(A))
+        self.assertEqual(properties.loopless, gus.is_loopless(A))
+        self.assertEqual(properties.fully_connected, gus.is_fully_connected(A))
+
+    def test_known_properties(self):
+        G = nx.path_graph(10)
+        G.add_edge(3, 3)
+        with mock.patch.object(gus, "is_symmetric") as check1, mock.patch.object(
+            gus, "is_loopless"
+        ) as check2:
+            _, properties = gus.import_graph(G, return_properties=True)
+            self.assertTrue(properties.symmetric)
+            self.assertTrue(properties.almost_symmetric)
+            self.assertFalse(properties.loopless)
+            check1.assert_not_called()
+            check2.assert_not_called()
+
+        A = np.random.binomial(1, 0.5, size=(20, 20))
+        properties = gus.GraphProperties(A, almost_symmetric=False)
+        self.assertFalse(properties.symmetric)
+
+    def test_laplacian_of_directed_properties(self):
+        A = np.ones((5, 5))
+        properties = gus.GraphProperties(A, almost_symmetric=False)
+        with self.assertRaises(ValueError):
+            gus.to_laplace(A, properties=properties)
+
 
 class TestLCC(unittest.TestCase):
     def test_lcc_networkx(self):